@@ -0,0 +1,136 @@
+"""
+Calibrated Absolute Pointing
+Maps a region of camera space straight onto the whole virtual desktop (every
+monitor), instead of accumulating relative hand deltas:
+
+    calibration  the user points at the four corners of the region they want
+                 to use and pinches at each; the corners and the desktop
+                 rectangle are saved as JSON and reloaded on the next run
+    mapping      the perspective transform (homography) from those corners to
+                 the desktop corners, so a tilted camera or a region seen at
+                 an angle still maps straight
+    lookup       the homography is evaluated once on a GRIDxGRID table over the
+                 calibrated region; each frame is then one bilinear table lookup,
+                 with no projective division and no OS cursor query
+
+    python hand_controller.py --absolute                 # calibrates on first run, saves calibration.json
+    python hand_controller.py --absolute wall.json       # separate calibration per setup
+"""
+
+import json
+
+import cv2
+import numpy as np
+
+DEFAULT_CALIBRATION_PATH = "calibration.json"
+
+CORNERS = ("top-left", "top-right", "bottom-right", "bottom-left")
+
+
+class Calibration:
+    """Four camera-space corners (normalized, CORNERS order) and the desktop rectangle they map to"""
+
+    def __init__(self, camera, desktop):
+        self.camera = np.asarray(camera, dtype=np.float32).reshape(4, 2)
+        self.desktop = tuple(int(v) for v in desktop)  # (left, top, width, height)
+
+    def homography(self):
+        left, top, width, height = self.desktop
+        screen = np.float32([[left, top], [left + width - 1, top],
+                             [left + width - 1, top + height - 1], [left, top + height - 1]])
+        return cv2.getPerspectiveTransform(self.camera, screen)
+
+    def save(self, path):
+        with open(path, "w") as f:
+            json.dump({"camera": self.camera.tolist(), "desktop": list(self.desktop)}, f, indent=2)
+
+    @classmethod
+    def load(cls, path):
+        with open(path) as f:
+            data = json.load(f)
+        return cls(data["camera"], data["desktop"])
+
+
+class AbsoluteMapper:
+    """Precomputed camera -> desktop lookup table with bilinear interpolation"""
+
+    def __init__(self, calibration, grid=128):
+        self.calibration = calibration
+        self.grid = grid
+        left, top, width, height = calibration.desktop
+        self.bounds = (left, top, left + width - 1, top + height - 1)
+        # The table spans the calibrated region's bounding box, so all its resolution is where the hand
+        # points; results are clamped, so anything outside lands on the desktop edge. Kept as flat
+        # lists: scalar indexing is cheaper than on numpy arrays.
+        lo, hi = calibration.camera.min(axis=0), calibration.camera.max(axis=0)
+        self.origin = lo.tolist()
+        self.scale = (grid / np.maximum(hi - lo, 1e-6)).tolist()
+        steps = np.linspace(0.0, 1.0, grid + 1, dtype=np.float32)
+        nodes = lo + np.stack(np.meshgrid(steps, steps), axis=-1).reshape(-1, 1, 2) * (hi - lo)
+        screen = cv2.perspectiveTransform(nodes.astype(np.float32), calibration.homography())
+        screen = screen.reshape(-1, 2)
+        self.table_x, self.table_y = screen[:, 0].tolist(), screen[:, 1].tolist()  # Row-major (grid+1)^2
+
+    def map(self, x, y):
+        """Normalized camera point -> desktop pixel (float x, y)"""
+        grid = self.grid
+        gx = (x - self.origin[0]) * self.scale[0]
+        gy = (y - self.origin[1]) * self.scale[1]
+        gx = 0.0 if gx < 0.0 else grid if gx > grid else gx
+        gy = 0.0 if gy < 0.0 else grid if gy > grid else gy
+        i = int(gx) if gx < grid else grid - 1
+        j = int(gy) if gy < grid else grid - 1
+        fx, fy = gx - i, gy - j
+        k = j * (grid + 1) + i
+        tx, ty = self.table_x, self.table_y
+        a, b, c, d = tx[k], tx[k + 1], tx[k + grid + 1], tx[k + grid + 2]
+        top = a + (b - a) * fx
+        px = top + (c + (d - c) * fx - top) * fy
+        a, b, c, d = ty[k], ty[k + 1], ty[k + grid + 1], ty[k + grid + 2]
+        top = a + (b - a) * fx
+        py = top + (c + (d - c) * fx - top) * fy
+        left, top, right, bottom = self.bounds
+        return (left if px < left else right if px > right else px,
+                top if py < top else bottom if py > bottom else py)
+
+
+class CornerCalibrator:
+    """
+    Collects the four corners from the live hand: point at a corner, pinch.
+    The corner is the average pointer position over the frames just before
+    the pinch started, so the pinch itself doesn't pull it off target.
+    """
+
+    def __init__(self, desktop, settle=5):
+        self.desktop = desktop
+        self.corners = []
+        self.recent = []  # Pointer positions while not pinching
+        self.settle = settle
+        self.pinching = False
+
+    @property
+    def corner(self):
+        return CORNERS[len(self.corners)]
+
+    @property
+    def prompt(self):
+        return f"Calibration: point at the {self.corner} corner of your region and pinch"
+
+    @property
+    def done(self):
+        return len(self.corners) == len(CORNERS)
+
+    def feed(self, x, y, pinching):
+        """One frame of pointer position and pinch state. Returns True when a corner was captured."""
+        captured = False
+        if pinching and not self.pinching and self.recent:
+            self.corners.append(np.mean(self.recent, axis=0))
+            self.recent = []
+            captured = True
+        elif not pinching:
+            self.recent = (self.recent + [(x, y)])[-self.settle:]
+        self.pinching = pinching
+        return captured
+
+    def result(self):
+        return Calibration(self.corners, self.desktop)
@@ -0,0 +1,183 @@
+"""
+Asynchronous Mouse Injection for the Hand Controller
+Wraps any OutputBackend so the vision loop only enqueues events and a worker
+thread performs them. The bounded queue coalesces as it goes:
+    - consecutive cursor moves collapse into the latest target
+    - consecutive scrolls are summed
+    - button events are never dropped or reordered (a full queue makes the
+      caller wait instead)
+On close() the queue is drained and a button still held down is released.
+"""
+
+import threading
+import time
+from collections import deque
+
+from input_backends import OutputBackend
+
+_COALESCING = ("move_to", "scroll")
+
+
+class QueueStats:
+    """Queue depth and coalescing counters (written under the queue lock)"""
+
+    def __init__(self):
+        self.enqueued = 0
+        self.dispatched = 0
+        self.coalesced_moves = 0
+        self.coalesced_scrolls = 0
+        self.full_waits = 0       # Calls that blocked on a full queue: the OS side can't keep up
+        self.max_depth = 0
+        self.wait_total = 0.0     # Enqueue -> dispatch, summed over dispatched events
+        self.wait_worst = 0.0
+
+    def summary(self, depth):
+        mean_ms = self.wait_total / self.dispatched * 1000 if self.dispatched else 0.0
+        return [
+            f"queue depth={depth} max={self.max_depth}  enqueued={self.enqueued} dispatched={self.dispatched}",
+            f"coalesced moves={self.coalesced_moves} scrolls={self.coalesced_scrolls}  full waits={self.full_waits}",
+            f"queue wait mean={mean_ms:.2f}ms max={self.wait_worst * 1000:.2f}ms",
+        ]
+
+
+class AsyncInjector(OutputBackend):
+    """OutputBackend whose actions return immediately; `backend` performs them on a worker thread"""
+
+    def __init__(self, backend, maxsize=64):
+        super().__init__()  # self.stats: time the vision loop spends enqueueing
+        self.backend = backend
+        self.name = f"async {backend.name}"
+        self.maxsize = maxsize
+        self.queue_stats = QueueStats()
+
+        self._cond = threading.Condition()
+        self._queue = deque()  # [op, args, enqueue time]
+        self._closing = False
+        self._busy = False     # Worker is performing an event taken off the queue
+        self._held = False     # mouse_down performed without its mouse_up
+        self._move_delay = 0.0 # Smoothed enqueue -> done time of moves
+
+        self._thread = threading.Thread(target=self._worker, name="Injection", daemon=True)
+        self._thread.start()
+
+    # Queries go straight to the wrapped backend
+    def screen_size(self):
+        return self.backend.screen_size()
+
+    def cursor_position(self):
+        return self.backend.cursor_position()
+
+    def virtual_desktop(self):
+        return self.backend.virtual_desktop()
+
+    def pending_delay(self):
+        return self._move_delay
+
+    @property
+    def depth(self):
+        return len(self._queue)
+
+    # --- Producer side -----------------------------------------------------
+    def _put(self, op, args):
+        stats = self.queue_stats
+        with self._cond:
+            if self._closing:
+                return
+            tail = self._queue[-1] if self._queue else None
+            if tail is not None and tail[0] == op and op in _COALESCING:
+                if op == "move_to":
+                    tail[1] = args
+                    stats.coalesced_moves += 1
+                else:
+                    tail[1] = (tail[1][0] + args[0],)
+                    stats.coalesced_scrolls += 1
+                return
+            if len(self._queue) >= self.maxsize:
+                stats.full_waits += 1
+                self._cond.wait_for(lambda: len(self._queue) < self.maxsize or self._closing)
+                if self._closing:
+                    return
+            self._queue.append([op, args, time.perf_counter()])
+            stats.enqueued += 1
+            stats.max_depth = max(stats.max_depth, len(self._queue))
+            self._cond.notify_all()
+
+    def _do_move_to(self, x, y):
+        self._put("move_to", (x, y))
+
+    def _do_mouse_down(self):
+        self._put("mouse_down", ())
+
+    def _do_mouse_up(self):
+        self._put("mouse_up", ())
+
+    def _do_click(self):
+        self._put("click", ())
+
+    def _do_right_click(self):
+        self._put("right_click", ())
+
+    def _do_scroll(self, amount):
+        self._put("scroll", (amount,))
+
+    def _do_key_down(self, key):
+        self._put("key_down", (key,))
+
+    def _do_key_up(self, key):
+        self._put("key_up", (key,))
+
+    # --- Worker side -------------------------------------------------------
+    def _worker(self):
+        stats = self.queue_stats
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._queue or self._closing)
+                if not self._queue:
+                    return  # Closing and drained
+                op, args, queued_at = self._queue.popleft()
+                self._busy = True
+                self._cond.notify_all()  # Room in the queue
+
+            waited = time.perf_counter() - queued_at
+            try:
+                getattr(self.backend, op)(*args)
+                if op == "mouse_down":
+                    self._held = True
+                elif op == "mouse_up":
+                    self._held = False
+            except Exception as e:
+                print(f"[INJECTION ERROR] {op}: {e}")
+
+            with self._cond:
+                self._busy = False
+                stats.dispatched += 1
+                stats.wait_total += waited
+                stats.wait_worst = max(stats.wait_worst, waited)
+                if op == "move_to":
+                    done = time.perf_counter() - queued_at
+                    self._move_delay = 0.9 * self._move_delay + 0.1 * done if self._move_delay else done
+                self._cond.notify_all()
+
+    def flush(self, timeout=1.0):
+        """Wait until every queued event has been performed. Returns False on timeout."""
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._queue and not self._busy, timeout=timeout)
+
+    def report(self):
+        lines = [f"enqueue: {line}" for line in self.stats.summary()]
+        lines += [f"{self.backend.name}: {line}" for line in self.backend.report()]
+        return lines + self.queue_stats.summary(self.depth)
+
+    def close(self):
+        """Drain the queue, release a held button, stop the worker and close the wrapped backend"""
+        with self._cond:
+            self._closing = True
+            self._cond.notify_all()
+        self._thread.join(timeout=2.0)
+        if self._held:
+            try:
+                self.backend.mouse_up()
+            except Exception:
+                pass
+            self._held = False
+        self.backend.close()
@@ -0,0 +1,205 @@
+"""
+Offline Video -> Gesture Timeline Batch Processor
+Turns recorded usability footage into landmark sessions and gesture timelines,
+much faster than real time:
+
+    1. each video is split into chunks of --chunk seconds
+    2. chunks go to a process pool with one MediaPipe instance per worker,
+       reset before each chunk so no tracking state carries over from the
+       chunk (or video) it processed before; each chunk starts --overlap
+       seconds early so tracking can settle (the warm-up frames are
+       processed but not kept)
+    3. the chunks are merged in order into one session per video (session_replay.py
+       format) and replayed through the controller's gesture logic with a
+       simulated clock and the null backend
+
+Per video, written to --out:
+    NAME.lmk            the landmark session (replay it, tune filters on it, ...)
+    NAME.timeline.csv   frame, time, hand count, GestureState
+    NAME.events.csv     clicks, drags, scrolls that would have been injected
+
+    python batch_timeline.py footage/*.mp4 --workers 8 --out timelines/
+"""
+
+import argparse
+import collections
+import csv
+import multiprocessing
+import os
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from session_replay import SESSION_DTYPE, save_session
+
+Chunk = namedtuple("Chunk", "path index start end warm_start fps")
+
+# Events worth a line in the timeline (cursor moves are implied by the gestures)
+TIMELINE_EVENTS = ("click", "right_click", "mouse_down", "mouse_up", "scroll")
+
+
+def video_info(path):
+    """(frame count, fps) of a video file"""
+    import cv2
+
+    cap = cv2.VideoCapture(path)
+    if not cap.isOpened():
+        raise FileNotFoundError(f"Cannot open video {path}")
+    frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+    fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
+    cap.release()
+    return frames, fps
+
+
+def plan_chunks(path, frames, fps, chunk_seconds=30.0, overlap_seconds=1.0):
+    """Split [0, frames) into chunks; each one starts early by the overlap for tracking warm-up"""
+    size = max(1, int(round(chunk_seconds * fps)))
+    overlap = int(round(overlap_seconds * fps))
+    return [Chunk(path, i, start, min(start + size, frames), max(0, start - overlap), fps)
+            for i, start in enumerate(range(0, frames, size))]
+
+
+# --- Worker process -------------------------------------------------------
+
+_worker = {}
+
+
+def _init_worker(complexity, detection, tracking):
+    """One MediaPipe instance per worker, reset and reused for every chunk it gets"""
+    import mediapipe as mp
+
+    from frame_preprocess import FramePreprocessor
+
+    _worker["hands"] = mp.solutions.hands.Hands(static_image_mode=False, max_num_hands=1,
+                                                model_complexity=complexity,
+                                                min_detection_confidence=detection,
+                                                min_tracking_confidence=tracking)
+    _worker["preprocess"] = FramePreprocessor("image")  # Mirrored, like the live controller
+
+
+def process_chunk(chunk):
+    """Landmark records for frames [start, end) of one video (timestamps are video time)"""
+    import cv2
+
+    from landmark_service import write_record
+
+    hands, preprocess = _worker["hands"], _worker["preprocess"]
+    hands.reset()  # The previous chunk may be from elsewhere in this video or another one
+    records = np.zeros(chunk.end - chunk.start, dtype=SESSION_DTYPE)
+    cap = cv2.VideoCapture(chunk.path)
+    cap.set(cv2.CAP_PROP_POS_FRAMES, chunk.warm_start)
+    t0 = time.perf_counter()
+    kept = 0
+    frame = None
+    for index in range(chunk.warm_start, chunk.end):
+        success, frame = cap.read(frame)
+        if not success:
+            break
+        results = hands.process(preprocess.to_rgb(preprocess.orient(frame)))
+        if index >= chunk.start:
+            write_record(records[kept], index / chunk.fps, results.multi_hand_landmarks, results.multi_handedness)
+            kept += 1
+    cap.release()
+    return chunk, records[:kept], time.perf_counter() - t0
+
+
+# --- Merge + gesture replay -----------------------------------------------
+
+def gesture_timeline(session):
+    """Replay a session through the gesture logic; returns (GestureState per frame, injected events)"""
+    from hand_controller import HandController
+    from input_backends import RecordingBackend
+    from session_replay import ReplayClock, replay_session
+
+    clock = ReplayClock()
+    output = RecordingBackend(clock=clock)
+    controller = HandController(clock=clock, use_camera=False, output=output, headless=True, quiet=True)
+    states = replay_session(controller, session, clock)
+    controller.release_hand()
+    return states, [e for e in output.events if e[1] in TIMELINE_EVENTS]
+
+
+def write_timeline(out_dir, name, session, states, events):
+    base = os.path.join(out_dir, name)
+    save_session(base + ".lmk", session)
+    with open(base + ".timeline.csv", "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["frame", "time", "hands", "gesture"])
+        for i, (rec, state) in enumerate(zip(session, states)):
+            writer.writerow([i, f"{rec['timestamp']:.3f}", int(rec["num_hands"]), state.name if state else "NO_HAND"])
+    with open(base + ".events.csv", "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["time", "event", "value"])
+        for t, op, args in events:
+            writer.writerow([f"{t:.3f}", op, args[0] if args else ""])
+
+
+def summarize(session, states, events):
+    gestures = collections.Counter(s.name if s else "NO_HAND" for s in states)
+    ops = collections.Counter(op for _, op, _ in events)
+    scrolled = sum(args[0] for _, op, args in events if op == "scroll")
+    return (f"{len(session)} frames, hand in {100 * np.mean(session['num_hands'] > 0) if len(session) else 0:.0f}%: "
+            f"{ops['click']} clicks, {ops['right_click']} right clicks, {ops['mouse_down']} drags, "
+            f"{ops['scroll']} scroll events ({scrolled:+d} units); "
+            + ", ".join(f"{name} {count}" for name, count in gestures.most_common()))
+
+
+def run_batch(videos, out_dir, workers=None, chunk_seconds=30.0, overlap_seconds=1.0, quality=None,
+              verbose=True):
+    """Process every video; returns {video path: (session, states, events)}"""
+    from performance_governor import QUALITY_LEVELS
+
+    quality = quality or QUALITY_LEVELS[0]
+    os.makedirs(out_dir, exist_ok=True)
+    chunks = []
+    fps_of = {}
+    for path in videos:
+        frames, fps_of[path] = video_info(path)
+        chunks += plan_chunks(path, frames, fps_of[path], chunk_seconds, overlap_seconds)
+
+    start = time.perf_counter()
+    parts = collections.defaultdict(list)
+    busy = 0.0
+    ctx = multiprocessing.get_context("spawn")  # Fresh MediaPipe per worker, no forked threads
+    with ProcessPoolExecutor(max_workers=workers, mp_context=ctx, initializer=_init_worker,
+                             initargs=(quality.complexity, quality.detection, quality.tracking)) as pool:
+        for chunk, records, seconds in pool.map(process_chunk, chunks):
+            parts[chunk.path].append((chunk.index, records))
+            busy += seconds
+    elapsed = time.perf_counter() - start
+
+    results = {}
+    for path in videos:
+        session = np.concatenate([records for _, records in sorted(parts[path], key=lambda p: p[0])] or
+                                 [np.zeros(0, dtype=SESSION_DTYPE)])
+        states, events = gesture_timeline(session)
+        name = os.path.splitext(os.path.basename(path))[0]
+        write_timeline(out_dir, name, session, states, events)
+        results[path] = (session, states, events)
+        if verbose:
+            print(f"{name}: {summarize(session, states, events)}")
+
+    if verbose:
+        total = sum(len(r[0]) for r in results.values())
+        footage = sum(len(results[path][0]) / fps_of[path] for path in videos)
+        print(f"{total} frames ({footage:.0f} s of footage) in {len(chunks)} chunks: {elapsed:.1f} s wall, "
+              f"{busy:.1f} s worker time ({footage / elapsed if elapsed else 0:.1f}x real time)")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Turn recorded videos into landmark sessions and gesture timelines")
+    parser.add_argument("videos", nargs="+", help="video files")
+    parser.add_argument("--out", default="timelines", help="output directory (default ./timelines)")
+    parser.add_argument("--workers", type=int, help="worker processes (default: one per CPU)")
+    parser.add_argument("--chunk", metavar="S", type=float, default=30.0, help="chunk length in seconds (default 30)")
+    parser.add_argument("--overlap", metavar="S", type=float, default=1.0,
+                        help="tracking warm-up before each chunk, in seconds (default 1)")
+    args = parser.parse_args()
+    run_batch(args.videos, args.out, args.workers, args.chunk, args.overlap)
+
+
+if __name__ == "__main__":
+    main()
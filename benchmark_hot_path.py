@@ -0,0 +1,158 @@
+"""
+Hot-Path Micro-Benchmarks for the Hand Controller
+Times the per-frame controller functions on a synthetic (or recorded)
+landmark stream with the null output backend - no camera, no display.
+
+    python benchmark_hot_path.py                    # compare with benchmark_baseline.json
+    python benchmark_hot_path.py --save-baseline    # record a new baseline
+    python benchmark_hot_path.py --session rec.lmk  # use a recorded session
+
+Exits with status 1 when a stage is slower than the baseline by more than
+--threshold percent.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+
+import cv2
+import numpy as np
+
+from hand_controller import GestureState, HandController
+from input_backends import RecordingBackend
+from landmark_features import classify_gestures, extract_features
+from session_replay import ReplayClock, load_session
+from synthetic_hands import make_hand
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmark_baseline.json")
+
+STAGES = ("get_finger_states", "detect_gesture", "move_cursor_relative",
+          "handle_click_status", "perform_scroll", "draw_sci_fi_hud")
+
+
+def synthetic_stream(frames=300, fps=30.0):
+    """(timestamps, (N, 21, 3) landmarks): a circling open hand with pinches, scrolls and fists mixed in"""
+    script = ["open"] * 12 + ["pinch"] * 4 + ["open"] * 6 + ["two_fingers"] * 5 + ["fist"] * 3
+    hands = []
+    for i in range(frames):
+        angle = 2 * np.pi * i / 90
+        hands.append(make_hand(script[i % len(script)], 0.5 + 0.1 * np.cos(angle), 0.6 + 0.08 * np.sin(angle)))
+    return 100.0 + np.arange(frames) / fps, np.stack(hands)
+
+
+def session_stream(path):
+    """(timestamps, landmarks) for the frames of a recorded session that have a hand"""
+    session = load_session(path)
+    with_hand = session["num_hands"] > 0
+    return np.array(session["timestamp"][with_hand]), np.array(session["landmarks"][with_hand, 0])
+
+
+def _bench_functions(controller, timestamps, hands):
+    """name -> callable(i) exercising that stage on frame i"""
+    features = extract_features(hands)
+    fingers = features.fingers.tolist()
+    states = [GestureState(code) for code in classify_gestures(features, timestamps)]
+    clicking = [s == GestureState.LEFT_CLICK for s in states]
+    frame = np.zeros((720, 1280, 3), dtype=np.uint8)
+
+    return {
+        "get_finger_states": lambda i: controller.get_finger_states(hands[i]),
+        "detect_gesture": lambda i: controller.detect_gesture(fingers[i], hands[i]),
+        "move_cursor_relative": lambda i: controller.move_cursor_relative(hands[i]),
+        "handle_click_status": lambda i: controller.handle_click_status(clicking[i]),
+        "perform_scroll": lambda i: controller.perform_scroll(hands[i]),
+        "draw_sci_fi_hud": lambda i: controller.draw_sci_fi_hud(frame, hands[i], states[i]),
+    }
+
+
+def run_benchmarks(timestamps, hands, rounds=5):
+    """Median per-call time of each stage, in microseconds"""
+    results = {}
+    for name in STAGES:
+        samples = []
+        for _ in range(rounds):
+            # Fresh controller per round so state (drag, scroll, cursor) starts the same
+            clock = ReplayClock()
+            controller = HandController(clock=clock, use_camera=False, output=RecordingBackend(clock=clock),
+                                        quiet=True)
+            func = _bench_functions(controller, timestamps, hands)[name]
+            elapsed = 0
+            for i, t in enumerate(timestamps):
+                clock.now = t
+                start = time.perf_counter_ns()
+                func(i)
+                elapsed += time.perf_counter_ns() - start
+            samples.append(elapsed / len(timestamps) / 1000.0)
+        results[name] = statistics.median(samples)
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Return (lines, regressed stage names)"""
+    lines = [f"{'stage':22}{'baseline us':>13}{'current us':>12}{'change':>9}"]
+    regressed = []
+    for name, current in results.items():
+        base = baseline.get(name)
+        if base is None:
+            lines.append(f"{name:22}{'-':>13}{current:12.2f}{'new':>9}")
+            continue
+        change = (current - base) / base * 100.0
+        flag = ""
+        if change > threshold:
+            regressed.append(name)
+            flag = "  << REGRESSION"
+        lines.append(f"{name:22}{base:13.2f}{current:12.2f}{change:+8.1f}%{flag}")
+    return lines, regressed
+
+
+def environment():
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "opencv": cv2.__version__,
+        "machine": platform.machine(),
+        "system": platform.system(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the controller hot path")
+    parser.add_argument("--session", help="recorded landmark session (default: synthetic stream)")
+    parser.add_argument("--frames", type=int, default=300, help="synthetic stream length")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true", help="write results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=25.0, help="allowed slowdown in percent")
+    args = parser.parse_args()
+
+    timestamps, hands = session_stream(args.session) if args.session else synthetic_stream(args.frames)
+    results = run_benchmarks(timestamps, hands, args.rounds)
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump({"environment": environment(), "frames": len(timestamps), "results_us": results}, f, indent=2)
+        for name, value in results.items():
+            print(f"{name:22}{value:10.2f} us")
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --save-baseline first")
+        return 1
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    lines, regressed = compare(results, baseline["results_us"], args.threshold)
+    print("\n".join(lines))
+    if regressed:
+        print(f"\n[X] {len(regressed)} stage(s) regressed by more than {args.threshold:.0f}%: {', '.join(regressed)}")
+        return 1
+    print(f"\n[OK] No stage regressed by more than {args.threshold:.0f}%")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
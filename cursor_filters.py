@@ -0,0 +1,285 @@
+"""
+Cursor Filters for the Hand Controller
+Pluggable smoothing stage applied to the tracking landmark (normalized image
+coordinates) before it becomes cursor motion. All filters work on timestamps,
+so a varying FPS doesn't change the feel, and can extrapolate their output
+forward by `lead` seconds to hide capture-to-injection latency.
+
+    legacy   - the original speed-dependent EMA + acceleration in HandController
+    one-euro - One Euro filter (Casiez et al.), speed-adaptive low-pass
+    kalman   - constant-velocity Kalman filter
+
+Run `python cursor_filters.py SESSION` to compare their added lag and jitter
+on a recorded session (see session_replay.py).
+"""
+
+import argparse
+import math
+
+import numpy as np
+
+
+class CursorFilter:
+    """Base class: update() takes a raw position and time, returns the filtered position"""
+
+    name = "base"
+    legacy_smoothing = False  # True: HandController applies its original EMA afterwards
+
+    def __init__(self, lead=0.0):
+        self.lead = lead  # Seconds to extrapolate ahead
+        self.reset()
+
+    def reset(self):
+        pass
+
+    def update(self, x, y, t):
+        raise NotImplementedError
+
+
+class LegacyFilter(CursorFilter):
+    """Pass-through; the controller's original smoothing does the work. Optional raw-velocity lead."""
+
+    name = "legacy"
+    legacy_smoothing = True
+
+    def reset(self):
+        self.prev = None
+
+    def update(self, x, y, t):
+        prev, self.prev = self.prev, (x, y, t)
+        if not self.lead or prev is None or t <= prev[2]:
+            return x, y
+        k = self.lead / (t - prev[2])
+        return x + (x - prev[0]) * k, y + (y - prev[1]) * k
+
+
+class _LowPass:
+    """First-order low-pass with a per-call smoothing factor"""
+
+    def __init__(self):
+        self.value = None
+
+    def __call__(self, value, alpha):
+        if self.value is None:
+            self.value = value
+        else:
+            self.value = alpha * value + (1 - alpha) * self.value
+        return self.value
+
+
+class OneEuroFilter(CursorFilter):
+    """One Euro filter: cutoff rises with speed, so it's smooth at rest and quick in motion"""
+
+    name = "one-euro"
+
+    def __init__(self, min_cutoff=1.0, beta=20.0, d_cutoff=1.0, lead=0.0):
+        self.min_cutoff = min_cutoff  # Hz at rest
+        self.beta = beta              # Cutoff increase per (normalized unit / s) of speed
+        self.d_cutoff = d_cutoff      # Hz for the derivative estimate
+        super().__init__(lead)
+
+    def reset(self):
+        self.axes = [(_LowPass(), _LowPass()) for _ in range(2)]  # (value, derivative) per axis
+        self.prev = None  # (x, y, t) raw
+
+    @staticmethod
+    def _alpha(cutoff, dt):
+        tau = 1.0 / (2 * math.pi * cutoff)
+        return 1.0 / (1.0 + tau / dt)
+
+    def update(self, x, y, t):
+        prev, self.prev = self.prev, (x, y, t)
+        dt = t - prev[2] if prev is not None else 0.0
+        out = []
+        for i, value in enumerate((x, y)):
+            value_filter, deriv_filter = self.axes[i]
+            if dt <= 0:
+                out.append(value_filter(value, 1.0) + (deriv_filter.value or 0.0) * self.lead)
+                continue
+            deriv = deriv_filter((value - prev[i]) / dt, self._alpha(self.d_cutoff, dt))
+            cutoff = self.min_cutoff + self.beta * abs(deriv)
+            smoothed = value_filter(value, self._alpha(cutoff, dt))
+            out.append(smoothed + deriv * self.lead)
+        return out[0], out[1]
+
+
+class KalmanFilter(CursorFilter):
+    """Constant-velocity Kalman filter, one independent [position, velocity] state per axis"""
+
+    name = "kalman"
+
+    def __init__(self, process_noise=0.05, measurement_noise=0.004, lead=0.0):
+        self.q = process_noise            # Acceleration noise density (normalized units^2 / s^3)
+        self.r = measurement_noise ** 2   # Landmark jitter variance
+        super().__init__(lead)
+
+    def reset(self):
+        self.state = None  # Per axis: [pos, vel, p00, p01, p11]
+        self.t = None
+
+    def update(self, x, y, t):
+        if self.state is None:
+            self.state = [[x, 0.0, self.r, 0.0, 1.0], [y, 0.0, self.r, 0.0, 1.0]]
+            self.t = t
+            return x, y
+
+        dt = max(t - self.t, 0.0)
+        self.t = t
+        q, r = self.q, self.r
+        out = []
+        for s, z in zip(self.state, (x, y)):
+            pos, vel, p00, p01, p11 = s
+            # Predict
+            pos += vel * dt
+            p00 += dt * (2 * p01 + dt * p11) + q * dt ** 3 / 3
+            p01 += dt * p11 + q * dt ** 2 / 2
+            p11 += q * dt
+            # Update
+            k0 = p00 / (p00 + r)
+            k1 = p01 / (p00 + r)
+            innovation = z - pos
+            pos += k0 * innovation
+            vel += k1 * innovation
+            p11 -= k1 * p01
+            p01 -= k0 * p01
+            p00 -= k0 * p00
+            s[:] = pos, vel, p00, p01, p11
+            out.append(pos + vel * self.lead)
+        return out[0], out[1]
+
+
+FILTERS = {
+    "legacy": LegacyFilter,
+    "one-euro": OneEuroFilter,
+    "kalman": KalmanFilter,
+}
+
+
+def make_filter(name, lead=0.0):
+    """Build a cursor filter by name"""
+    if name not in FILTERS:
+        raise ValueError(f"Unknown cursor filter '{name}' (choose from {', '.join(FILTERS)})")
+    return FILTERS[name](lead=lead)
+
+
+# ---------------------------------------------------------------------------
+# Lag / jitter measurement
+# ---------------------------------------------------------------------------
+
+# Savitzky-Golay smoothing (7 frames, quadratic): follows real curved motion, removes jitter
+_SMOOTH_KERNEL = np.array([-2, 3, 6, 7, 6, 3, -2]) / 21.0
+
+
+def _smooth(values):
+    padded = np.pad(values, 3, mode="edge")
+    return np.convolve(padded, _SMOOTH_KERNEL, mode="valid")
+
+
+def _segments(*series):
+    """Index runs where none of the (N, 2) series has NaN"""
+    bad = np.zeros(len(series[0]), dtype=bool)
+    for values in series:
+        bad |= np.isnan(values).any(axis=1)
+    idx = np.flatnonzero(~bad)
+    if not len(idx):
+        return []
+    return [run for run in np.split(idx, np.flatnonzero(np.diff(idx) > 1) + 1) if len(run) >= 7]
+
+
+def filter_metrics(timestamps, raw, cursor, max_lag_frames=10):
+    """
+    Compare a cursor trajectory with the raw tracking point it came from.
+        timestamps  (N,)   frame times
+        raw         (N, 2) tracking landmark, normalized
+        cursor      (N, 2) cursor position in pixels
+    Rows with NaN split the series into segments (hand lost / not moving).
+    Returns {"lag_ms": ..., "jitter_px": ...}: lag is the time shift that best
+    aligns cursor velocity with hand velocity (both zero-phase smoothed, so
+    landmark noise doesn't dominate; gain-independent), jitter is the RMS
+    distance of the cursor from a local quadratic fit of its own path.
+    """
+    timestamps = np.asarray(timestamps, dtype=np.float64)
+    raw = np.asarray(raw, dtype=np.float64)
+    cursor = np.asarray(cursor, dtype=np.float64)
+
+    raw_vel, cur_vel, jitter = [], [], []
+    for seg in _segments(raw, cursor):
+        r = np.column_stack([_smooth(raw[seg, 0]), _smooth(raw[seg, 1])])
+        c = np.column_stack([_smooth(cursor[seg, 0]), _smooth(cursor[seg, 1])])
+        jitter.append(np.linalg.norm(cursor[seg] - c, axis=1)[3:-3])
+        # NaN row keeps shifted windows from pairing samples across segments
+        raw_vel += [np.diff(r, axis=0), np.full((max_lag_frames, 2), np.nan)]
+        cur_vel += [np.diff(c, axis=0), np.full((max_lag_frames, 2), np.nan)]
+    if not jitter:
+        return {"lag_ms": 0.0, "jitter_px": 0.0}
+
+    # Per-axis normalisation makes the correlation independent of sensitivity/accel
+    def normalise(v):
+        v = np.concatenate(v)
+        return (v - np.nanmean(v, axis=0)) / (np.nanstd(v, axis=0) + 1e-12)
+
+    rv, cv = normalise(raw_vel), normalise(cur_vel)
+    # Positive shift: cursor trails the hand; negative: prediction runs ahead of it
+    shifts = range(-max_lag_frames, max_lag_frames + 1)
+    scores = []
+    for k in shifts:
+        a, b = (rv[:len(rv) - k], cv[k:]) if k >= 0 else (rv[-k:], cv[:len(cv) + k])
+        both = ~(np.isnan(a).any(axis=1) | np.isnan(b).any(axis=1))
+        scores.append(np.mean(a[both] * b[both]) if both.sum() > 2 else -np.inf)
+    scores = np.array(scores)
+    best = int(np.argmax(scores))
+
+    # Parabolic interpolation for sub-frame resolution
+    shift = float(shifts[best])
+    if 0 < best < len(scores) - 1 and np.isfinite(scores[best - 1:best + 2]).all():
+        left, mid, right = scores[best - 1:best + 2]
+        denom = left - 2 * mid + right
+        if denom < 0:
+            shift += 0.5 * (left - right) / denom
+    frame_dt = float(np.median(np.diff(timestamps))) if len(timestamps) > 1 else 0.0
+
+    jitter_px = float(np.sqrt(np.mean(np.concatenate(jitter) ** 2)))
+    return {"lag_ms": float(shift * frame_dt * 1000.0), "jitter_px": jitter_px}
+
+
+def evaluate_filter(session, cursor_filter, screen_size=(1920, 1080)):
+    """Replay a session through a fresh controller using `cursor_filter`; return filter_metrics()"""
+    from hand_controller import GestureState, HandController
+    from input_backends import RecordingBackend
+    from landmark_features import INDEX_MCP
+    from session_replay import ReplayClock, replay_session
+
+    clock = ReplayClock()
+    controller = HandController(clock=clock, use_camera=False,
+                                output=RecordingBackend(screen_size, clock=clock), cursor_filter=cursor_filter)
+    raw, cursor = [], []
+
+    def on_frame(rec, gesture_state):
+        if gesture_state == GestureState.MOVING:
+            raw.append(rec["landmarks"][0][INDEX_MCP, :2])
+            cursor.append((controller.cursor_x, controller.cursor_y))
+        else:
+            raw.append((np.nan, np.nan))
+            cursor.append((np.nan, np.nan))
+
+    replay_session(controller, session, clock, on_frame=on_frame)
+    return filter_metrics(session["timestamp"], np.array(raw), np.array(cursor, dtype=np.float64))
+
+
+def main():
+    from session_replay import load_session
+
+    parser = argparse.ArgumentParser(description="Compare cursor filters on a recorded session")
+    parser.add_argument("session", help="session file written with --record")
+    parser.add_argument("--lead-ms", type=float, default=0.0, help="prediction horizon to apply")
+    args = parser.parse_args()
+
+    session = load_session(args.session)
+    print(f"{'filter':10} {'lag (ms)':>10} {'jitter (px)':>12}")
+    for name in FILTERS:
+        metrics = evaluate_filter(session, make_filter(name, lead=args.lead_ms / 1000.0))
+        print(f"{name:10} {metrics['lag_ms']:10.1f} {metrics['jitter_px']:12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""
+Display-Rate Cursor Upsampling
+The vision loop produces one cursor target per camera frame (~30 fps). With
+upsampling on, a timer thread moves the cursor towards each new target at
+the display rate (e.g. 144 Hz) instead of jumping there in one step:
+
+    speed = max(hand speed over the last frames, distance left / frame interval)
+
+where the frame interval is a running average of the time between targets.
+Moving at the hand's recent speed rather than spreading the distance over a
+whole interval gets the cursor to each target sooner; the second term
+guarantees it arrives before the next one. Every step is capped at the
+latest target and clamped to the desktop, so the cursor never passes the
+point where the hand stopped. halt() stops it at once (fist / pause,
+clicks, hand lost), and no move computed before a halt is sent after it.
+No extra inference is needed.
+"""
+
+import math
+import threading
+import time
+
+
+class CursorUpsampler:
+    """Moves `output`'s cursor towards the latest target at `rate_hz`"""
+
+    def __init__(self, output, rate_hz=144.0, clock=time.perf_counter, frame_interval=1 / 30.0):
+        self.output = output
+        self.rate_hz = rate_hz
+        self.clock = clock
+        self.interval = frame_interval  # Running average of the time between targets
+        left, top, width, height = output.virtual_desktop()
+        self.bounds = (left, top, left + width - 1, top + height - 1)
+
+        self._cond = threading.Condition()
+        self._pos = None        # (x, y) float position last sent to the output
+        self._sent = None       # (x, y) int position last sent
+        self._target = None     # Latest target (None: idle)
+        self._speed = 0.0       # Hand speed over the last frames (px/s)
+        self._rate = 0.0        # Speed towards the current target (px/s)
+        self._last_tick = 0.0
+        self._last_target = None
+        self._last_target_time = None
+        self._running = False
+        self._thread = None
+
+        # STATS
+        self.targets = 0
+        self.moves = 0  # Cursor moves actually sent (> targets when upsampling works)
+
+    # --- Vision loop side --------------------------------------------------
+    def reset(self, x, y):
+        """The cursor is at (x, y) (e.g. after resyncing with the OS pointer); nothing in flight"""
+        with self._cond:
+            self._pos = (float(x), float(y))
+            self._sent = (int(x), int(y))
+            self._target = None
+            self._last_target = None
+            self._last_target_time = None
+
+    def set_target(self, x, y):
+        """New filtered cursor position from the latest frame"""
+        with self._cond:
+            now = self.clock()
+            left, top, right, bottom = self.bounds
+            target = (min(max(float(x), left), right), min(max(float(y), top), bottom))
+            if self._pos is None:
+                self._pos = target
+            gap = now - self._last_target_time if self._last_target_time is not None else None
+            if gap is not None and 0 < gap < 4 * self.interval:  # Pauses (hand lost, gestures) break the run
+                self.interval = 0.8 * self.interval + 0.2 * gap
+                (px, py) = self._last_target
+                self._speed = 0.5 * self._speed + 0.5 * math.hypot(target[0] - px, target[1] - py) / gap
+            else:
+                self._speed = 0.0
+            distance = math.hypot(target[0] - self._pos[0], target[1] - self._pos[1])
+            self._rate = max(self._speed, distance / self.interval)
+            self._target = target
+            self._last_target = target
+            self._last_target_time = now
+            self._last_tick = now
+            self.targets += 1
+            self._cond.notify_all()
+
+    def halt(self):
+        """Stop where the cursor is now; returns that position"""
+        with self._cond:
+            self._target = None
+            self._last_target = None
+            self._last_target_time = None
+            return self._sent
+
+    # --- Timer side --------------------------------------------------------
+    def tick(self, now=None):
+        """Step the cursor towards the target as of `now`. Returns False when idle."""
+        with self._cond:
+            if self._target is None:
+                return False
+            now = self.clock() if now is None else now
+            elapsed, self._last_tick = max(0.0, now - self._last_tick), now
+            (px, py), (tx, ty) = self._pos, self._target
+            distance = math.hypot(tx - px, ty - py)
+            step = self._rate * elapsed
+            if step >= distance:
+                self._pos = self._target  # Capped: never past the latest target
+                self._target = None
+            else:
+                self._pos = (px + (tx - px) * step / distance, py + (ty - py) * step / distance)
+            target = (int(round(self._pos[0])), int(round(self._pos[1])))
+            if target != self._sent:
+                self._sent = target
+                self.moves += 1
+                # Sent under the lock: a halt() waits for it, so no stale move follows a click
+                self.output.move_to(*target)
+            return self._target is not None
+
+    def _run(self):
+        period = 1.0 / self.rate_hz
+        next_tick = self.clock()
+        while self._running:
+            if not self.tick():
+                with self._cond:
+                    self._cond.wait_for(lambda: self._target is not None or not self._running)
+                next_tick = self.clock()
+                continue
+            next_tick += period
+            delay = next_tick - self.clock()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                next_tick = self.clock()  # Fell behind: don't try to catch up with a burst
+
+    def start(self):
+        if self._running:
+            return self
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="CursorUpsampler", daemon=True)
+        self._thread.start()
+        return self
+
+    def close(self):
+        with self._cond:
+            self._running = False
+            self._target = None
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
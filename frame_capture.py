@@ -0,0 +1,106 @@
+"""
+Threaded Frame Capture for the Hand Controller
+Reads the camera on its own thread into a one-slot "latest frame wins" buffer,
+so the vision loop always gets the newest frame and never waits on VideoCapture.read.
+Frames are triple-buffered: the camera decodes into a spare buffer, so once
+warmed up no image is allocated per capture.
+"""
+
+import threading
+import time
+
+
+class LatestFrameGrabber:
+    """Background camera reader that keeps only the newest frame"""
+
+    def __init__(self, cap, clock=time.perf_counter):
+        self.cap = cap
+        self.clock = clock
+
+        # One-slot buffer (guarded by the condition). Triple buffering: the capture
+        # thread decodes into _back, the newest frame waits in _frame, and the frame
+        # last returned by read() (_front) is left alone until the next read().
+        self._cond = threading.Condition()
+        self._frame = None
+        self._back = None
+        self._front = None
+        self._frame_time = 0.0
+        self._seq = 0            # Sequence number of the newest captured frame
+        self._delivered_seq = 0  # Sequence number of the last frame handed out
+
+        self._pending_props = {}  # cv2.CAP_PROP_* -> value, applied by the capture thread
+
+        self._running = False
+        self._failed = False
+        self._thread = None
+
+        # STATS
+        self.frames_captured = 0
+        self.frames_dropped = 0  # Captured but overwritten before anyone read them
+        self.last_frame_time = 0.0  # Capture timestamp of the last frame returned by read()
+
+    def start(self):
+        """Start the capture thread"""
+        if self._running:
+            return self
+        self._running = True
+        self._thread = threading.Thread(target=self._capture_loop, name="FrameCapture", daemon=True)
+        self._thread.start()
+        return self
+
+    def _capture_loop(self):
+        while self._running:
+            if self._pending_props:
+                with self._cond:
+                    props, self._pending_props = self._pending_props, {}
+                for prop, value in props.items():
+                    self.cap.set(prop, value)
+            back = self._back  # Only this thread writes _back
+            success, frame = self.cap.read(back) if back is not None else self.cap.read()
+            stamp = self.clock()
+            with self._cond:
+                if not success:
+                    self._failed = True
+                    self._cond.notify_all()
+                    break
+                if self._seq != self._delivered_seq:
+                    self.frames_dropped += 1
+                self._back, self._frame = self._frame, frame
+                self._frame_time = stamp
+                self._seq += 1
+                self.frames_captured += 1
+                self._cond.notify_all()
+
+    def set_properties(self, props):
+        """Change capture properties (e.g. resolution) between reads, on the capture thread"""
+        with self._cond:
+            self._pending_props.update(props)
+
+    def read(self, timeout=1.0):
+        """
+        Return (success, frame) for the newest frame not yet returned.
+        Returns immediately when a fresh frame is waiting; otherwise waits for
+        the next one (up to timeout). Fails once the camera stops delivering.
+        The frame stays valid (and may be drawn on) until the next read().
+        """
+        with self._cond:
+            fresh = self._cond.wait_for(
+                lambda: self._seq != self._delivered_seq or self._failed or not self._running,
+                timeout=timeout,
+            )
+            if not fresh or self._seq == self._delivered_seq:
+                return False, None
+            self._delivered_seq = self._seq
+            self.last_frame_time = self._frame_time
+            # The previous front buffer goes back into rotation (stale until overwritten)
+            self._front, self._frame = self._frame, self._front
+            return True, self._front
+
+    def stop(self):
+        """Stop the capture thread (the camera itself is released by the owner)"""
+        self._running = False
+        with self._cond:
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
@@ -0,0 +1,245 @@
+"""
+Multi-Process Frame Pipeline
+Optional pipelined mode (hand_controller.py --pipeline): the per-frame stages
+run in separate processes, so they use separate cores and overlap in time:
+
+    capture process    camera -> mirror -> frame ring slot
+    inference process  slot -> BGR->RGB -> MediaPipe -> landmark record
+    main process       gestures / injection, then the HUD drawn on the slot's frame
+
+Frames are never pickled: they live in a shared-memory ring of `slots` frames,
+and only slot numbers, timestamps and the small landmark records (see
+session_replay.py) travel through queues. Back-pressure is bounded by the
+ring: a slot is reused only after the main process has finished with it, so
+when a later stage falls behind, capture waits for a free slot (its grabber
+thread keeps only the newest frame) instead of queueing up stale frames.
+
+The trade: one to two frames more latency between capture and injection, for
+a frame rate set by the slowest stage instead of the sum of all of them.
+"""
+
+import multiprocessing
+import queue
+import time
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from landmark_service import record_results, write_record
+from session_replay import SESSION_DTYPE
+
+STAGES = ("capture", "inference", "gestures+hud")
+
+# Per-stage counters in a shared double array: frames, busy seconds, waiting seconds,
+# and the perf_counter time the stage finished its first frame (same clock in every process)
+_FRAMES, _BUSY, _WAIT, _FIRST = range(4)
+
+
+class StageStats:
+    """Throughput of one stage, readable from any process"""
+
+    def __init__(self, ctx):
+        self.values = ctx.Array("d", 4)
+
+    def add(self, busy, wait):
+        with self.values.get_lock():
+            if not self.values[_FRAMES]:
+                self.values[_FIRST] = time.perf_counter()  # Rates exclude start-up / warm-up
+            else:
+                self.values[_BUSY] += busy
+                self.values[_WAIT] += wait
+            self.values[_FRAMES] += 1
+
+    def line(self, name, now=None):
+        frames, busy, wait, first = self.values[:]
+        elapsed = (now or time.perf_counter()) - first if frames > 1 else 0.0
+        if elapsed <= 0:
+            return f"{name:<13} {int(frames):6d} frames"
+        steady = frames - 1
+        return (f"{name:<13} {int(frames):6d} frames {steady / elapsed:6.1f} fps  "
+                f"{busy / steady * 1000:6.2f} ms busy/frame  waiting {wait / elapsed * 100:5.1f}%")
+
+
+def _capture_stage(shm_name, shape, source, options, mirror, free, ready, stats, stop):
+    """Process 1: newest frame -> (mirrored) into a free ring slot"""
+    import cv2
+
+    from frame_capture import LatestFrameGrabber
+    from frame_sources import open_source
+
+    ready.cancel_join_thread()  # Don't hang on exit with frames nobody will read
+    shm = shared_memory.SharedMemory(name=shm_name)  # Spawned children share the parent's resource tracker
+    frames = np.ndarray(shape, dtype=np.uint8, buffer=shm.buf)
+    height, width = shape[1:3]
+    cap = open_source(source, size=(width, height), **options)
+    grabber = LatestFrameGrabber(cap).start()
+    seq = 0
+    try:
+        while not stop.is_set():
+            t0 = time.perf_counter()
+            try:
+                slot = free.get(timeout=0.1)  # Back-pressure: wait for the main process to free one
+            except queue.Empty:
+                continue
+            success, frame = grabber.read()
+            if not success:
+                free.put(slot)
+                break
+            t1 = time.perf_counter()
+            dst = frames[slot]
+            if frame.shape != dst.shape:
+                frame = cv2.resize(frame, (width, height), interpolation=cv2.INTER_AREA)
+            if mirror:
+                cv2.flip(frame, 1, dst=dst)
+            else:
+                np.copyto(dst, frame)
+            seq += 1
+            ready.put((slot, seq, grabber.last_frame_time))
+            stats.add(time.perf_counter() - t1, t1 - t0)
+    finally:
+        ready.put(None)  # End of stream
+        grabber.stop()
+        cap.release()
+        frames = dst = None
+        shm.close()
+
+
+def _inference_stage(shm_name, shape, quality, ready, results, stats, stop):
+    """Process 2: ring slot -> MediaPipe -> landmark record"""
+    import cv2
+    import mediapipe as mp
+
+    results.cancel_join_thread()
+    shm = shared_memory.SharedMemory(name=shm_name)
+    frames = np.ndarray(shape, dtype=np.uint8, buffer=shm.buf)
+    rgb = np.empty(shape[1:], dtype=np.uint8)
+    hands = mp.solutions.hands.Hands(static_image_mode=False, max_num_hands=quality.hands,
+                                     model_complexity=quality.complexity,
+                                     min_detection_confidence=quality.detection,
+                                     min_tracking_confidence=quality.tracking)
+    hands.process(rgb)  # Warm-up
+    record = np.zeros((), dtype=SESSION_DTYPE)
+    try:
+        while not stop.is_set():
+            t0 = time.perf_counter()
+            try:
+                item = ready.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            if item is None:
+                break
+            slot, seq, stamp = item
+            t1 = time.perf_counter()
+            cv2.cvtColor(frames[slot], cv2.COLOR_BGR2RGB, dst=rgb)
+            out = hands.process(rgb)
+            write_record(record, stamp, out.multi_hand_landmarks, out.multi_handedness)
+            results.put((slot, seq, record.tobytes()))
+            stats.add(time.perf_counter() - t1, t1 - t0)
+    finally:
+        results.put(None)
+        hands.close()
+        frames = None
+        shm.close()
+
+
+class FramePipeline:
+    """
+    Stands in for both the frame grabber and the Hands model in the main loop:
+    read() returns the next inferred frame (valid, and drawable, until the next
+    read()), and process() returns that frame's landmarks.
+    """
+
+    def __init__(self, source=0, size=(1280, 720), slots=4, mirror=True, quality=None, rate=None, fourcc=None):
+        from performance_governor import QUALITY_LEVELS
+
+        self.source = source  # open_source() spec (see frame_sources.py), opened in the capture process
+        self.source_options = {"rate": rate, "fourcc": fourcc}
+        self.mirror = mirror
+        self.quality = quality or QUALITY_LEVELS[0]
+        width, height = size
+        self.shape = (slots, height, width, 3)
+        self.ctx = multiprocessing.get_context("spawn")  # MediaPipe and our threads don't survive fork
+        self.shm = shared_memory.SharedMemory(create=True, size=int(np.prod(self.shape)))
+        self.frames = np.ndarray(self.shape, dtype=np.uint8, buffer=self.shm.buf)
+
+        self.free = self.ctx.Queue()
+        self.ready = self.ctx.Queue()
+        self.done = self.ctx.Queue()
+        for slot in range(slots):
+            self.free.put(slot)
+        self.stop_event = self.ctx.Event()
+        self.stats = {name: StageStats(self.ctx) for name in STAGES}
+        self.processes = []
+
+        self._held = None     # Slot the main process is using
+        self._seq = 0
+        self._busy_since = None
+        self.results = record_results(np.zeros((), dtype=SESSION_DTYPE))
+        self._stopped_at = None
+
+        # STATS (same names as LatestFrameGrabber)
+        self.frames_captured = 0
+        self.frames_dropped = 0  # Sequence gaps (never expected: stages don't drop)
+        self.last_frame_time = 0.0
+
+    def start(self):
+        if self.processes:
+            return self
+        self.processes = [
+            self.ctx.Process(target=_capture_stage, name="PipelineCapture", daemon=True,
+                             args=(self.shm.name, self.shape, self.source, self.source_options, self.mirror,
+                                   self.free, self.ready, self.stats["capture"], self.stop_event)),
+            self.ctx.Process(target=_inference_stage, name="PipelineInference", daemon=True,
+                             args=(self.shm.name, self.shape, self.quality, self.ready, self.done,
+                                   self.stats["inference"], self.stop_event)),
+        ]
+        for p in self.processes:
+            p.start()
+        return self
+
+    def read(self, timeout=5.0):
+        """Return (success, frame) for the next inferred frame; frees the previous one"""
+        now = time.perf_counter()
+        busy = now - self._busy_since if self._busy_since is not None else 0.0
+        if self._held is not None:
+            self.free.put(self._held)
+            self._held = None
+        try:
+            item = self.done.get(timeout=timeout)
+        except queue.Empty:
+            return False, None
+        if item is None:
+            return False, None
+        slot, seq, data = item
+        self._busy_since = time.perf_counter()
+        if busy:
+            self.stats["gestures+hud"].add(busy, self._busy_since - now)
+        self.frames_dropped += seq - self._seq - 1
+        self._seq = seq
+        self.frames_captured += 1
+        record = np.frombuffer(data, dtype=SESSION_DTYPE)[0]
+        self.last_frame_time = float(record["timestamp"])
+        record_results(record, results=self.results)
+        self._held = slot
+        return True, self.frames[slot]
+
+    def process(self, image):
+        return self.results
+
+    def summary(self):
+        now = self._stopped_at or time.perf_counter()
+        return [self.stats[name].line(name, now) for name in STAGES]
+
+    def stop(self):
+        self._stopped_at = self._stopped_at or time.perf_counter()
+        self.stop_event.set()
+        for p in self.processes:
+            p.join(timeout=5.0)
+            if p.is_alive():
+                p.terminate()
+
+    def close(self):
+        self.stop()
+        self.frames = None
+        self.shm.close()
+        self.shm.unlink()
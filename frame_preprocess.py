@@ -0,0 +1,80 @@
+"""
+Allocation-Free Frame Preprocessing for the Hand Controller
+Every per-frame image operation writes into a preallocated destination buffer
+(reallocated only when the frame size changes), so the steady-state loop
+doesn't churn several MB through the allocator each frame.
+
+Two optional shortcuts skip work entirely:
+    mirror="landmarks" - don't flip the image; mirror landmark x after inference
+                         (the preview, if any, is flipped for display only)
+    rgb_input=True     - frames already arrive in RGB order; skip BGR->RGB
+    mirror="none"      - frames and landmarks are already mirrored upstream
+                         (e.g. read from landmark_service.py)
+"""
+
+import cv2
+import numpy as np
+
+MIRROR_MODES = ("image", "landmarks", "none")
+
+
+class FrameBuffers:
+    """Named uint8 destination buffers, reused while the shape stays the same"""
+
+    def __init__(self):
+        self._buffers = {}
+        self.allocations = 0
+
+    def get(self, name, shape):
+        buf = self._buffers.get(name)
+        if buf is None or buf.shape != shape:
+            buf = self._buffers[name] = np.empty(shape, dtype=np.uint8)
+            self.allocations += 1
+        return buf
+
+
+class FramePreprocessor:
+    """Turns captured frames into the model input and the preview frame"""
+
+    def __init__(self, mirror="image", rgb_input=False):
+        if mirror not in MIRROR_MODES:
+            raise ValueError(f"Unknown mirror mode '{mirror}' (choose from {', '.join(MIRROR_MODES)})")
+        self.mirror = mirror
+        self.rgb_input = rgb_input
+        self.buffers = FrameBuffers()
+
+    def orient(self, frame):
+        """Captured frame -> frame in the orientation inference runs on (same colour order)"""
+        if self.mirror != "image":
+            return frame
+        return cv2.flip(frame, 1, dst=self.buffers.get("flipped", frame.shape))
+
+    def to_rgb(self, frame):
+        """Oriented frame -> contiguous RGB model input"""
+        if self.rgb_input:
+            return frame
+        return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self.buffers.get("rgb", frame.shape))
+
+    def mirror_results(self, results):
+        """With landmark mirroring, flip MediaPipe results in place as if the image had been flipped"""
+        if self.mirror != "landmarks" or not results.multi_hand_landmarks:
+            return
+        for marks in results.multi_hand_landmarks:
+            for lm in marks.landmark:
+                lm.x = 1.0 - lm.x
+        # Handedness is reported for the image MediaPipe saw: swap it to match
+        for handedness in results.multi_handedness or ():
+            for c in handedness.classification:
+                c.label = {"Left": "Right", "Right": "Left"}.get(c.label, c.label)
+
+    def display(self, frame):
+        """Oriented frame -> mirrored BGR preview to draw the HUD on"""
+        if self.mirror != "landmarks" and not self.rgb_input:
+            return frame  # Already the flipped buffer (or mirrored upstream)
+        out = self.buffers.get("display", frame.shape)
+        if self.mirror == "landmarks":
+            cv2.flip(frame, 1, dst=out)
+            frame = out
+        if self.rgb_input:
+            cv2.cvtColor(frame, cv2.COLOR_RGB2BGR, dst=out)
+        return out
@@ -0,0 +1,343 @@
+"""
+Pluggable Frame Sources
+Everything that consumes frames (hand_controller.py, demo_practice.py,
+landmark_service.py, frame_pipeline.py) opens them through open_source()
+instead of calling cv2.VideoCapture(0) directly:
+
+    CameraSource          live camera with explicit FOURCC / FPS / buffer-size negotiation
+    VideoFileSource       recorded video
+    ImageDirectorySource  sorted image files in a directory
+    SyntheticSource       generated frames, no camera needed
+
+Sources follow the cv2.VideoCapture interface the loop already uses
+(read(image), grab(), set(), isOpened(), release()), so LatestFrameGrabber
+works with any of them. Non-camera sources can be paced at a chosen rate,
+or deliver frames as fast as they can (rate=None) to load-test the full
+pipeline, MediaPipe included, on a headless server.
+
+    python frame_sources.py --source 0 --fourcc MJPG   # measure a camera mode
+"""
+
+import argparse
+import os
+import time
+
+import cv2
+import numpy as np
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp", ".tif", ".tiff", ".webp")
+
+
+class FrameSource:
+    """Base class: pacing and the cv2.VideoCapture-style interface"""
+
+    name = "source"
+
+    def __init__(self, rate=None, clock=time.perf_counter):
+        self.rate = rate  # Frames per second, or None for as fast as possible
+        self.clock = clock
+        self._next_due = None
+        self.frames_read = 0
+
+    def _pace(self):
+        if not self.rate:
+            return
+        now = self.clock()
+        if self._next_due is None:
+            self._next_due = now
+        delay = self._next_due - now
+        if delay > 0:
+            time.sleep(delay)
+            self._next_due += 1.0 / self.rate
+        else:
+            self._next_due = now + 1.0 / self.rate  # Behind: don't burst to catch up
+
+    def read(self, image=None):
+        """Return (success, frame); writes into `image` when it has the right shape"""
+        self._pace()
+        success, frame = self._read(image)
+        if success:
+            self.frames_read += 1
+        return success, frame
+
+    def _read(self, image):
+        raise NotImplementedError
+
+    def grab(self):
+        return self.read()[0]
+
+    def set(self, prop, value):
+        return False
+
+    def get(self, prop):
+        return 0.0
+
+    def isOpened(self):
+        return True
+
+    def release(self):
+        pass
+
+    def describe(self):
+        return self.name
+
+
+def _into(image, frame):
+    """Copy into the caller's buffer when it fits (keeps LatestFrameGrabber allocation-free)"""
+    if image is not None and image.shape == frame.shape:
+        np.copyto(image, frame)
+        return image
+    return frame
+
+
+class CameraSource(FrameSource):
+    """Live camera. The camera paces itself; `rate` is requested from the driver as its FPS."""
+
+    name = "camera"
+
+    def __init__(self, index=0, size=(1280, 720), rate=None, fourcc=None, buffer_size=1):
+        super().__init__(rate=None)
+        self.index = index
+        self.cap = cv2.VideoCapture(index)
+        if fourcc:
+            # Set before the size: many UVC cameras only offer high resolutions at 30 fps as MJPG
+            self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*fourcc))
+        if size:
+            self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, size[0])
+            self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, size[1])
+        if rate:
+            self.cap.set(cv2.CAP_PROP_FPS, rate)
+        if buffer_size:
+            self.cap.set(cv2.CAP_PROP_BUFFERSIZE, buffer_size)  # Don't let stale frames queue in the driver
+        self.requested = {"fourcc": fourcc, "size": size, "fps": rate, "buffer": buffer_size}
+
+    def negotiated(self):
+        """What the driver actually agreed to (it may silently pick something else)"""
+        code = int(self.cap.get(cv2.CAP_PROP_FOURCC))
+        fourcc = "".join(chr((code >> 8 * i) & 0xFF) for i in range(4)) if code else "?"
+        return {
+            "fourcc": fourcc.strip("\x00") or "?",
+            "size": (int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH)), int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))),
+            "fps": self.cap.get(cv2.CAP_PROP_FPS),
+            "buffer": int(self.cap.get(cv2.CAP_PROP_BUFFERSIZE)),
+        }
+
+    def _read(self, image):
+        return self.cap.read(image) if image is not None else self.cap.read()
+
+    def grab(self):
+        return self.cap.grab()
+
+    def set(self, prop, value):
+        return self.cap.set(prop, value)
+
+    def get(self, prop):
+        return self.cap.get(prop)
+
+    def isOpened(self):
+        return self.cap.isOpened()
+
+    def release(self):
+        self.cap.release()
+
+    def describe(self):
+        n = self.negotiated()
+        return f"camera {self.index}: {n['fourcc']} {n['size'][0]}x{n['size'][1]} @ {n['fps']:.0f} fps"
+
+
+class VideoFileSource(FrameSource):
+    """Recorded video; rate=None decodes as fast as possible"""
+
+    name = "video"
+
+    def __init__(self, path, rate=None, loop=False):
+        super().__init__(rate)
+        self.path = path
+        self.loop = loop
+        self.cap = cv2.VideoCapture(path)
+
+    def _read(self, image):
+        success, frame = self.cap.read(image) if image is not None else self.cap.read()
+        if not success and self.loop and self.frames_read:
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            success, frame = self.cap.read(image) if image is not None else self.cap.read()
+        return success, frame
+
+    def get(self, prop):
+        return self.cap.get(prop)
+
+    def isOpened(self):
+        return self.cap.isOpened()
+
+    def release(self):
+        self.cap.release()
+
+    def describe(self):
+        return f"video {self.path} ({self.cap.get(cv2.CAP_PROP_FPS):.0f} fps recorded)"
+
+
+class ImageDirectorySource(FrameSource):
+    """Image files in name order"""
+
+    name = "images"
+
+    def __init__(self, path, rate=None, loop=False):
+        super().__init__(rate)
+        self.path = path
+        self.loop = loop
+        self.files = sorted(os.path.join(path, f) for f in os.listdir(path)
+                            if f.lower().endswith(IMAGE_EXTENSIONS))
+        self.index = 0
+
+    def _read(self, image):
+        if self.index >= len(self.files):
+            if not self.loop or not self.files:
+                return False, None
+            self.index = 0
+        frame = cv2.imread(self.files[self.index])
+        self.index += 1
+        if frame is None:
+            return False, None
+        return True, _into(image, frame)
+
+    def isOpened(self):
+        return bool(self.files)
+
+    def describe(self):
+        return f"images {self.path} ({len(self.files)} files)"
+
+
+class SyntheticSource(FrameSource):
+    """
+    Generated frames: a textured background and a hand skeleton (see
+    synthetic_hands.py) moving in a circle. MediaPipe runs its full palm
+    detection on every frame, which makes this the worst-case inference load.
+    """
+
+    name = "synthetic"
+
+    def __init__(self, size=(1280, 720), rate=None, frames=None):
+        super().__init__(rate)
+        from synthetic_hands import make_hand
+
+        self.size = tuple(size)
+        self.limit = frames  # Stop after this many frames (None: forever)
+        self._hand = make_hand("open")
+        self._background = None
+        self._make_background()
+
+    def _make_background(self):
+        w, h = self.size
+        y, x = np.mgrid[0:h, 0:w]
+        rng = np.random.default_rng(0)
+        noise = rng.integers(0, 24, (h, w), dtype=np.uint8)
+        gray = ((x * 96 // max(w, 1)) + (y * 64 // max(h, 1)) + noise).astype(np.uint8)
+        self._background = cv2.merge([gray, gray + 20, gray + 40])
+
+    def _read(self, image):
+        if self.limit is not None and self.frames_read >= self.limit:
+            return False, None
+        w, h = self.size
+        frame = image if image is not None and image.shape == (h, w, 3) else np.empty((h, w, 3), np.uint8)
+        np.copyto(frame, self._background)
+        t = self.frames_read / 30.0
+        offset = np.array([0.15 * np.cos(t), 0.1 * np.sin(t), 0.0], dtype=np.float32)
+        points = ((self._hand + offset)[:, :2] * (w, h)).astype(np.int32)
+        for a, b in ((0, 1), (1, 2), (2, 3), (3, 4), (0, 5), (5, 6), (6, 7), (7, 8), (5, 9), (9, 10),
+                     (10, 11), (11, 12), (9, 13), (13, 14), (14, 15), (15, 16), (13, 17), (0, 17),
+                     (17, 18), (18, 19), (19, 20)):
+            cv2.line(frame, tuple(points[a]), tuple(points[b]), (140, 170, 220), max(4, w // 80))
+        return True, frame
+
+    def set(self, prop, value):
+        if prop == cv2.CAP_PROP_FRAME_WIDTH:
+            self.size = (int(value), self.size[1])
+        elif prop == cv2.CAP_PROP_FRAME_HEIGHT:
+            self.size = (self.size[0], int(value))
+        else:
+            return False
+        self._make_background()
+        return True
+
+    def get(self, prop):
+        return {cv2.CAP_PROP_FRAME_WIDTH: self.size[0], cv2.CAP_PROP_FRAME_HEIGHT: self.size[1],
+                cv2.CAP_PROP_FPS: self.rate or 0.0}.get(prop, 0.0)
+
+    def describe(self):
+        return f"synthetic {self.size[0]}x{self.size[1]}" + (f" @ {self.rate:g} fps" if self.rate else "")
+
+
+def open_source(spec=0, size=(1280, 720), rate=None, fourcc=None, loop=False):
+    """
+    spec: a FrameSource (returned as is), a camera index (int or digit string),
+    'synthetic' / 'synthetic:WxH', a directory of images, or a video file path.
+    """
+    if isinstance(spec, FrameSource):
+        return spec
+    if isinstance(spec, int) or (isinstance(spec, str) and spec.isdigit()):
+        return CameraSource(int(spec), size=size, rate=rate, fourcc=fourcc)
+    if spec == "synthetic" or spec.startswith("synthetic:"):
+        if ":" in spec:
+            size = tuple(int(v) for v in spec.split(":", 1)[1].split("x"))
+        return SyntheticSource(size, rate=rate)
+    if os.path.isdir(spec):
+        return ImageDirectorySource(spec, rate=rate, loop=loop)
+    if not os.path.exists(spec):
+        raise FileNotFoundError(f"No such frame source: {spec}")
+    return VideoFileSource(spec, rate=rate, loop=loop)
+
+
+def add_source_arguments(parser, default="0"):
+    """--source / --source-rate / --fourcc, shared by every entry point"""
+    parser.add_argument("--source", default=default,
+                        help="camera index, video file, image directory or 'synthetic[:WxH]' (default camera 0)")
+    parser.add_argument("--source-rate", metavar="FPS", type=float,
+                        help="camera: FPS to request; other sources: pace frames at FPS (default: as fast as possible)")
+    parser.add_argument("--fourcc", metavar="CODE", help="camera pixel format to request, e.g. MJPG or YUYV")
+
+
+def measure_capture(source, frames=120, clock=time.perf_counter):
+    """Blocking time per read() and the interval between frames, in seconds"""
+    reads, intervals = [], []
+    last = None
+    for _ in range(frames):
+        t0 = clock()
+        success, _ = source.read()
+        t1 = clock()
+        if not success:
+            break
+        reads.append(t1 - t0)
+        if last is not None:
+            intervals.append(t1 - last)
+        last = t1
+    return np.array(reads), np.array(intervals)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure a frame source (e.g. compare camera modes)")
+    add_source_arguments(parser)
+    parser.add_argument("--size", metavar="WxH", default="1280x720", help="resolution to request")
+    parser.add_argument("--frames", type=int, default=120, help="frames to measure")
+    args = parser.parse_args()
+
+    size = tuple(int(v) for v in args.size.split("x"))
+    source = open_source(args.source, size=size, rate=args.source_rate, fourcc=args.fourcc)
+    if not source.isOpened():
+        raise SystemExit(f"Cannot open {args.source}")
+    source.grab()  # The first frame includes device start-up
+    reads, intervals = measure_capture(source, args.frames)
+    source_name = source.describe()
+    source.release()
+    if not len(reads):
+        raise SystemExit("No frames")
+
+    print(source_name)
+    print(f"  frames       {len(reads)}")
+    print(f"  read()       p50 {np.percentile(reads, 50) * 1000:6.2f} ms   p95 {np.percentile(reads, 95) * 1000:6.2f} ms")
+    if len(intervals):
+        print(f"  interval     p50 {np.percentile(intervals, 50) * 1000:6.2f} ms   "
+              f"p95 {np.percentile(intervals, 95) * 1000:6.2f} ms   ({1 / intervals.mean():.1f} fps)")
+
+
+if __name__ == "__main__":
+    main()
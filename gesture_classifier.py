@@ -0,0 +1,193 @@
+"""
+Data-Driven Gesture Classifier
+Replaces the hard-coded finger rules of HandController.detect_gesture with a
+nearest-neighbour lookup in recorded, labelled hand poses:
+
+    features  landmarks relative to the wrist, divided by the palm size
+              (wrist -> middle MCP), so distance to the camera doesn't matter
+    index     features projected onto their top principal components and
+              stored with their labels as a small .npz file; in that few
+              dimensions a brute-force scan of a few thousand samples is a
+              handful of microseconds, faster than walking a KD-tree from Python
+    output    (GestureState code, confidence), where confidence is the
+              distance-weighted share of the k nearest samples that agree
+
+A new pose for an existing action is added by recording it and rebuilding
+the index; no code changes.
+
+    python gesture_classifier.py build gestures.npz --pose RIGHT_CLICK=rock.lmk --pose MOVING=open.lmk ...
+    python gesture_classifier.py build gestures.npz --synthetic 400       # from synthetic_hands.py
+    python gesture_classifier.py bench gestures.npz --pose LEFT_CLICK=pinch.lmk ...
+    python hand_controller.py --gesture-model gestures.npz
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from landmark_features import (GESTURE_NAMES, IDLE, LEFT_CLICK, MIDDLE_MCP, MOVING, RIGHT_CLICK, SCROLLING,
+                               WRIST, classify_gestures, extract_features)
+
+# synthetic_hands.POSES -> the gesture each one stands for
+SYNTHETIC_LABELS = {"open": MOVING, "fist": IDLE, "pinch": LEFT_CLICK, "two_fingers": SCROLLING,
+                    "pinky": RIGHT_CLICK}
+
+
+def normalize_hands(points):
+    """(..., 21, 3) landmarks -> (..., 60) wrist-relative, palm-size-scaled feature vectors"""
+    points = np.asarray(points, dtype=np.float32)
+    rel = points[..., 1:, :] - points[..., WRIST:WRIST + 1, :]
+    palm = np.linalg.norm(points[..., MIDDLE_MCP, :2] - points[..., WRIST, :2], axis=-1)
+    rel = rel / np.maximum(palm, 1e-6)[..., None, None]
+    return rel.reshape(*rel.shape[:-2], 60)
+
+
+class GestureIndex:
+    """k-nearest-neighbour gesture lookup over PCA-reduced pose features"""
+
+    def __init__(self, mean, components, samples, labels, k=7, min_confidence=0.6):
+        self.mean = np.asarray(mean, dtype=np.float32)
+        self.components = np.asarray(components, dtype=np.float32)  # (dims, 60)
+        self.samples = np.asarray(samples, dtype=np.float32)        # (N, dims)
+        self.labels = np.asarray(labels, dtype=np.int64)             # (N,) GestureState codes
+        self.k = min(k, len(self.labels))
+        self.min_confidence = min_confidence  # Below this the controller falls back to the rules
+        # classify() precomputes: projection of the mean, and |sample|^2 for the distance expansion
+        self._mean_proj = self.mean @ self.components.T
+        self._sample_norms = np.einsum("ij,ij->i", self.samples, self.samples)
+
+    @classmethod
+    def build(cls, hands, labels, dims=12, **kwargs):
+        """hands: (N, 21, 3) labelled poses; labels: (N,) GestureState codes"""
+        features = normalize_hands(hands)
+        mean = features.mean(axis=0)
+        _, _, vt = np.linalg.svd(features - mean, full_matrices=False)
+        components = vt[:dims]
+        return cls(mean, components, (features - mean) @ components.T, labels, **kwargs)
+
+    def save(self, path):
+        np.savez_compressed(path, mean=self.mean, components=self.components,
+                            samples=self.samples.astype(np.float16), labels=self.labels.astype(np.uint8),
+                            k=self.k, min_confidence=self.min_confidence)
+
+    @classmethod
+    def load(cls, path):
+        data = np.load(path)
+        return cls(data["mean"], data["components"], data["samples"], data["labels"],
+                   k=int(data["k"]), min_confidence=float(data["min_confidence"]))
+
+    def classify(self, points):
+        """One (21, 3) hand -> (GestureState code, confidence 0..1)"""
+        rel = points[1:] - points[WRIST]
+        palm = max(float(np.hypot(*rel[MIDDLE_MCP - 1, :2])), 1e-6)
+        query = self.components @ rel.ravel() / palm - self._mean_proj
+        dist = self._sample_norms - 2.0 * (self.samples @ query)  # |s - q|^2 minus the constant |q|^2
+        dist += query @ query
+        np.maximum(dist, 0.0, out=dist)
+        nearest = np.argpartition(dist, self.k - 1)[:self.k]
+        weights = 1.0 / (np.sqrt(dist[nearest]) + 1e-3)
+        votes = np.bincount(self.labels[nearest], weights, minlength=len(GESTURE_NAMES))
+        best = int(votes.argmax())
+        return best, float(votes[best] / votes.sum())
+
+    def classify_batch(self, hands):
+        """(N, 21, 3) -> (N,) codes and (N,) confidences (for benchmarks and offline use)"""
+        codes = np.empty(len(hands), dtype=np.int64)
+        confidence = np.empty(len(hands))
+        for i, points in enumerate(hands):
+            codes[i], confidence[i] = self.classify(points)
+        return codes, confidence
+
+
+def synthetic_samples(per_pose=200, seed=0, rotation=20.0):
+    """Jittered synthetic poses (position, size, in-plane rotation, landmark noise) with their labels"""
+    from synthetic_hands import make_hand
+
+    rng = np.random.default_rng(seed)
+    hands, labels = [], []
+    for pose, label in SYNTHETIC_LABELS.items():
+        for _ in range(per_pose):
+            scale = rng.uniform(0.12, 0.35)
+            hand = make_hand(pose, x=rng.uniform(0.3, 0.7), y=rng.uniform(0.5, 0.8), scale=scale)
+            angle = np.radians(rng.uniform(-rotation, rotation))
+            rot = np.array([[np.cos(angle), -np.sin(angle)], [np.sin(angle), np.cos(angle)]], dtype=np.float32)
+            hand[:, :2] = (hand[:, :2] - hand[0, :2]) @ rot.T + hand[0, :2]
+            hand[:, :2] += rng.normal(0, 0.03 * scale, (21, 2))
+            hands.append(hand)
+            labels.append(label)
+    return np.stack(hands), np.array(labels)
+
+
+def session_samples(specs):
+    """['LABEL=session.lmk', ...] -> (hands, labels): every frame with a hand gets the file's label"""
+    from session_replay import load_session
+
+    hands, labels = [], []
+    for spec in specs:
+        name, path = spec.split("=", 1)
+        code = GESTURE_NAMES.index(name.upper())
+        session = load_session(path)
+        with_hand = session[session["num_hands"] > 0]
+        hands.append(np.array(with_hand["landmarks"][:, 0]))
+        labels.append(np.full(len(with_hand), code))
+    return np.concatenate(hands), np.concatenate(labels)
+
+
+def benchmark(index, hands, labels, repeat=3):
+    """Accuracy and per-frame latency of the classifier and of the current rules on labelled hands"""
+    rules = classify_gestures(extract_features(hands))
+    codes, _ = index.classify_batch(hands)
+
+    def per_frame(fn):
+        best = float("inf")
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            for points in hands:
+                fn(points)
+            best = min(best, (time.perf_counter() - t0) / len(hands))
+        return best
+
+    def rule(points):
+        return classify_gestures(extract_features(points))
+
+    return {
+        "rules": (float(np.mean(rules == labels)), per_frame(rule)),
+        "classifier": (float(np.mean(codes == labels)), per_frame(index.classify)),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build or benchmark the nearest-neighbour gesture classifier")
+    parser.add_argument("command", choices=["build", "bench"])
+    parser.add_argument("index", help="index file (.npz)")
+    parser.add_argument("--pose", action="append", default=[], metavar="LABEL=SESSION",
+                        help="session recorded while holding one gesture (" + ", ".join(GESTURE_NAMES) + ")")
+    parser.add_argument("--synthetic", metavar="N", type=int, default=0,
+                        help="add N jittered synthetic samples per gesture")
+    parser.add_argument("--dims", type=int, default=12, help="principal components kept (default 12)")
+    parser.add_argument("-k", type=int, default=7, help="neighbours that vote (default 7)")
+    args = parser.parse_args()
+
+    parts = []
+    if args.pose:
+        parts.append(session_samples(args.pose))
+    if args.synthetic or not parts:
+        parts.append(synthetic_samples(args.synthetic or 200, seed=0 if args.command == "build" else 1))
+    hands = np.concatenate([p[0] for p in parts])
+    labels = np.concatenate([p[1] for p in parts])
+
+    if args.command == "build":
+        index = GestureIndex.build(hands, labels, dims=args.dims, k=args.k)
+        index.save(args.index)
+        counts = ", ".join(f"{name} {np.sum(labels == code)}" for code, name in enumerate(GESTURE_NAMES))
+        print(f"Wrote {args.index}: {len(labels)} samples ({counts}), {args.dims} dims")
+    else:
+        results = benchmark(GestureIndex.load(args.index), hands, labels)
+        print(f"{len(labels)} labelled frames")
+        for name, (accuracy, seconds) in results.items():
+            print(f"  {name:<11} accuracy {accuracy * 100:5.1f}%   {seconds * 1e6:7.1f} us/frame")
+
+
+if __name__ == "__main__":
+    main()
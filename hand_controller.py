@@ -7,18 +7,44 @@ Features:
 - Futuristic "Iron Man" Visuals
 """
 
+import time
+_PROCESS_START = time.perf_counter() # Origin of the startup profile (see startup_profile.py)
+
 import cv2
-import mediapipe as mp
-import pyautogui
 import numpy as np
 from enum import Enum
-import time
-import math
+from types import SimpleNamespace
 import sys
+import threading
+import argparse
+import os
+
+from frame_capture import LatestFrameGrabber
+from input_backends import make_backend, BACKENDS
+from cursor_filters import LegacyFilter, make_filter, FILTERS
+from latency_profiler import LatencyProfiler
+from hud_renderer import HudRenderer, NEON_GREEN, RED
+from landmark_features import landmarks_to_array, finger_states, pinch_distance, INDEX_MCP
+from frame_preprocess import FramePreprocessor, MIRROR_MODES
+from startup_profile import StartupProfile, parallel_init
+from async_injection import AsyncInjector
+from cursor_upsampler import CursorUpsampler
+from scroll_engine import ScrollEngine, FRICTION_CURVES
+from inference_scheduler import InferenceScheduler
+from performance_governor import PerformanceGovernor, QUALITY_LEVELS, TWO_HAND_LEVELS
+from landmark_service import SubscribedSource, DEFAULT_NAME as DEFAULT_SERVICE_NAME
+from session_replay import SessionRecorder
+from frame_pipeline import FramePipeline
+from frame_sources import open_source, add_source_arguments
+from tuning_profile import load_profile, default_profile_path
+from absolute_pointer import AbsoluteMapper, Calibration, CornerCalibrator, DEFAULT_CALIBRATION_PATH
+from hand_state import HandTracker, HandCountStats, handedness_labels
+# Deferred until needed: mediapipe (~0.6 s, imported on the model thread during startup)
+# and roi_tracker (--roi)
+_IMPORTS_DONE = time.perf_counter()
 
-# Disable PyAutoGUI fail-safe and pauses
-pyautogui.FAILSAFE = False
-pyautogui.PAUSE = 0
+# Stand-in MediaPipe result for frames the scheduler skips
+_NO_HANDS = SimpleNamespace(multi_hand_landmarks=None, multi_handedness=None)
 
 class GestureState(Enum):
     """Enum for different gesture states"""
@@ -28,44 +54,164 @@ class GestureState(Enum):
     RIGHT_CLICK = 3     # Pinky / Rock
     SCROLLING = 4       # Two fingers
 
+# Two-hand mode: keys the modifier hand holds down (ctrl + scroll with the cursor hand zooms)
+MODIFIER_KEYS = {GestureState.LEFT_CLICK: "shift", GestureState.RIGHT_CLICK: "ctrl"}
+
 class HandController:
-    def __init__(self):
-        # 1. Initialize MediaPipe
-        self.mp_hands = mp.solutions.hands
-        self.hands = self.mp_hands.Hands(
-            static_image_mode=False,
-            max_num_hands=1,
-            model_complexity=1, 
-            min_detection_confidence=0.8,
-            min_tracking_confidence=0.7
-        )
+    window_title = "Hand Controller"
+    
+    def __init__(self, clock=time.time, use_camera=True, record_path=None, output=None, roi_size=0,
+                 cursor_filter=None, predict=False, profile_path=None,
+                 headless=False, mirror="image", camera_rgb=False, async_injection=False, upsample_hz=0,
+                 scroll_rate_hz=0, scroll_momentum=None, scroll_friction=4.0,
+                 motion_gate=False, idle_interval=0.5, frame_budget_ms=0, subscribe=None,
+                 pipeline=False, frame_source=0, source_rate=None, fourcc=None, gesture_model=None,
+                 tuning=None, absolute=None, two_hands=None, quiet=False):
+        # Time source for all gesture timing (replay injects a simulated clock)
+        self.clock = clock
         
-        # 2. Get Screen Size
-        self.screen_width, self.screen_height = pyautogui.size()
+        # Startup phases and time to first frame / first move (printed only for the live camera)
+        self.startup = StartupProfile(_PROCESS_START, verbose=use_camera or bool(subscribe) or pipeline)
+        self.startup.add_phase("imports", _PROCESS_START, _IMPORTS_DONE)
         
-        # 3. Initialize Camera
-        try:
-            self.cap = cv2.VideoCapture(0)
-            self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 1280)
-            self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 720)
-        except Exception as e:
-            print(f"Camera Init Error: {e}")
-            sys.exit(1)
+        # Camera resolution and model settings; the governor may change them at runtime.
+        # two_hands ("Right" / "Left": the dominant hand) also tracks the second hand.
+        levels = TWO_HAND_LEVELS if two_hands else QUALITY_LEVELS
+        self.quality = levels[0]
+        
+        # Where frames come from: camera index, video file, image directory or "synthetic" (see frame_sources.py)
+        self.frame_source = frame_source
+        self.source_rate = source_rate
+        self.fourcc = fourcc
+        self.governor = PerformanceGovernor(frame_budget_ms / 1000.0, levels) if frame_budget_ms and not (subscribe or pipeline) else None
+        self._pending_hands = None # Rebuilt model waiting to be swapped in
+        
+        # subscribe: read frames + landmarks from a running landmark_service.py instead of
+        # owning the camera and model; pipeline: run capture and inference in their own
+        # processes (see frame_pipeline.py). Either way frames arrive already mirrored.
+        self.source = None
+        self.pipeline = pipeline
+        if subscribe or pipeline:
+            use_camera = False
+            pipeline_mirror = mirror != "none"
+            mirror = "none"
+        
+        # 1-3. Output backend, camera and MediaPipe are independent: build them in parallel.
+        # output: an OutputBackend, or a backend name (see input_backends.py), default pyautogui
+        tasks = {}
+        if output is None or isinstance(output, str):
+            tasks["output backend"] = lambda: make_backend(output or "pyautogui", whole_desktop=absolute is not None)
+        if use_camera:
+            tasks["camera"] = self._open_camera
+            tasks["model"] = self._build_model
+        else:
+            tasks["mediapipe import"] = self._import_hands_module
+        if subscribe:
+            tasks["landmark service"] = lambda: SubscribedSource(subscribe)
+        if pipeline:
+            tasks["pipeline processes"] = lambda: FramePipeline(frame_source, mirror=pipeline_mirror, rate=source_rate,
+                                                                fourcc=fourcc, quality=self.quality).start()
+        built = parallel_init(self.startup, tasks)
         
-        # 4. Tracking Variables
-        self.prev_hand_x = None
-        self.prev_hand_y = None
+        # Mouse output (see input_backends.py); optionally performed on a worker thread (async_injection.py)
+        self.output = built.get("output backend", output)
+        if async_injection or upsample_hz or scroll_rate_hz:
+            self.output = AsyncInjector(self.output) # Timer threads + vision thread share one ordered queue
+        self.screen_width, self.screen_height = self.output.screen_size()
+        if use_camera:
+            self.cap = built["camera"]
+            self.mp_hands, self.hands = built["model"]
+        else:
+            self.mp_hands = built["mediapipe import"]
+        if subscribe or pipeline:
+            self.source = self.hands = built["landmark service" if subscribe else "pipeline processes"]
+        
+        # Cursor smoothing stage (see cursor_filters.py); predict=True leads by the measured latency
+        self.cursor_filter = cursor_filter if cursor_filter is not None else LegacyFilter()
+        self.predict = predict
+        self.frame_time = None        # perf_counter capture time of the frame being processed
+        self.injection_latency = 0.0  # Smoothed capture-to-injection latency (s)
+        
+        # Optional display-rate glide between frame targets (see cursor_upsampler.py)
+        self.upsampler = CursorUpsampler(self.output, upsample_hz).start() if upsample_hz else None
+        
+        # Scrolling (see scroll_engine.py): emitted per frame, or at scroll_rate_hz from a ticker thread
+        self.scroll_engine = ScrollEngine(momentum=scroll_momentum, friction_rate=scroll_friction)
+        self.scroll_ticker = bool(scroll_rate_hz)
+        if self.scroll_ticker:
+            self.scroll_engine.start(self.output, scroll_rate_hz, clock=self.clock)
+        
+        # Preview (see hud_renderer.py); headless skips drawing and the window entirely
+        self.hud = HudRenderer(self.mp_hands.HAND_CONNECTIONS)
+        self.headless = headless
+        # quiet: no per-gesture console lines (offline replays click thousands of times)
+        self.quiet = quiet
+        
+        # Flip / colour conversion into reused buffers (see frame_preprocess.py)
+        self.preprocess = FramePreprocessor(mirror, rgb_input=camera_rgb)
+        
+        # Optional ROI-cropped inference around the last known hand (see roi_tracker.py)
+        self.roi_tracker = None
+        if use_camera and roi_size:
+            from roi_tracker import RoiHandTracker
+            self.roi_tracker = RoiHandTracker(self.hands, roi_size, rgb_input=camera_rgb)
+        
+        # Inference gating on motion + load counters (see inference_scheduler.py)
+        self.scheduler = InferenceScheduler(enabled=motion_gate, idle_interval=idle_interval)
         
-        self.sensitivity = 1.3
-        self.curr_dx = 0
-        self.curr_dy = 0
+        # Per-stage loop timing ('P' toggles the overlay; see latency_profiler.py)
+        self.profiler = LatencyProfiler()
+        self.profile_path = profile_path
         
-        self.is_dragging = False 
-        self.pinch_start_time = 0
-        self.prev_scroll_y = 0
+        # Optional learned gesture classifier (see gesture_classifier.py): a GestureIndex or .npz path.
+        # Frames it isn't confident about fall back to the finger rules in detect_gesture.
+        self.gesture_classifier = None
+        if gesture_model is not None:
+            from gesture_classifier import GestureIndex
+            self.gesture_classifier = (gesture_model if isinstance(gesture_model, GestureIndex)
+                                       else GestureIndex.load(gesture_model))
+        self.gesture_confidence = None # Of the last classified frame
         
-        self.last_right_click = 0
-        self.last_fist_time = 0
+        # Optional landmark session recording (see session_replay.py)
+        self.recorder = None
+        if record_path:
+            self.recorder = SessionRecorder(record_path)
+        
+        # Optional absolute pointing (see absolute_pointer.py): a calibrated camera region maps onto the
+        # whole virtual desktop through a precomputed table. absolute: a Calibration or a calibration
+        # file path; a path that doesn't exist yet is calibrated on the first frames, then saved there.
+        self.mapper = None
+        self.calibrator = None
+        self.calibration_path = None
+        self.move_cursor = self.move_cursor_relative
+        if absolute is not None:
+            self.move_cursor = self.move_cursor_absolute
+            if isinstance(absolute, Calibration) or os.path.exists(absolute):
+                calibration = absolute if isinstance(absolute, Calibration) else Calibration.load(absolute)
+                self.mapper = AbsoluteMapper(calibration)
+                if calibration.desktop != tuple(self.output.virtual_desktop()):
+                    print(f"Note: calibrated for desktop {calibration.desktop}, now {self.output.virtual_desktop()}")
+            else:
+                self.calibration_path = absolute
+                self.calibrator = CornerCalibrator(tuple(self.output.virtual_desktop()))
+                print(self.calibrator.prompt)
+        
+        # 4. Tracking Variables: one HandState per hand (see hand_state.py). self.hand is the hand that
+        # drives the cursor; in two-hand mode the other one holds modifier keys and scrolls.
+        self.two_hands = bool(two_hands)
+        self.tracker = HandTracker(two_hands or "Right")
+        self.hand = self.tracker.dominant_state
+        self.modifier_scrolling = False # Modifier hand owns the scroll engine this frame
+        self.hand_costs = HandCountStats() # Inference time by number of hands in view
+        self.hands_in_view = [] # (HandState, points) of the last frame, for the HUD
+        
+        # Internal cursor model: the OS is only asked when the hand is (re)acquired
+        self.cursor_x, self.cursor_y = self.output.cursor_position()
+        
+        # Feel: gain, smoothing curve, gesture thresholds and timings (see tuning_profile.py).
+        # tuning: a dict of overrides or a profile path written by tune_params.py
+        self.tuning = load_profile(tuning)
+        self.sensitivity = self.tuning["sensitivity"]
         
         # MODES
         self.gaming_mode = False 
@@ -73,38 +219,90 @@ class HandController:
         # VISUALS
         self.click_anim_time = 0 # For flash effect
         
-    def get_finger_states(self, hand_landmarks):
-        fingers = []
-        thumb_tip = hand_landmarks.landmark[4]
-        thumb_ip = hand_landmarks.landmark[3]
-        fingers.append(thumb_tip.x < thumb_ip.x) 
-        
-        tips = [8, 12, 16, 20] 
-        pips = [6, 10, 14, 18]
+    # --- Startup tasks (run in parallel by __init__) ---
+    @staticmethod
+    def _import_hands_module():
+        import mediapipe as mp
+        return mp.solutions.hands
+    
+    def _open_camera(self):
+        try:
+            cap = open_source(self.frame_source, size=(self.quality.width, self.quality.height),
+                              rate=self.source_rate, fourcc=self.fourcc) # Camera buffer size 1: no stale frames
+            cap.grab() # Warm-up: the first frame is by far the slowest to arrive
+            return cap
+        except Exception as e:
+            print(f"Camera Init Error: {e}")
+            sys.exit(1)
+    
+    def _build_model(self, quality=None):
+        quality = quality or self.quality
+        mp_hands = self._import_hands_module()
+        hands = mp_hands.Hands(
+            static_image_mode=False,
+            max_num_hands=quality.hands,
+            model_complexity=quality.complexity, 
+            min_detection_confidence=quality.detection,
+            min_tracking_confidence=quality.tracking
+        )
+        # Warm-up: the first process() call initialises the graph and loads the models
+        hands.process(np.zeros((quality.height, quality.width, 3), dtype=np.uint8))
+        return mp_hands, hands
+    
+    # --- Runtime quality changes (see performance_governor.py) ---
+    def set_quality(self, quality):
+        old, self.quality = self.quality, quality
+        if (quality.width, quality.height) != (old.width, old.height):
+            self.grabber.set_properties({cv2.CAP_PROP_FRAME_WIDTH: quality.width,
+                                         cv2.CAP_PROP_FRAME_HEIGHT: quality.height})
+            if self.roi_tracker:
+                self.roi_tracker.box = None # Pixel box of the old resolution
+        if (quality.complexity, quality.detection, quality.tracking, quality.hands) != \
+                (old.complexity, old.detection, old.tracking, old.hands):
+            # Build + warm up off the loop; step() swaps it in when ready
+            threading.Thread(target=self._rebuild_model, args=(quality,), name="ModelRebuild", daemon=True).start()
+    
+    def _rebuild_model(self, quality):
+        self._pending_hands = self._build_model(quality)[1]
+    
+    def _swap_model(self):
+        old, self.hands = self.hands, self._pending_hands
+        self._pending_hands = None
+        if self.roi_tracker:
+            self.roi_tracker.hands = self.hands
+            self.roi_tracker.box = None
+        old.close()
+    
+    def end_frame(self):
+        self.profiler.end_frame()
+        if self.governor:
+            level = self.governor.observe(self.profiler.work_time())
+            if level is not None:
+                self.set_quality(self.governor.current)
         
-        for tip, pip in zip(tips, pips):
-            fingers.append(hand_landmarks.landmark[tip].y < hand_landmarks.landmark[pip].y)
-        return fingers
-
-    def get_distance(self, p1, p2):
-        return math.sqrt((p1.x - p2.x)**2 + (p1.y - p2.y)**2)
+    # Hand inputs may be MediaPipe landmark lists or (21, 3) arrays (see landmark_features.py)
+    def get_finger_states(self, hand_landmarks):
+        return finger_states(landmarks_to_array(hand_landmarks)).tolist()
 
-    def detect_gesture(self, fingers, hand_landmarks):
-        thumb, index, middle, ring, pinky = fingers
+    def detect_gesture(self, fingers, hand_landmarks, hand=None):
+        hand = hand or self.hand
+        if self.gesture_classifier:
+            gesture_state = self.classify_gesture(hand_landmarks, hand)
+            if gesture_state is not None:
+                return gesture_state
         
-        thumb_tip = hand_landmarks.landmark[4]
-        index_tip = hand_landmarks.landmark[8]
+        thumb, index, middle, ring, pinky = fingers
         
-        pinch_dist = self.get_distance(thumb_tip, index_tip)
-        is_pinching = pinch_dist < 0.05
+        pinch_dist = pinch_distance(landmarks_to_array(hand_landmarks))
+        is_pinching = pinch_dist < self.tuning["pinch_threshold"]
         
         # 1. FIST / PAUSE
         if not index and not middle and not ring and not pinky:
-            self.last_fist_time = time.time()
+            hand.last_fist_time = self.clock()
             return GestureState.IDLE
             
         # 2. TRANSITION SAFETY
-        if (time.time() - self.last_fist_time) < 0.5:
+        if (self.clock() - hand.last_fist_time) < self.tuning["fist_guard"]:
             return GestureState.MOVING
             
         # 3. RIGHT CLICK
@@ -123,275 +321,596 @@ class HandController:
             
         return GestureState.MOVING
     
+    def classify_gesture(self, hand_landmarks, hand=None):
+        """Learned pose lookup with the same fist bookkeeping as the rules; None when not confident"""
+        hand = hand or self.hand
+        code, self.gesture_confidence = self.gesture_classifier.classify(landmarks_to_array(hand_landmarks))
+        if self.gesture_confidence < self.gesture_classifier.min_confidence:
+            return None
+        gesture_state = GestureState(code)
+        if gesture_state == GestureState.IDLE:
+            hand.last_fist_time = self.clock()
+            return gesture_state
+        if (self.clock() - hand.last_fist_time) < self.tuning["fist_guard"]:
+            return GestureState.MOVING
+        return gesture_state
+    
     def move_cursor_relative(self, hand_landmarks, freeze=False):
+        hand = self.hand
         try:
-            tracking_point = hand_landmarks.landmark[5]
-            curr_x = tracking_point.x
-            curr_y = tracking_point.y
+            raw_x, raw_y = landmarks_to_array(hand_landmarks)[INDEX_MCP, :2].tolist()
+            now = self.clock()
+            
+            if hand.prev_hand_x is None:
+                self.cursor_filter.reset()
+            curr_x, curr_y = self.cursor_filter.update(raw_x, raw_y, now)
             
             if freeze:
-                self.prev_hand_x = curr_x
-                self.prev_hand_y = curr_y
+                hand.prev_hand_x = curr_x
+                hand.prev_hand_y = curr_y
+                hand.prev_hand_time = now
+                self.halt_cursor()
                 return
 
-            if self.prev_hand_x is None:
-                self.prev_hand_x = curr_x
-                self.prev_hand_y = curr_y
+            if hand.prev_hand_x is None:
+                hand.prev_hand_x = curr_x
+                hand.prev_hand_y = curr_y
+                hand.prev_hand_time = now
+                # Resync with the real pointer in case the physical mouse moved
+                self.cursor_x, self.cursor_y = self.output.cursor_position()
+                if self.upsampler:
+                    self.upsampler.reset(self.cursor_x, self.cursor_y)
                 return
             
-            raw_dx = (curr_x - self.prev_hand_x) * self.screen_width
-            raw_dy = (curr_y - self.prev_hand_y) * self.screen_height
-            
-            speed = (raw_dx**2 + raw_dy**2)**0.5
-            calc_speed = min(speed, 60.0)
-            
-            # Smart Smoothing
-            t = calc_speed / 60.0 
-            smoothing = max(0.1, 0.95 - (0.85 * (t**0.6)))
+            raw_dx = (curr_x - hand.prev_hand_x) * self.screen_width
+            raw_dy = (curr_y - hand.prev_hand_y) * self.screen_height
             
-            accel = 1.0
-            if speed > 3.0:
-                 accel = 1.0 + (speed * 0.08) 
+            tuning = self.tuning
+            if self.cursor_filter.legacy_smoothing:
+                speed = (raw_dx**2 + raw_dy**2)**0.5
+                calc_speed = min(speed, tuning["smooth_speed_cap"])
                 
-            dx = raw_dx * self.sensitivity * accel
-            dy = raw_dy * self.sensitivity * accel
-            
-            self.curr_dx = (dx * (1 - smoothing)) + (self.curr_dx * smoothing)
-            self.curr_dy = (dy * (1 - smoothing)) + (self.curr_dy * smoothing)
-            
-            if abs(self.curr_dx) < 1.0 and abs(self.curr_dy) < 1.0:
-                self.curr_dx = 0
-                self.curr_dy = 0
+                # Smart Smoothing
+                t = calc_speed / tuning["smooth_speed_cap"]
+                smoothing = max(tuning["smooth_min"],
+                                tuning["smooth_max"] - (tuning["smooth_range"] * (t**tuning["smooth_exponent"])))
+                
+                accel = 1.0
+                if speed > tuning["accel_threshold"]:
+                     accel = 1.0 + (speed * tuning["accel_gain"])
+                    
+                dx = raw_dx * self.sensitivity * accel
+                dy = raw_dy * self.sensitivity * accel
+                
+                hand.curr_dx = (dx * (1 - smoothing)) + (hand.curr_dx * smoothing)
+                hand.curr_dy = (dy * (1 - smoothing)) + (hand.curr_dy * smoothing)
+                
+                if abs(hand.curr_dx) < 1.0 and abs(hand.curr_dy) < 1.0:
+                    hand.curr_dx = 0
+                    hand.curr_dy = 0
+                    
+                new_x = int(self.cursor_x + hand.curr_dx)
+                new_y = int(self.cursor_y + hand.curr_dy)
+            else:
+                # Same acceleration curve, but with speed in px per 30 fps frame so FPS doesn't change the feel
+                dt = max(now - hand.prev_hand_time, 1e-3)
+                speed = (raw_dx**2 + raw_dy**2)**0.5 / (dt * 30.0)
+                accel = 1.0
+                if speed > tuning["accel_threshold"]:
+                     accel = 1.0 + (speed * tuning["accel_gain"])
+                
+                hand.curr_dx = raw_dx * self.sensitivity * accel
+                hand.curr_dy = raw_dy * self.sensitivity * accel
+                
+                # The filter already removed jitter: keep sub-pixel motion instead of a dead zone
+                target_x = self.cursor_x + hand.curr_dx + hand.sub_dx
+                target_y = self.cursor_y + hand.curr_dy + hand.sub_dy
+                new_x, new_y = int(round(target_x)), int(round(target_y))
+                hand.sub_dx, hand.sub_dy = target_x - new_x, target_y - new_y
                 
-            mouse_x, mouse_y = pyautogui.position()
-            new_x = int(mouse_x + self.curr_dx)
-            new_y = int(mouse_y + self.curr_dy)
             new_x = max(0, min(self.screen_width - 1, new_x))
             new_y = max(0, min(self.screen_height - 1, new_y))
             
-            self.prev_hand_x = curr_x
-            self.prev_hand_y = curr_y
+            hand.prev_hand_x = curr_x
+            hand.prev_hand_y = curr_y
+            hand.prev_hand_time = now
             
-            pyautogui.moveTo(new_x, new_y, _pause=False)
+            if (new_x, new_y) != (self.cursor_x, self.cursor_y):
+                self.emit_move(new_x, new_y)
             
         except Exception:
             pass
     
+    def move_cursor_absolute(self, hand_landmarks, freeze=False):
+        """Absolute mode: the hand's place in the calibrated region is the cursor's place on the desktop"""
+        hand = self.hand
+        try:
+            raw_x, raw_y = landmarks_to_array(hand_landmarks)[INDEX_MCP, :2].tolist()
+            now = self.clock()
+            
+            if hand.prev_hand_x is None:
+                self.cursor_filter.reset()
+                hand.abs_x = None
+            curr_x, curr_y = self.cursor_filter.update(raw_x, raw_y, now)
+            hand.prev_hand_x = curr_x
+            hand.prev_hand_y = curr_y
+            hand.prev_hand_time = now
+            if freeze:
+                self.halt_cursor()
+                return
+            
+            # One table lookup; the cursor model is ours, so the OS is never queried
+            target_x, target_y = self.mapper.map(curr_x, curr_y)
+            if hand.abs_x is None:
+                hand.abs_x, hand.abs_y = target_x, target_y # Hand (re)acquired: jump to where it points
+            elif self.cursor_filter.legacy_smoothing:
+                # Same speed-dependent smoothing as relative mode, driven by how fast the target moves
+                tuning = self.tuning
+                speed = ((target_x - hand.abs_target[0])**2 + (target_y - hand.abs_target[1])**2)**0.5
+                t = min(speed, tuning["smooth_speed_cap"]) / tuning["smooth_speed_cap"]
+                smoothing = max(tuning["smooth_min"],
+                                tuning["smooth_max"] - (tuning["smooth_range"] * (t**tuning["smooth_exponent"])))
+                hand.abs_x += (target_x - hand.abs_x) * (1 - smoothing)
+                hand.abs_y += (target_y - hand.abs_y) * (1 - smoothing)
+            else:
+                hand.abs_x, hand.abs_y = target_x, target_y
+            hand.abs_target = (target_x, target_y)
+            
+            new_x, new_y = int(round(hand.abs_x)), int(round(hand.abs_y))
+            if (new_x, new_y) != (self.cursor_x, self.cursor_y):
+                self.emit_move(new_x, new_y)
+            
+        except Exception:
+            pass
+    
+    def emit_move(self, new_x, new_y):
+        if self.upsampler:
+            self.upsampler.set_target(new_x, new_y)
+        else:
+            self.output.move_to(new_x, new_y)
+        self.cursor_x, self.cursor_y = new_x, new_y
+        self.measure_latency()
+        self.startup.mark("first_move")
+    
+    def calibrate(self, marks, gesture_state):
+        """Absolute-mode calibration: a pinch captures the corner the hand points at"""
+        x, y = marks[INDEX_MCP, :2].tolist()
+        if self.calibrator.feed(x, y, gesture_state == GestureState.LEFT_CLICK):
+            if self.calibrator.done:
+                calibration = self.calibrator.result()
+                calibration.save(self.calibration_path)
+                self.mapper = AbsoluteMapper(calibration)
+                self.calibrator = None
+                print(f"Calibration saved to {self.calibration_path}")
+            else:
+                print(self.calibrator.prompt)
+    
+    def halt_cursor(self):
+        """Stop an upsampled glide where it is, so clicks land where the cursor is shown"""
+        if self.upsampler:
+            position = self.upsampler.halt()
+            if position is not None:
+                self.cursor_x, self.cursor_y = position
+    
+    def measure_latency(self):
+        """Track capture-to-injection latency; with prediction on, the filter leads by it"""
+        if self.frame_time is None:
+            return
+        sample = time.perf_counter() - self.frame_time + self.output.pending_delay()
+        if self.injection_latency:
+            self.injection_latency = 0.9 * self.injection_latency + 0.1 * sample
+        else:
+            self.injection_latency = sample
+        if self.predict:
+            self.cursor_filter.lead = self.injection_latency
+    
+    def announce(self, message):
+        if not self.quiet:
+            print(message)
+
     def handle_click_status(self, is_clicking):
+        hand = self.hand
         if self.gaming_mode:
             if is_clicking:
-                if not self.is_dragging:
-                    pyautogui.mouseDown()
-                    self.is_dragging = True
-                    self.click_anim_time = time.time() # Flash
+                if not hand.is_dragging:
+                    self.output.mouse_down()
+                    hand.is_dragging = True
+                    self.click_anim_time = self.clock() # Flash
             else:
-                if self.is_dragging:
-                    pyautogui.mouseUp()
-                    self.is_dragging = False
+                if hand.is_dragging:
+                    self.output.mouse_up()
+                    hand.is_dragging = False
             return
 
-        current_time = time.time()
+        current_time = self.clock()
         if is_clicking:
-            if self.pinch_start_time == 0:
-                self.pinch_start_time = current_time
+            if hand.pinch_start_time == 0:
+                hand.pinch_start_time = current_time
             
-            if (current_time - self.pinch_start_time) > 0.2:
-                if not self.is_dragging:
-                    print(">>> DRAGGING STARTED")
-                    pyautogui.mouseDown()
-                    self.is_dragging = True
+            if (current_time - hand.pinch_start_time) > self.tuning["drag_delay"]:
+                if not hand.is_dragging:
+                    self.announce(">>> DRAGGING STARTED")
+                    self.output.mouse_down()
+                    hand.is_dragging = True
         else:
-            if self.is_dragging:
-                print(">>> DRAG ENDED")
-                pyautogui.mouseUp()
-                self.is_dragging = False
-            elif self.pinch_start_time != 0:
-                print(">>> CLICK EXECUTED!")
-                pyautogui.click()
-                self.click_anim_time = time.time() # Flash
+            if hand.is_dragging:
+                self.announce(">>> DRAG ENDED")
+                self.output.mouse_up()
+                hand.is_dragging = False
+            elif hand.pinch_start_time != 0:
+                self.announce(">>> CLICK EXECUTED!")
+                self.output.click()
+                self.click_anim_time = self.clock() # Flash
             
-            self.pinch_start_time = 0
+            hand.pinch_start_time = 0
 
     def perform_right_click(self):
-        current_time = time.time()
-        if current_time - self.last_right_click > 1.0:
-            pyautogui.rightClick()
-            self.last_right_click = current_time
+        current_time = self.clock()
+        if current_time - self.hand.last_right_click > self.tuning["right_click_cooldown"]:
+            self.output.right_click()
+            self.hand.last_right_click = current_time
 
     def perform_scroll(self, hand_landmarks):
-        tracking_point = hand_landmarks.landmark[5]
-        current_y = tracking_point.y
-        if self.prev_scroll_y != 0:
-            delta_y = (current_y - self.prev_scroll_y) * 1000
-            if abs(delta_y) > 5:
-                scroll_amount = int(delta_y * -2.0)
-                pyautogui.scroll(scroll_amount)
-        self.prev_scroll_y = current_y
+        current_y = float(landmarks_to_array(hand_landmarks)[INDEX_MCP, 1])
+        self.scroll_engine.feed(current_y, self.clock())
+        self.emit_scroll()
+    
+    def end_scroll(self, stop=False):
+        """Scroll gesture not held this frame: coast (momentum) or settle; stop=True halts at once"""
+        if stop:
+            self.scroll_engine.stop()
+        else:
+            self.scroll_engine.release()
+        self.emit_scroll()
+    
+    def emit_scroll(self):
+        if self.scroll_ticker:
+            return # The ticker thread emits at its own rate
+        amount = self.scroll_engine.advance(self.clock())
+        if amount:
+            self.output.scroll(amount)
 
-    def draw_sci_fi_hud(self, frame, marks, gesture_state):
-        h, w, c = frame.shape
-        
-        # COLORS (BGR)
-        CYAN = (255, 255, 0)
-        MAGENTA = (255, 0, 255)
-        NEON_GREEN = (50, 255, 50)
-        RED = (0, 0, 255)
-        WHITE = (255, 255, 255)
-        
-        # 1. DRAW EXOSKELETON (Custom Lines)
-        # Joints to connect
-        connections = self.mp_hands.HAND_CONNECTIONS
-        for connection in connections:
-            start_idx = connection[0]
-            end_idx = connection[1]
-            
-            start_point = marks.landmark[start_idx]
-            end_point = marks.landmark[end_idx]
-            
-            p1 = (int(start_point.x * w), int(start_point.y * h))
-            p2 = (int(end_point.x * w), int(end_point.y * h))
-            
-            # Sci-Fi Line style: Thin, anti-aliased
-            cv2.line(frame, p1, p2, CYAN, 1, cv2.LINE_AA)
-            
-        # 2. DRAW JOINTS (Tech Nodes)
-        for id, lm in enumerate(marks.landmark):
-            cx, cy = int(lm.x * w), int(lm.y * h)
-            # Draw a small filled circle with a ring
-            cv2.circle(frame, (cx, cy), 3, (0,0,0), -1) # Black hole
-            cv2.circle(frame, (cx, cy), 3, CYAN, 1)     # Cyan rim
-        
-        # 3. CURSOR TARGET (Index Finger Top)
-        idx_tip = marks.landmark[8]
-        ix, iy = int(idx_tip.x * w), int(idx_tip.y * h)
-        
-        # Target Reticle
+    def draw_sci_fi_hud(self, frame, marks, gesture_state, hand=None):
+        hand = hand or self.hand
         color_reticle = NEON_GREEN if not self.gaming_mode else RED
-        cv2.circle(frame, (ix, iy), 8, color_reticle, 1, cv2.LINE_AA)
-        cv2.line(frame, (ix-12, iy), (ix-4, iy), color_reticle, 1)
-        cv2.line(frame, (ix+4, iy), (ix+12, iy), color_reticle, 1)
-        cv2.line(frame, (ix, iy-12), (ix, iy-4), color_reticle, 1)
-        cv2.line(frame, (ix, iy+4), (ix, iy+12), color_reticle, 1)
-        
-        # 4. CLICK FLASH (Pulse)
-        if (time.time() - self.click_anim_time) < 0.15:
-            # Draw expanding white ring
-            radius = int((time.time() - self.click_anim_time) * 300) + 10
-            cv2.circle(frame, (ix, iy), radius, WHITE, 2)
+        
+        # Click flash pulse
+        flash_age = self.clock() - self.click_anim_time
+        if flash_age >= 0.15:
+            flash_age = None
             
-        # 5. DRAG LOADING BAR (If waiting for drag in Desktop Mode)
-        if not self.gaming_mode and gesture_state == GestureState.LEFT_CLICK and not self.is_dragging:
-            elapsed = time.time() - self.pinch_start_time
+        # Drag loading bar (if waiting for drag in Desktop Mode), 0.0 to drag_delay
+        drag_progress = None
+        # Cursor hand only: the modifier hand's pinch is shift, not a click
+        if (not self.gaming_mode and hand is self.hand and gesture_state == GestureState.LEFT_CLICK
+                and not hand.is_dragging):
+            elapsed = self.clock() - hand.pinch_start_time
             if elapsed > 0:
-                # Progress 0.0 to 0.2s
-                pct = min(1.0, elapsed / 0.2)
-                # Draw arc around center of hand
-                wrist = marks.landmark[0]
-                wx, wy = int(wrist.x * w), int(wrist.y * h)
-                center = ( (ix+wx)//2, (iy+wy)//2 )
-                
-                # Elliptical arc
-                axes = (30, 30)
-                angle = 0
-                startAngle = 0
-                endAngle = int(360 * pct)
-                cv2.ellipse(frame, center, axes, angle, startAngle, endAngle, MAGENTA, 2)
+                drag_progress = min(1.0, elapsed / self.tuning["drag_delay"])
+        
+        self.hud.draw_hand(frame, landmarks_to_array(marks), color_reticle, flash_age, drag_progress)
 
     def draw_info_overlay(self, frame, gesture_state):
-        h, w, c = frame.shape
+        name = f"CALIBRATE {self.calibrator.corner.upper()}" if self.calibrator else gesture_state.name
+        self.hud.draw_overlay(frame, name, self.gaming_mode)
+
+    def apply_gesture(self, marks):
+        """Classify one hand and perform its mouse action. Returns the GestureState."""
+        marks = landmarks_to_array(marks) # Convert once; everything below reads the array
+        fingers = self.get_finger_states(marks)
+        gesture_state = self.hand.gesture = self.detect_gesture(fingers, marks)
+        if self.calibrator:
+            self.calibrate(marks, gesture_state)
+            return gesture_state
         
-        # HUD BORDERS in Gaming Mode
-        if self.gaming_mode:
-            # Red/Purple Border
-            color = (0, 0, 255)
-            thick = 3
-            len_line = 50
-            # Corners
-            cv2.line(frame, (0,0), (len_line,0), color, thick)
-            cv2.line(frame, (0,0), (0,len_line), color, thick)
+        if gesture_state == GestureState.IDLE: 
+            self.move_cursor(marks, freeze=True)
+            self.handle_click_status(False)
+        elif gesture_state == GestureState.MOVING:
+            self.move_cursor(marks, freeze=False)
+            self.handle_click_status(False)
+        elif gesture_state == GestureState.LEFT_CLICK:
+            if self.gaming_mode:
+                self.move_cursor(marks, freeze=False)
+            else:
+                should_freeze = not self.hand.is_dragging
+                self.move_cursor(marks, freeze=should_freeze)
+            self.handle_click_status(True)
+        elif gesture_state == GestureState.RIGHT_CLICK:
+            self.move_cursor(marks, freeze=True)
+            self.handle_click_status(False)
+            self.perform_right_click()
+        elif gesture_state == GestureState.SCROLLING:
+            self.handle_click_status(False)
+            if not self.modifier_scrolling: # One hand drives the scroll engine: the modifier hand has it
+                self.perform_scroll(marks)
+            self.hand.prev_hand_x = None
+        if gesture_state != GestureState.SCROLLING and not self.modifier_scrolling:
+            self.end_scroll(stop=gesture_state == GestureState.IDLE) # A fist catches momentum
+        return gesture_state
+
+    def release_hand(self):
+        """Hand lost: release any held button and reset relative tracking"""
+        self.halt_cursor()
+        self.handle_click_status(False)
+        if not self.modifier_scrolling:
+            self.end_scroll()
+        self.hand.prev_hand_x = None
+    
+    def apply_hands(self, hands, labels=()):
+        """
+        All hands of one frame ((21, 3) arrays and their handedness labels).
+        Returns the cursor hand's GestureState (IDLE when it isn't in view).
+        """
+        if not self.two_hands or self.quality.hands < 2:
+            if self.two_hands:
+                # The governor dropped to one hand: the other hand's key and scroll mustn't stay held
+                for state in self.tracker.states.values():
+                    if state is not self.hand and (state.held_key or state.scrolling):
+                        self.release_modifier(state)
+            self.hands_in_view = [(self.hand, points) for points in hands]
+            if not hands:
+                self.release_hand()
+            gesture_state = GestureState.IDLE
+            for points in hands:
+                gesture_state = self.apply_gesture(points)
+            return gesture_state
+        
+        assigned = self.hands_in_view = self.tracker.assign(hands, labels, self.clock())
+        seen = [state for state, _ in assigned]
+        for state in self.tracker.states.values():
+            if state in seen:
+                continue
+            if state is self.hand:
+                self.release_hand()
+            else:
+                self.release_modifier(state)
+        gesture_state = GestureState.IDLE
+        # Modifier hand first: its keys are down and its scrolling known before the cursor hand acts
+        for state, points in sorted(assigned, key=lambda pair: pair[0] is self.hand):
+            if state is self.hand:
+                gesture_state = self.apply_gesture(points)
+            else:
+                self.apply_modifier(state, points)
+        return gesture_state
+    
+    def apply_modifier(self, hand, marks):
+        """Two-hand mode, other hand: pinch holds shift, pinky holds ctrl, two fingers scroll"""
+        gesture_state = hand.gesture = self.detect_gesture(self.get_finger_states(marks), marks, hand)
+        self.hold_key(hand, MODIFIER_KEYS.get(gesture_state))
+        scrolling = gesture_state == GestureState.SCROLLING
+        if scrolling:
+            if not hand.scrolling:
+                self.scroll_engine.release() # Take over from the cursor hand: re-anchor on this hand's y
+            self.perform_scroll(marks)
+        elif hand.scrolling:
+            self.end_scroll(stop=gesture_state == GestureState.IDLE)
+        hand.scrolling = self.modifier_scrolling = scrolling
+        return gesture_state
+    
+    def release_modifier(self, hand):
+        """Modifier hand lost: let go of its key and its scroll"""
+        self.hold_key(hand, None)
+        if hand.scrolling:
+            self.end_scroll()
+        hand.scrolling = self.modifier_scrolling = False
+    
+    def hold_key(self, hand, key):
+        if key != hand.held_key:
+            if hand.held_key:
+                self.output.key_up(hand.held_key)
+            if key:
+                self.output.key_down(key)
+            hand.held_key = key
+
+    def step(self):
+        """Process one frame. Returns False when the loop should stop."""
+        prof = self.profiler
+        try:
+            prof.begin_frame()
+            success, frame = self.grabber.read()
+            if not success: return False
+            self.frame_time = self.grabber.last_frame_time
+            prof.lap("capture")
+            if self._pending_hands is not None:
+                self._swap_model()
+            frame = self.preprocess.orient(frame)
+            infer = self.scheduler.should_infer(frame) # Motion check (see inference_scheduler.py)
+            infer_start = time.perf_counter()
+            if not infer:
+                prof.lap("preprocess")
+                results = _NO_HANDS
+            elif self.source:
+                results = self.source.process(frame) # Landmarks arrive with the frame: nothing to convert
+            elif self.roi_tracker:
+                prof.lap("preprocess")
+                results = self.roi_tracker.process(frame) # Crop + colour conversion counted as inference
+            else:
+                rgb_frame = self.preprocess.to_rgb(frame)
+                prof.lap("preprocess")
+                results = self.hands.process(rgb_frame)
+            self.scheduler.record(infer, bool(results.multi_hand_landmarks))
+            if infer:
+                self.hand_costs.add(len(results.multi_hand_landmarks or ()), time.perf_counter() - infer_start)
+            self.preprocess.mirror_results(results)
+            prof.lap("inference")
+            if not self.headless:
+                frame = self.preprocess.display(frame)
+                prof.lap("hud")
             
-            cv2.line(frame, (w,0), (w-len_line,0), color, thick)
-            cv2.line(frame, (w,0), (w,len_line), color, thick)
+            if self.recorder:
+                self.recorder.write(self.clock(), results.multi_hand_landmarks, results.multi_handedness)
             
-            cv2.line(frame, (0,h), (len_line,h), color, thick)
-            cv2.line(frame, (0,h), (0,h-len_line), color, thick)
+            injected_before = self.output.stats.thread_time()
+            hands = [landmarks_to_array(marks) for marks in results.multi_hand_landmarks or ()]
+            gesture_state = self.apply_hands(hands, handedness_labels(results.multi_handedness, len(hands)))
+            prof.lap("gesture")
+            # Time this thread spent inside the output backend is injection, not gesture logic
+            injected = self.output.stats.thread_time() - injected_before
+            prof.add("gesture", -injected)
+            prof.add("injection", injected)
+            self.startup.mark("first_frame")
             
-            cv2.line(frame, (w,h), (w-len_line,h), color, thick)
-            cv2.line(frame, (w,h), (w,h-len_line), color, thick)
+            if self.headless:
+                self.end_frame()
+                return True
             
-            cv2.putText(frame, "COMBAT MODE ACTIVE", (w//2 - 150, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.7, color, 2)
-
-        # STATE BOX
-        box_x, box_y = 20, 50
-        cv2.putText(frame, gesture_state.name, (box_x, box_y), cv2.FONT_HERSHEY_SIMPLEX, 1.0, (0, 255, 0), 2)
-        
-        # Instructions
-        y_off = h - 20
-        cv2.putText(frame, "'G': Game Mode | FIST: Pause | PINCH: Click", (20, y_off), cv2.FONT_HERSHEY_PLAIN, 1.2, (200, 200, 200), 1)
+            # Sci-Fi HUD per hand, drawn after the gesture logic so it shows this frame's state
+            for hand, points in self.hands_in_view:
+                self.draw_sci_fi_hud(frame, points, hand.gesture, hand)
+            self.draw_info_overlay(frame, gesture_state)
+            prof.draw_overlay(frame)
+            prof.lap("hud")
+            cv2.imshow(self.window_title, frame)
+            
+            key = cv2.waitKey(1) & 0xFF
+            prof.lap("display")
+            self.end_frame()
+            if key == ord('q'): return False
+            if key == ord('g'): 
+                self.gaming_mode = not self.gaming_mode
+                print(f"GAMING MODE: {'ON' if self.gaming_mode else 'OFF'}")
+            if key == ord('p'):
+                prof.toggle_overlay()
+            
+        except Exception as e:
+            prof.record_error(e)
+        return True
 
     def run(self):
         print(" HAND CONTROLLER - SCI-FI EDITION")
-        print(" Press 'G' for Gaming Mode")
-        
-        while True:
-            try:
-                success, frame = self.cap.read()
-                if not success: break
-                frame = cv2.flip(frame, 1)
-                rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                results = self.hands.process(rgb_frame)
-                gesture_state = GestureState.IDLE
-                
-                if results.multi_hand_landmarks:
-                    for marks in results.multi_hand_landmarks:
-                        # NEW: Draw Custom Sci-Fi HUD
-                        self.draw_sci_fi_hud(frame, marks, gesture_state)
-                        
-                        fingers = self.get_finger_states(marks)
-                        gesture_state = self.detect_gesture(fingers, marks)
-                        
-                        if gesture_state == GestureState.IDLE: 
-                            self.move_cursor_relative(marks, freeze=True)
-                            self.handle_click_status(False)
-                        elif gesture_state == GestureState.MOVING:
-                            self.move_cursor_relative(marks, freeze=False)
-                            self.handle_click_status(False)
-                        elif gesture_state == GestureState.LEFT_CLICK:
-                            if self.gaming_mode:
-                                self.move_cursor_relative(marks, freeze=False)
-                            else:
-                                should_freeze = not self.is_dragging
-                                self.move_cursor_relative(marks, freeze=should_freeze)
-                            self.handle_click_status(True)
-                        elif gesture_state == GestureState.RIGHT_CLICK:
-                            self.move_cursor_relative(marks, freeze=True)
-                            self.handle_click_status(False)
-                            self.perform_right_click()
-                        elif gesture_state == GestureState.SCROLLING:
-                            self.handle_click_status(False)
-                            self.perform_scroll(marks)
-                            self.prev_hand_x = None
-                else:
-                    self.handle_click_status(False)
-                    self.prev_hand_x = None
-                    
-                self.draw_info_overlay(frame, gesture_state)
-                cv2.imshow("Hand Controller", frame)
-                
-                key = cv2.waitKey(1) & 0xFF
-                if key == ord('q'): break
-                if key == ord('g'): 
-                    self.gaming_mode = not self.gaming_mode
-                    print(f"GAMING MODE: {'ON' if self.gaming_mode else 'OFF'}")
-                
-            except Exception: pass
+        print(" Press 'G' for Gaming Mode, 'P' for latency stats")
+        
+        if self.headless:
+            print(" Headless mode: no preview window (Ctrl+C to quit)")
+        
+        print("Startup:")
+        for line in self.startup.report():
+            print(f"  {line}")
+        
+        # Capture runs on its own thread; we always get the newest frame
+        if self.source:
+            self.grabber = self.source # Newest frame published by the service
+        else:
+            self.grabber = LatestFrameGrabber(self.cap).start()
         
         try:
-            if self.is_dragging: pyautogui.mouseUp()
+            while self.step(): pass
+        except KeyboardInterrupt:
+            pass
+        
+        if self.scroll_ticker:
+            self.scroll_engine.close()
+        if self.upsampler:
+            self.upsampler.close()
+            print(f"Cursor upsampling: {self.upsampler.moves} moves for {self.upsampler.targets} frame targets")
+        try:
+            if self.hand.is_dragging: self.output.mouse_up()
+            for hand in self.tracker.states.values():
+                self.hold_key(hand, None)
         except: pass
+        self.grabber.stop()
+        print(f"Frames captured: {self.grabber.frames_captured} | dropped (stale): {self.grabber.frames_dropped}")
+        if self.recorder: self.recorder.close()
+        print(f"Capture-to-injection latency: {self.injection_latency * 1000:.1f} ms ({self.cursor_filter.name} filter)")
+        if self.roi_tracker:
+            t = self.roi_tracker
+            print(f"Inference: {t.roi_inferences} ROI, {t.full_inferences} full-frame ({t.roi_misses} ROI misses)")
+        print(f"Inference scheduling ({'motion-gated' if self.scheduler.enabled else 'every frame'}):")
+        for line in self.scheduler.summary():
+            print(f"  {line}")
+        if self.two_hands:
+            print(f"Two-hand tracking ({self.tracker.dominant} hand drives the cursor, "
+                  f"{self.tracker.relabeled} handedness labels overruled by position):")
+            for line in self.hand_costs.summary():
+                print(f"  {line}")
+        if self.pipeline:
+            print("Pipeline stages:")
+            for line in self.source.summary():
+                print(f"  {line}")
+        if self.governor:
+            print("Performance governor:")
+            for line in self.governor.summary():
+                print(f"  {line}")
+        print("Startup (incl. first frame / first move):")
+        for line in self.startup.report():
+            print(f"  {line}")
+        print("Loop latency per stage:")
+        for line in self.profiler.summary():
+            print(f"  {line}")
+        if self.profile_path:
+            self.profiler.export(self.profile_path)
+            print(f"Per-frame timings written to {self.profile_path}")
+        print(f"Injection cost ({self.output.name} backend):")
+        for line in self.output.report():
+            print(f"  {line}")
+        self.output.close()
+        if self.source: self.source.close()
         if hasattr(self, 'cap'): self.cap.release()
-        cv2.destroyAllWindows()
+        if not self.headless: cv2.destroyAllWindows()
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Hand Gesture Controller")
+    parser.add_argument("--record", metavar="PATH", help="record the landmark stream to a session file")
+    parser.add_argument("--roi", metavar="SIZE", type=int, default=0,
+                        help="after the first detection, run inference on a SIZExSIZE crop around the hand")
+    parser.add_argument("--filter", choices=list(FILTERS), default="legacy", help="cursor smoothing filter")
+    parser.add_argument("--predict", action="store_true",
+                        help="extrapolate the cursor ahead by the measured capture-to-injection latency")
+    parser.add_argument("--profile-out", metavar="PATH",
+                        help="on exit, write per-frame stage timings to PATH (.csv or .json)")
+    parser.add_argument("--headless", action="store_true", help="no preview window: skip all drawing and imshow")
+    parser.add_argument("--backend", choices=sorted(BACKENDS), default="pyautogui", help="mouse output backend")
+    parser.add_argument("--async-injection", action="store_true",
+                        help="perform mouse events on a worker thread (moves coalesced, scrolls summed)")
+    parser.add_argument("--upsample", metavar="HZ", type=float, default=0,
+                        help="glide the cursor between frame targets at HZ (e.g. your monitor's refresh rate)")
+    parser.add_argument("--scroll-rate", metavar="HZ", type=float, default=0,
+                        help="emit scroll events at a steady HZ from a ticker thread (default: once per frame)")
+    parser.add_argument("--scroll-momentum", choices=list(FRICTION_CURVES),
+                        help="keep scrolling after the two-finger gesture ends, slowed by this friction curve")
+    parser.add_argument("--scroll-friction", metavar="RATE", type=float, default=4.0,
+                        help="how quickly momentum dies, per second (default 4)")
+    parser.add_argument("--motion-gate", action="store_true",
+                        help="skip hand inference while nothing moves and no hand is tracked")
+    parser.add_argument("--idle-interval", metavar="S", type=float, default=0.5,
+                        help="with --motion-gate, still run inference every S seconds when idle (default 0.5)")
+    parser.add_argument("--budget", metavar="MS", type=float, default=0,
+                        help="adapt model complexity, resolution and confidence to keep frame work under MS")
+    parser.add_argument("--mirror", choices=MIRROR_MODES, default="image",
+                        help="'landmarks' skips the image flip and mirrors landmark x after inference instead")
+    parser.add_argument("--camera-rgb", action="store_true",
+                        help="the capture delivers RGB frames: skip the BGR->RGB conversion")
+    add_source_arguments(parser)
+    parser.add_argument("--tuning", metavar="PATH", default=default_profile_path(),
+                        help="parameter profile written by tune_params.py (default: ./tuning_profile.json if present)")
+    parser.add_argument("--absolute", metavar="PATH", nargs="?", const=DEFAULT_CALIBRATION_PATH,
+                        help="absolute pointing over all monitors; calibrates and saves to PATH on first use "
+                             f"(default {DEFAULT_CALIBRATION_PATH})")
+    parser.add_argument("--two-hands", metavar="HAND", nargs="?", const="Right", choices=["Right", "Left"],
+                        help="track both hands: HAND (default Right) moves the cursor, the other holds "
+                             "shift (pinch) / ctrl (pinky) and scrolls")
+    parser.add_argument("--gesture-model", metavar="PATH",
+                        help="classify gestures with a nearest-neighbour index built by gesture_classifier.py")
+    parser.add_argument("--pipeline", action="store_true",
+                        help="run capture and inference in separate processes (higher FPS on multi-core CPUs)")
+    parser.add_argument("--subscribe", metavar="NAME", nargs="?", const=DEFAULT_SERVICE_NAME,
+                        help="read landmarks from a running landmark_service.py instead of the camera")
+    return parser.parse_args()
 
 if __name__ == "__main__":
-    try: HandController().run()
+    args = parse_args()
+    try:
+        HandController(record_path=args.record, output=args.backend, roi_size=args.roi,
+                       cursor_filter=make_filter(args.filter), predict=args.predict,
+                       profile_path=args.profile_out, headless=args.headless,
+                       mirror=args.mirror, camera_rgb=args.camera_rgb,
+                       async_injection=args.async_injection, upsample_hz=args.upsample,
+                       scroll_rate_hz=args.scroll_rate, scroll_momentum=args.scroll_momentum,
+                       scroll_friction=args.scroll_friction,
+                       motion_gate=args.motion_gate, idle_interval=args.idle_interval,
+                       frame_budget_ms=args.budget, subscribe=args.subscribe,
+                       pipeline=args.pipeline, frame_source=args.source, source_rate=args.source_rate,
+                       fourcc=args.fourcc, gesture_model=args.gesture_model,
+                       tuning=args.tuning, absolute=args.absolute, two_hands=args.two_hands).run()
     except Exception: input()
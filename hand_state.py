@@ -0,0 +1,138 @@
+"""
+Per-Hand Tracking State
+Everything the controller remembers about one hand between frames, in a
+fixed __slots__ layout (no per-instance dict: small, and attribute access is
+a slot lookup), and the tracker that keeps each physical hand on the same
+state object from frame to frame.
+
+MediaPipe's handedness label alone isn't stable enough for that: it flips
+for a frame now and then, and two hands can briefly get the same label. The
+tracker assigns hands to states by how far each hand moved since the state
+last saw it, with the label only as a tie-breaker; a state that hasn't seen
+a hand for `timeout` seconds is matched on the label alone.
+"""
+
+import itertools
+
+from landmark_features import INDEX_MCP, PINKY_MCP, WRIST
+
+HANDEDNESS = ("Right", "Left")
+
+
+class HandState:
+    """Tracking, cursor and click state of one hand"""
+
+    __slots__ = ("label", "center", "last_seen",
+                 "prev_hand_x", "prev_hand_y", "prev_hand_time", "sub_dx", "sub_dy", "curr_dx", "curr_dy",
+                 "abs_x", "abs_y", "abs_target",
+                 "gesture", "is_dragging", "pinch_start_time", "last_right_click", "last_fist_time",
+                 "held_key", "scrolling")
+
+    def __init__(self, label):
+        self.label = label          # "Right" / "Left"
+        self.center = None          # Palm centre (normalized x, y) when last seen
+        self.last_seen = None
+        # Relative cursor tracking (see HandController.move_cursor_relative)
+        self.prev_hand_x = None
+        self.prev_hand_y = None
+        self.prev_hand_time = 0
+        self.sub_dx = 0.0           # Sub-pixel remainder (non-legacy filters)
+        self.sub_dy = 0.0
+        self.curr_dx = 0
+        self.curr_dy = 0
+        # Absolute cursor tracking (see HandController.move_cursor_absolute)
+        self.abs_x = None
+        self.abs_y = None
+        self.abs_target = None
+        # Gesture timing
+        self.gesture = None         # GestureState of the last frame it was seen in
+        self.is_dragging = False
+        self.pinch_start_time = 0
+        # Never: a clock that starts at 0 (offline replay) mustn't see a fist or click at t=0
+        self.last_right_click = float("-inf")
+        self.last_fist_time = float("-inf")
+        # Modifier hand (two-hand mode)
+        self.held_key = None
+        self.scrolling = False
+
+
+def palm_center(points):
+    """Mean of wrist, index MCP and pinky MCP: steadier than any single landmark while fingers move"""
+    x = (points[WRIST, 0] + points[INDEX_MCP, 0] + points[PINKY_MCP, 0]) / 3.0
+    y = (points[WRIST, 1] + points[INDEX_MCP, 1] + points[PINKY_MCP, 1]) / 3.0
+    return float(x), float(y)
+
+
+class HandTracker:
+    """Keeps one HandState per handedness and matches each frame's hands to them"""
+
+    def __init__(self, dominant="Right", max_jump=0.2, timeout=0.5):
+        self.dominant = dominant
+        self.states = {label: HandState(label) for label in HANDEDNESS}
+        self.max_jump = max_jump  # Normalized palm movement per frame beyond which position says nothing
+        self.timeout = timeout    # Seconds after which a state's last position is forgotten
+        self.relabeled = 0        # Hands whose MediaPipe label was overruled by position
+
+    @property
+    def dominant_state(self):
+        return self.states[self.dominant]
+
+    def _cost(self, state, center, label, now):
+        if state.center is not None and now - state.last_seen < self.timeout:
+            cost = min(((center[0] - state.center[0]) ** 2 + (center[1] - state.center[1]) ** 2) ** 0.5,
+                       self.max_jump)
+        else:
+            cost = self.max_jump
+        if label != state.label:
+            cost += self.max_jump / 2
+        # Last resort when labels agree and there is no history: the right hand is on the right
+        # of the (mirrored) image
+        return cost + 0.01 * (1.0 - center[0] if state.label == "Right" else center[0])
+
+    def assign(self, hands, labels, now):
+        """hands: (21, 3) arrays; labels: MediaPipe handedness per hand. Returns [(HandState, points)]."""
+        hands = hands[:len(self.states)]
+        centers = [palm_center(points) for points in hands]
+        best, best_cost = None, float("inf")
+        for states in itertools.permutations(self.states.values(), len(hands)):
+            cost = sum(self._cost(s, c, l, now) for s, c, l in zip(states, centers, labels))
+            if cost < best_cost:
+                best, best_cost = states, cost
+        for state, center, label in zip(best, centers, labels):
+            state.center = center
+            state.last_seen = now
+            if label != state.label:
+                self.relabeled += 1
+        return list(zip(best, hands))
+
+
+class HandCountStats:
+    """Inference time split by how many hands were in view: the price of the second hand"""
+
+    def __init__(self):
+        self.frames = {}  # hand count -> [frames, total seconds]
+
+    def add(self, hands, seconds):
+        entry = self.frames.setdefault(hands, [0, 0.0])
+        entry[0] += 1
+        entry[1] += seconds
+
+    def mean(self, hands):
+        frames, total = self.frames.get(hands, (0, 0.0))
+        return total / frames if frames else None
+
+    def summary(self):
+        lines = [f"{hands} hand{'s' if hands != 1 else ''} in view: {frames} frames, "
+                 f"inference {total / frames * 1000:.1f} ms mean"
+                 for hands, (frames, total) in sorted(self.frames.items())]
+        one, two = self.mean(1), self.mean(2)
+        if one is not None and two is not None:
+            lines.append(f"second hand costs {(two - one) * 1000:+.1f} ms per frame")
+        return lines
+
+
+def handedness_labels(multi_handedness, count):
+    """MediaPipe multi_handedness -> one label per hand (None where missing)"""
+    if not multi_handedness:
+        return [None] * count
+    return [h.classification[0].label for h in multi_handedness][:count]
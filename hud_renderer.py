@@ -0,0 +1,148 @@
+"""
+Sci-Fi HUD Renderer for the Hand Controller preview
+Batched drawing: connection index arrays are precomputed, pixel coordinates
+are computed once per frame with NumPy, the skeleton is a single
+cv2.polylines call, and static text / gaming-mode corner brackets are
+pre-rendered once per (frame size, mode) and blended in as small patches.
+"""
+
+import cv2
+import numpy as np
+
+# COLORS (BGR)
+CYAN = (255, 255, 0)
+MAGENTA = (255, 0, 255)
+NEON_GREEN = (50, 255, 50)
+RED = (0, 0, 255)
+WHITE = (255, 255, 255)
+BLACK = (0, 0, 0)
+
+INDEX_TIP = 8
+WRIST = 0
+
+# Reticle arms around the target, relative to its centre
+_RETICLE = np.array([
+    [[-12, 0], [-4, 0]], [[4, 0], [12, 0]],
+    [[0, -12], [0, -4]], [[0, 4], [0, 12]],
+], dtype=np.int32)
+
+
+class HudRenderer:
+    """Draws the hand exoskeleton and the info overlay onto BGR frames"""
+
+    def __init__(self, connections):
+        conn = np.array(sorted(connections), dtype=np.intp)
+        self.conn_start = conn[:, 0]
+        self.conn_end = conn[:, 1]
+        self._static_layers = {}  # (w, h, gaming_mode) -> [(x, y, patch, alpha), ...]
+
+    @staticmethod
+    def pixel_points(points, w, h):
+        """(21, 3) normalized landmarks -> (21, 2) int32 pixel coordinates"""
+        return (points[:, :2] * (w, h)).astype(np.int32)
+
+    def draw_hand(self, frame, points, reticle_color, flash_age=None, drag_progress=None):
+        """
+        points: (21, 3) normalized landmarks
+        flash_age: seconds since the last click (draws the pulse ring), or None
+        drag_progress: 0..1 of the drag delay (draws the loading arc), or None
+        """
+        h, w = frame.shape[:2]
+        px = self.pixel_points(points, w, h)
+
+        # 1. EXOSKELETON: every connection in one call
+        segments = np.stack((px[self.conn_start], px[self.conn_end]), axis=1)
+        cv2.polylines(frame, segments, False, CYAN, 1, cv2.LINE_AA)
+
+        # 2. JOINTS (Tech Nodes)
+        for cx, cy in px.tolist():
+            cv2.circle(frame, (cx, cy), 3, BLACK, -1)  # Black hole
+            cv2.circle(frame, (cx, cy), 3, CYAN, 1)    # Cyan rim
+
+        # 3. CURSOR TARGET (Index Finger Top)
+        ix, iy = px[INDEX_TIP].tolist()
+        cv2.circle(frame, (ix, iy), 8, reticle_color, 1, cv2.LINE_AA)
+        cv2.polylines(frame, _RETICLE + px[INDEX_TIP], False, reticle_color, 1)
+
+        # 4. CLICK FLASH (Pulse)
+        if flash_age is not None:
+            radius = int(flash_age * 300) + 10
+            cv2.circle(frame, (ix, iy), radius, WHITE, 2)
+
+        # 5. DRAG LOADING BAR
+        if drag_progress is not None:
+            wx, wy = px[WRIST].tolist()
+            center = ((ix + wx) // 2, (iy + wy) // 2)
+            cv2.ellipse(frame, center, (30, 30), 0, 0, int(360 * drag_progress), MAGENTA, 2)
+
+    def draw_overlay(self, frame, state_name, gaming_mode):
+        self.blit_static(frame, gaming_mode)
+
+        # STATE BOX (the only per-frame text)
+        cv2.putText(frame, state_name, (20, 50), cv2.FONT_HERSHEY_SIMPLEX, 1.0, (0, 255, 0), 2)
+
+    def blit_static(self, frame, gaming_mode):
+        """Copy the cached static patches onto the frame (rendered on first use for this size and mode)"""
+        h, w = frame.shape[:2]
+        for x, y, patch, alpha in self._static_layer(w, h, gaming_mode):
+            ph, pw = patch.shape[:2]
+            roi = frame[y:y + ph, x:x + pw]
+            if isinstance(alpha, np.ndarray):
+                cv2.copyTo(patch, alpha, roi)
+            else:
+                # Anti-aliased edges: per-pixel alpha blend in one call
+                roi[:] = cv2.blendLinear(roi, patch, alpha[0], alpha[1])
+
+    def _static_layer(self, w, h, gaming_mode):
+        key = (w, h, gaming_mode)
+        if key not in self._static_layers:
+            self._static_layers[key] = self._render_static(w, h, gaming_mode)
+        return self._static_layers[key]
+
+    @staticmethod
+    def _static_items(w, h, gaming_mode):
+        """Draw calls for the static overlay, one per item (each becomes one patch)"""
+        items = []
+
+        # HUD BORDERS in Gaming Mode
+        if gaming_mode:
+            color, thick, len_line = RED, 3, 50
+            for (cx, cy), sx, sy in [((0, 0), 1, 1), ((w, 0), -1, 1), ((0, h), 1, -1), ((w, h), -1, -1)]:
+                def corner(canvas, cx=cx, cy=cy, sx=sx, sy=sy):
+                    cv2.line(canvas, (cx, cy), (cx + sx * len_line, cy), color, thick)
+                    cv2.line(canvas, (cx, cy), (cx, cy + sy * len_line), color, thick)
+                items.append(corner)
+            items.append(lambda canvas: cv2.putText(canvas, "COMBAT MODE ACTIVE", (w // 2 - 150, 30),
+                                                    cv2.FONT_HERSHEY_SIMPLEX, 0.7, color, 2))
+
+        # Instructions
+        items.append(lambda canvas: cv2.putText(canvas, "'G': Game Mode | FIST: Pause | PINCH: Click", (20, h - 20),
+                                                cv2.FONT_HERSHEY_PLAIN, 1.2, (200, 200, 200), 1))
+        return items
+
+    def _render_static(self, w, h, gaming_mode):
+        """
+        Render each static item once and keep only its bounding-box patch.
+        Drawing on black and on white recovers per-pixel alpha, in case the
+        OpenCV build anti-aliases text.
+        """
+        patches = []
+        for draw in self._static_items(w, h, gaming_mode):
+            black = np.zeros((h, w, 3), dtype=np.uint8)
+            white = np.full((h, w, 3), 255, dtype=np.uint8)
+            draw(black)
+            draw(white)
+            alpha = 1.0 - (white.astype(np.float32) - black).max(axis=2) / 255.0
+            x, y, pw, ph = cv2.boundingRect((alpha > 0).astype(np.uint8))
+            if not pw or not ph:
+                continue
+            a = alpha[y:y + ph, x:x + pw]
+            premultiplied = black[y:y + ph, x:x + pw]
+            if np.all((a == 0) | (a == 1)):
+                patches.append((x, y, premultiplied.copy(), (a == 1).astype(np.uint8)))
+            else:
+                # Un-premultiply for blendLinear: weights are (1 - alpha, alpha)
+                color = np.where(a[..., None] > 0, premultiplied / np.maximum(a[..., None], 1e-6), 0)
+                weights = (np.ascontiguousarray(1.0 - a), np.ascontiguousarray(a))
+                patches.append((x, y, np.clip(color + 0.5, 0, 255).astype(np.uint8), weights))
+        return patches
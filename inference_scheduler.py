@@ -0,0 +1,119 @@
+"""
+Motion-Gated Inference Scheduler
+Before each MediaPipe call, a downscaled grayscale frame difference checks
+whether anything in view moved. With no motion and no tracked hand, inference
+drops to a low duty cycle (one call every `idle_interval` seconds, so a hand
+that appears perfectly still is still found). As soon as motion appears or a
+hand is tracked, the very next frame is inferred again.
+
+Also keeps per-second load counters (process CPU time, inferences, frames)
+so idle cost can be compared with and without gating.
+"""
+
+import time
+
+import cv2
+import numpy as np
+
+from frame_preprocess import FrameBuffers
+
+
+class LoadCounters:
+    """CPU seconds per wall second and inferences per second, over ~1 s windows"""
+
+    def __init__(self, window=1.0, clock=time.perf_counter, cpu_clock=time.process_time):
+        self.window = window
+        self.clock = clock
+        self.cpu_clock = cpu_clock
+        self._start = clock()
+        self._cpu_start = cpu_clock()
+        self._frames = 0
+        self._inferences = 0
+
+        self.cpu_per_second = 0.0         # All threads of the process, so MediaPipe's workers count
+        self.inferences_per_second = 0.0
+        self.frames_per_second = 0.0
+
+    def note_frame(self, inferred):
+        self._frames += 1
+        self._inferences += inferred
+        now = self.clock()
+        elapsed = now - self._start
+        if elapsed < self.window:
+            return
+        cpu = self.cpu_clock()
+        self.cpu_per_second = (cpu - self._cpu_start) / elapsed
+        self.inferences_per_second = self._inferences / elapsed
+        self.frames_per_second = self._frames / elapsed
+        self._start, self._cpu_start = now, cpu
+        self._frames = self._inferences = 0
+
+
+class InferenceScheduler:
+    """Decides per frame whether to run hand inference"""
+
+    def __init__(self, enabled=True, idle_interval=0.5, small_size=(80, 45), pixel_threshold=12,
+                 motion_fraction=0.002, clock=time.perf_counter):
+        self.enabled = enabled
+        self.idle_interval = idle_interval      # Seconds between idle inferences
+        self.small_size = small_size            # Motion check resolution (w, h)
+        self.pixel_threshold = pixel_threshold  # Gray-level change that counts as motion
+        self.motion_fraction = motion_fraction  # Fraction of changed pixels that counts as motion
+        self.clock = clock
+
+        self.buffers = FrameBuffers()
+        self._prev = None          # Previous small gray frame
+        self._flip = False         # Which of the two gray buffers is current
+        self.hand_tracked = False
+        self.last_inference = None
+        self.counters = LoadCounters(clock=clock)
+
+        # STATS
+        self.inferences = 0
+        self.skipped = 0
+        self.motion_frames = 0
+
+    def motion(self, frame):
+        """True when the downscaled frame differs enough from the previous one"""
+        w, h = self.small_size
+        small = cv2.resize(frame, (w, h), dst=self.buffers.get("small", (h, w, frame.shape[2])),
+                           interpolation=cv2.INTER_LINEAR)
+        self._flip = not self._flip
+        gray = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY, dst=self.buffers.get(f"gray{int(self._flip)}", (h, w)))
+        prev, self._prev = self._prev, gray
+        if prev is None:
+            return True
+        diff = cv2.absdiff(gray, prev, dst=self.buffers.get("diff", (h, w)))
+        changed = np.count_nonzero(diff > self.pixel_threshold)
+        return changed > self.motion_fraction * w * h
+
+    def should_infer(self, frame):
+        """Call once per frame before inference, then record() what happened"""
+        if not self.enabled:
+            return True
+        moving = self.motion(frame)
+        self.motion_frames += moving
+        now = self.clock()
+        if moving or self.hand_tracked or self.last_inference is None:
+            return True
+        return now - self.last_inference >= self.idle_interval
+
+    def record(self, inferred, hand_found=False):
+        """Result of this frame: whether inference ran and whether it found a hand"""
+        if inferred:
+            self.inferences += 1
+            self.hand_tracked = hand_found
+            self.last_inference = self.clock()
+        else:
+            self.skipped += 1
+        self.counters.note_frame(inferred)
+
+    def summary(self):
+        c = self.counters
+        total = self.inferences + self.skipped
+        return [
+            f"inferences={self.inferences} skipped={self.skipped} of {total} frames "
+            f"(motion on {self.motion_frames})",
+            f"last second: {c.inferences_per_second:.1f} inferences/s, {c.frames_per_second:.1f} frames/s, "
+            f"CPU {c.cpu_per_second:.2f} s/s",
+        ]
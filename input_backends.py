@@ -0,0 +1,347 @@
+"""
+Input Injection Backends for the Hand Controller
+All mouse output goes through an OutputBackend, so the controller can switch
+between pyautogui, direct XTest injection on Linux, and a null/recording
+backend for tests and replay. Every backend times its own calls. Any backend
+can be moved off the vision thread with async_injection.AsyncInjector.
+"""
+
+import sys
+import threading
+import time
+
+
+class InjectionStats:
+    """
+    Per-operation call count and time spent injecting. Several threads can
+    inject through one backend (the vision loop, the cursor upsampler, the
+    scroll ticker), so updates are locked and time is also kept per thread:
+    the vision loop charges only its own calls to a frame.
+    """
+
+    def __init__(self):
+        self.ops = {}  # op name -> [calls, total seconds, worst seconds]
+        self.total_time = 0.0
+        self._per_thread = {}  # thread ident -> seconds
+        self._lock = threading.Lock()
+
+    def add(self, op, seconds):
+        thread = threading.get_ident()
+        with self._lock:
+            self.total_time += seconds
+            self._per_thread[thread] = self._per_thread.get(thread, 0.0) + seconds
+            entry = self.ops.get(op)
+            if entry is None:
+                self.ops[op] = [1, seconds, seconds]
+            else:
+                entry[0] += 1
+                entry[1] += seconds
+                if seconds > entry[2]:
+                    entry[2] = seconds
+
+    def thread_time(self):
+        """Seconds spent injecting from the calling thread"""
+        return self._per_thread.get(threading.get_ident(), 0.0)
+
+    def summary(self):
+        with self._lock:
+            ops = sorted((op, tuple(entry)) for op, entry in self.ops.items())
+        lines = []
+        for op, (calls, total, worst) in ops:
+            mean_us = total / calls * 1e6
+            lines.append(f"{op:12} calls={calls:6}  mean={mean_us:8.1f}us  max={worst * 1e6:8.1f}us")
+        return lines
+
+
+class OutputBackend:
+    """Base class: public methods time the call and delegate to the _do_* primitives"""
+
+    name = "base"
+
+    def __init__(self):
+        self.stats = InjectionStats()
+
+    def _timed(self, op, func, *args):
+        start = time.perf_counter()
+        func(*args)
+        self.stats.add(op, time.perf_counter() - start)
+
+    # Queries (not per-frame: the controller keeps its own cursor model)
+    def screen_size(self):
+        raise NotImplementedError
+
+    def cursor_position(self):
+        raise NotImplementedError
+
+    def virtual_desktop(self):
+        """(left, top, width, height) of the area spanning every monitor; the primary screen by default"""
+        return (0, 0) + tuple(self.screen_size())
+
+    # Actions
+    def move_to(self, x, y):
+        self._timed("move_to", self._do_move_to, x, y)
+
+    def mouse_down(self):
+        self._timed("mouse_down", self._do_mouse_down)
+
+    def mouse_up(self):
+        self._timed("mouse_up", self._do_mouse_up)
+
+    def click(self):
+        self._timed("click", self._do_click)
+
+    def right_click(self):
+        self._timed("right_click", self._do_right_click)
+
+    def scroll(self, amount):
+        self._timed("scroll", self._do_scroll, amount)
+
+    def key_down(self, key):
+        """Hold a modifier key: 'shift', 'ctrl' or 'alt'"""
+        self._timed("key_down", self._do_key_down, key)
+
+    def key_up(self, key):
+        self._timed("key_up", self._do_key_up, key)
+
+    def pending_delay(self):
+        """Seconds from an action returning to it reaching the OS (0 when actions are synchronous)"""
+        return 0.0
+
+    def report(self):
+        return self.stats.summary()
+
+    def close(self):
+        pass
+
+
+class PyAutoGUIBackend(OutputBackend):
+    """
+    Cross-platform backend using pyautogui (the original behaviour).
+    whole_desktop=True (absolute pointing) makes it address every monitor:
+    on Windows the process becomes per-monitor DPI aware and moves go
+    straight to SetCursorPos, since pyautogui only knows the primary screen.
+    """
+
+    name = "pyautogui"
+
+    def __init__(self, whole_desktop=False):
+        super().__init__()
+        import pyautogui
+        # Disable PyAutoGUI fail-safe and pauses
+        pyautogui.FAILSAFE = False
+        pyautogui.PAUSE = 0
+        self.pyautogui = pyautogui
+        self._user32 = None
+        if whole_desktop and sys.platform == "win32":
+            # Physical pixels on every monitor, so mixed-DPI desktops line up
+            import ctypes
+            try:
+                ctypes.windll.shcore.SetProcessDpiAwareness(2)  # Per-monitor aware
+            except (AttributeError, OSError):
+                ctypes.windll.user32.SetProcessDPIAware()
+            self._user32 = ctypes.windll.user32
+
+    def screen_size(self):
+        return tuple(self.pyautogui.size())
+
+    def cursor_position(self):
+        return tuple(self.pyautogui.position())
+
+    def virtual_desktop(self):
+        if self._user32 is None:
+            return super().virtual_desktop()
+        # SM_XVIRTUALSCREEN, SM_YVIRTUALSCREEN, SM_CXVIRTUALSCREEN, SM_CYVIRTUALSCREEN
+        return tuple(self._user32.GetSystemMetrics(i) for i in (76, 77, 78, 79))
+
+    def _do_move_to(self, x, y):
+        if self._user32 is not None:
+            self._user32.SetCursorPos(int(x), int(y))
+        else:
+            self.pyautogui.moveTo(x, y, _pause=False)
+
+    def _do_mouse_down(self):
+        self.pyautogui.mouseDown()
+
+    def _do_mouse_up(self):
+        self.pyautogui.mouseUp()
+
+    def _do_click(self):
+        self.pyautogui.click()
+
+    def _do_right_click(self):
+        self.pyautogui.rightClick()
+
+    def _do_scroll(self, amount):
+        self.pyautogui.scroll(amount)
+
+    def _do_key_down(self, key):
+        self.pyautogui.keyDown(key)
+
+    def _do_key_up(self, key):
+        self.pyautogui.keyUp(key)
+
+
+class XTestBackend(OutputBackend):
+    """
+    Linux backend that injects through the XTest extension directly.
+    Motion is sent in absolute root-window coordinates (relative motion would
+    go through the server's pointer acceleration and drift from our cursor
+    model) and requests are flushed without waiting for a reply, so a cursor
+    move costs one write to the X socket.
+    """
+
+    name = "xtest"
+
+    # X button numbers
+    LEFT = 1
+    RIGHT = 3
+    WHEEL_UP = 4
+    WHEEL_DOWN = 5
+
+    KEYSYMS = {"shift": "Shift_L", "ctrl": "Control_L", "alt": "Alt_L"}
+
+    def __init__(self, display_name=None):
+        super().__init__()
+        from Xlib import X, XK, display
+        from Xlib.ext import xtest
+        self.X = X
+        self.XK = XK
+        self.xtest = xtest
+        self.display = display.Display(display_name)
+        if not self.display.has_extension("XTEST"):
+            raise RuntimeError("X server has no XTEST extension")
+        self._root = self.display.screen().root
+        self._last_x, self._last_y = self.cursor_position()
+
+    def screen_size(self):
+        # The root window spans every monitor of the X screen (RandR / Xinerama), so this is
+        # also the virtual desktop
+        screen = self.display.screen()
+        return screen.width_in_pixels, screen.height_in_pixels
+
+    def cursor_position(self):
+        pointer = self._root.query_pointer()
+        self._last_x, self._last_y = pointer.root_x, pointer.root_y
+        return self._last_x, self._last_y
+
+    def _fake(self, event_type, detail=0, x=0, y=0, root=0):
+        self.xtest.fake_input(self.display, event_type, detail=detail, root=root, x=x, y=y)
+
+    def _button(self, button):
+        self._fake(self.X.ButtonPress, button)
+        self._fake(self.X.ButtonRelease, button)
+
+    def _do_move_to(self, x, y):
+        if (x, y) != (self._last_x, self._last_y):
+            # detail=0 -> absolute motion: lands exactly on (x, y), whatever the acceleration profile
+            self._fake(self.X.MotionNotify, 0, int(x), int(y), self._root)
+            self.display.flush()
+            self._last_x, self._last_y = x, y
+
+    def _do_mouse_down(self):
+        self._fake(self.X.ButtonPress, self.LEFT)
+        self.display.flush()
+
+    def _do_mouse_up(self):
+        self._fake(self.X.ButtonRelease, self.LEFT)
+        self.display.flush()
+
+    def _do_click(self):
+        self._button(self.LEFT)
+        self.display.flush()
+
+    def _do_right_click(self):
+        self._button(self.RIGHT)
+        self.display.flush()
+
+    def _do_scroll(self, amount):
+        # Same sign convention as pyautogui: positive scrolls up
+        button = self.WHEEL_UP if amount > 0 else self.WHEEL_DOWN
+        for _ in range(abs(int(amount))):
+            self._button(button)
+        self.display.flush()
+
+    def _keycode(self, key):
+        return self.display.keysym_to_keycode(self.XK.string_to_keysym(self.KEYSYMS[key]))
+
+    def _do_key_down(self, key):
+        self._fake(self.X.KeyPress, self._keycode(key))
+        self.display.flush()
+
+    def _do_key_up(self, key):
+        self._fake(self.X.KeyRelease, self._keycode(key))
+        self.display.flush()
+
+    def close(self):
+        self.display.close()
+
+
+class RecordingBackend(OutputBackend):
+    """Null backend: injects nothing, records every event for tests and replay"""
+
+    name = "null"
+
+    def __init__(self, screen_size=(1920, 1080), clock=time.perf_counter, desktop=None):
+        super().__init__()
+        self.size = tuple(screen_size)
+        self.desktop = tuple(desktop) if desktop else (0, 0) + self.size  # (left, top, width, height)
+        self.clock = clock
+        self.position = (self.size[0] // 2, self.size[1] // 2)
+        self.events = []  # (timestamp, op, args)
+
+    def _record(self, op, *args):
+        self.events.append((self.clock(), op, args))
+
+    def screen_size(self):
+        return self.size
+
+    def cursor_position(self):
+        return self.position
+
+    def virtual_desktop(self):
+        return self.desktop
+
+    def _do_move_to(self, x, y):
+        self.position = (x, y)
+        self._record("move_to", x, y)
+
+    def _do_mouse_down(self):
+        self._record("mouse_down")
+
+    def _do_mouse_up(self):
+        self._record("mouse_up")
+
+    def _do_click(self):
+        self._record("click")
+
+    def _do_right_click(self):
+        self._record("right_click")
+
+    def _do_scroll(self, amount):
+        self._record("scroll", amount)
+
+    def _do_key_down(self, key):
+        self._record("key_down", key)
+
+    def _do_key_up(self, key):
+        self._record("key_up", key)
+
+    def ops(self, *names):
+        """Recorded events filtered to the given op names (all when empty)"""
+        return [e for e in self.events if not names or e[1] in names]
+
+
+BACKENDS = {
+    "pyautogui": PyAutoGUIBackend,
+    "xtest": XTestBackend,
+    "null": RecordingBackend,
+}
+
+
+def make_backend(name, whole_desktop=False):
+    """Build an output backend by name; whole_desktop: it must address every monitor (absolute pointing)"""
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown output backend '{name}' (choose from {', '.join(BACKENDS)})")
+    if whole_desktop and BACKENDS[name] is PyAutoGUIBackend:
+        return PyAutoGUIBackend(whole_desktop=True)
+    return BACKENDS[name]()  # XTest's root window already spans every monitor
@@ -0,0 +1,93 @@
+"""
+Vectorized Landmark Features
+Converts a hand's landmarks to a (21, 3) float32 array once per frame and
+derives finger extension, pinch distance, tracking point and palm scale with
+a few NumPy operations. Every function also accepts an (N, 21, 3) batch, so
+whole recorded sessions can be featurized and classified in one call.
+"""
+
+import collections
+
+import numpy as np
+
+# Landmark indices
+WRIST = 0
+THUMB_IP = 3
+THUMB_TIP = 4
+INDEX_MCP = 5
+INDEX_TIP = 8
+MIDDLE_MCP = 9
+PINKY_MCP = 17
+
+# Tip / reference joint for (thumb, index, middle, ring, pinky).
+# The thumb compares x against its IP joint, the others compare y against their PIP.
+FINGER_TIPS = np.array([4, 8, 12, 16, 20])
+FINGER_JOINTS = np.array([3, 6, 10, 14, 18])
+
+PINCH_THRESHOLD = 0.05
+FIST_GUARD = 0.5
+
+# Integer codes returned by classify_gestures (same values as GestureState)
+IDLE, MOVING, LEFT_CLICK, RIGHT_CLICK, SCROLLING = range(5)
+GESTURE_NAMES = ("IDLE", "MOVING", "LEFT_CLICK", "RIGHT_CLICK", "SCROLLING")
+
+HandFeatures = collections.namedtuple("HandFeatures", "fingers pinch_dist tracking_point palm_scale")
+
+
+def landmarks_to_array(hand_landmarks):
+    """MediaPipe NormalizedLandmarkList (or anything with .landmark[i].x/y/z) -> (21, 3) float32"""
+    if isinstance(hand_landmarks, np.ndarray):
+        return hand_landmarks
+    return np.array([(lm.x, lm.y, lm.z) for lm in hand_landmarks.landmark], dtype=np.float32)
+
+
+def finger_states(points):
+    """(..., 21, 3) -> (..., 5) bool: which fingers are extended"""
+    tips = points[..., FINGER_TIPS, :2]
+    joints = points[..., FINGER_JOINTS, :2]
+    extended = tips[..., 1] < joints[..., 1]
+    extended[..., 0] = tips[..., 0, 0] < joints[..., 0, 0]
+    return extended
+
+
+def pinch_distance(points):
+    """(..., 21, 3) -> (...,) thumb tip to index tip distance in normalized image units"""
+    return np.linalg.norm(points[..., THUMB_TIP, :2] - points[..., INDEX_TIP, :2], axis=-1)
+
+
+def extract_features(points):
+    """(21, 3) or (N, 21, 3) -> HandFeatures with matching leading shape"""
+    points = np.asarray(points, dtype=np.float32)
+    return HandFeatures(
+        fingers=finger_states(points),
+        pinch_dist=pinch_distance(points),
+        tracking_point=points[..., INDEX_MCP, :2],
+        palm_scale=np.linalg.norm(points[..., MIDDLE_MCP, :2] - points[..., WRIST, :2], axis=-1),
+    )
+
+
+def classify_gestures(features, timestamps=None, pinch_threshold=PINCH_THRESHOLD, fist_guard=FIST_GUARD):
+    """
+    Apply HandController.detect_gesture's rules to a whole batch at once.
+    With timestamps the post-fist transition guard is applied as well.
+    Returns an int array of GestureState values.
+    """
+    fingers = np.atleast_2d(features.fingers)
+    index, middle, ring, pinky = fingers[:, 1], fingers[:, 2], fingers[:, 3], fingers[:, 4]
+
+    fist = ~index & ~middle & ~ring & ~pinky
+    if timestamps is None:
+        guard = np.zeros_like(fist)
+    else:
+        timestamps = np.asarray(timestamps, dtype=np.float64)
+        last_fist = np.maximum.accumulate(np.where(fist, timestamps, -np.inf))
+        guard = (timestamps - last_fist) < fist_guard
+    right_click = pinky & ~middle & ~ring
+    scroll = index & middle & ~ring
+    pinch = np.atleast_1d(features.pinch_dist) < pinch_threshold
+
+    return np.select(
+        [fist, guard, right_click, scroll, pinch],
+        [IDLE, MOVING, RIGHT_CLICK, SCROLLING, LEFT_CLICK],
+        default=MOVING,
+    )
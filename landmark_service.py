@@ -0,0 +1,419 @@
+"""
+Shared-Memory Landmark Service
+One tracking daemon owns the camera and the MediaPipe model and publishes
+every processed frame into a shared-memory ring; any number of consumers
+(hand_controller.py --subscribe, demo_practice.py --subscribe) read from it
+for the cost of a memcpy instead of running inference again.
+
+Segment layout (all little-endian, numpy views on one SharedMemory block):
+    header       magic, version, capacities, preview size, write seq, closed
+    landmarks    `capacity` slots: seq_start, SESSION_DTYPE record, seq_end
+    previews     `frame_slots` slots of the mirrored BGR preview (optional)
+
+Each slot is a seqlock: the writer stamps seq_start, writes, then stamps
+seq_end; a reader accepts its copy only if seq_end matched before copying
+and seq_start still matches afterwards. Sequence numbers start at 1.
+
+    python landmark_service.py                      # camera -> shared memory
+    python landmark_service.py --replay rec.lmk     # recorded session, no camera
+"""
+
+import argparse
+import signal
+import time
+from multiprocessing import shared_memory
+from types import SimpleNamespace
+
+import numpy as np
+
+from session_replay import HAND_LEFT, HAND_RIGHT, HANDEDNESS_CODES, MAX_HANDS, SESSION_DTYPE, ReplayLandmarks
+
+DEFAULT_NAME = "hpmc_landmarks"
+MAGIC = b"HPMCSHM1"
+VERSION = 1
+
+HEADER_DTYPE = np.dtype([
+    ("magic", "S8"),
+    ("version", "<u4"),
+    ("capacity", "<u4"),
+    ("frame_slots", "<u4"),
+    ("frame_height", "<u4"),
+    ("frame_width", "<u4"),
+    ("write_seq", "<u8"),
+    ("closed", "u1"),
+])
+
+SLOT_DTYPE = np.dtype([
+    ("seq_start", "<u8"),
+    ("record", SESSION_DTYPE),
+    ("seq_end", "<u8"),
+])
+
+_LABELS = {HAND_LEFT: "Left", HAND_RIGHT: "Right"}
+
+# Segments created by this process (its resource tracker owns them)
+_published = set()
+
+
+def write_record(rec, timestamp, multi_hand_landmarks, multi_handedness=None):
+    """Fill a SESSION_DTYPE record from MediaPipe-style results (landmark lists or (21, 3) arrays)"""
+    rec["timestamp"] = timestamp
+    hands = list(multi_hand_landmarks or [])[:MAX_HANDS]
+    rec["num_hands"] = len(hands)
+    rec["handedness"] = 0
+    for i, marks in enumerate(hands):
+        if isinstance(marks, np.ndarray):
+            rec["landmarks"][i] = marks
+        else:
+            rec["landmarks"][i] = [(lm.x, lm.y, lm.z) for lm in marks.landmark]
+        if multi_handedness and i < len(multi_handedness):
+            rec["handedness"][i] = HANDEDNESS_CODES.get(multi_handedness[i].classification[0].label, 0)
+
+
+def record_results(record, wrap=ReplayLandmarks, results=None):
+    """SESSION_DTYPE record -> MediaPipe-style results (multi_hand_landmarks / multi_handedness)"""
+    if results is None:
+        results = SimpleNamespace()
+    n = int(record["num_hands"])
+    if n:
+        results.multi_hand_landmarks = [wrap(record["landmarks"][i].copy()) for i in range(n)]
+        results.multi_handedness = [
+            SimpleNamespace(classification=[SimpleNamespace(label=_LABELS.get(int(code), "Unknown"))])
+            for code in record["handedness"][:n]
+        ]
+    else:
+        results.multi_hand_landmarks = results.multi_handedness = None
+    return results
+
+
+def _align(n, to=64):
+    return (n + to - 1) // to * to
+
+
+def _layout(capacity, frame_slots, frame_height, frame_width):
+    """Byte offsets of (slots, frame seqs, frames) and the total size"""
+    slots = _align(HEADER_DTYPE.itemsize)
+    frame_seqs = _align(slots + capacity * SLOT_DTYPE.itemsize)
+    frames = _align(frame_seqs + frame_slots * 16)
+    return slots, frame_seqs, frames, frames + frame_slots * frame_height * frame_width * 3
+
+
+class _Segment:
+    """numpy views on a landmark segment"""
+
+    def __init__(self, shm, capacity, frame_slots, frame_height, frame_width):
+        self.shm = shm
+        buf = shm.buf
+        slots, frame_seqs, frames, _ = _layout(capacity, frame_slots, frame_height, frame_width)
+        self.header = np.ndarray((), dtype=HEADER_DTYPE, buffer=buf)
+        self.slots = np.ndarray((capacity,), dtype=SLOT_DTYPE, buffer=buf, offset=slots)
+        self.frame_seqs = np.ndarray((frame_slots, 2), dtype="<u8", buffer=buf, offset=frame_seqs)
+        self.frames = np.ndarray((frame_slots, frame_height, frame_width, 3), dtype=np.uint8,
+                                 buffer=buf, offset=frames)
+
+    def release(self):
+        # Views must go before the mapping can be closed
+        self.header = self.slots = self.frame_seqs = self.frames = None
+        self.shm.close()
+
+
+class LandmarkPublisher:
+    """Creates the segment and writes one record (and optionally a preview) per frame"""
+
+    def __init__(self, name=DEFAULT_NAME, capacity=64, preview_size=(640, 360), frame_slots=4):
+        width, height = preview_size if preview_size else (0, 0)
+        frame_slots = frame_slots if preview_size else 0
+        size = _layout(capacity, frame_slots, height, width)[3]
+        try:
+            shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        except FileExistsError:
+            # Left over from a daemon that didn't shut down cleanly
+            stale = shared_memory.SharedMemory(name=name)
+            stale.close()
+            stale.unlink()
+            shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        self.name = name
+        _published.add(name)
+        self.segment = _Segment(shm, capacity, frame_slots, height, width)
+        header = self.segment.header
+        header["magic"] = MAGIC
+        header["version"] = VERSION
+        header["capacity"] = capacity
+        header["frame_slots"] = frame_slots
+        header["frame_height"] = height
+        header["frame_width"] = width
+        header["write_seq"] = 0
+        header["closed"] = 0
+        self.seq = 0
+
+    def publish(self, timestamp, multi_hand_landmarks, multi_handedness=None, preview=None):
+        """
+        timestamp: perf_counter() at capture (comparable across processes on the same machine)
+        multi_hand_landmarks: MediaPipe landmark lists or (21, 3) arrays, or None
+        preview: mirrored BGR frame already at the preview size, or None
+        """
+        seg = self.segment
+        seq = self.seq + 1
+        slot = seg.slots[seq % len(seg.slots)]
+        slot["seq_start"] = seq
+        write_record(slot["record"], timestamp, multi_hand_landmarks, multi_handedness)
+        slot["seq_end"] = seq
+
+        if preview is not None and len(seg.frames):
+            i = seq % len(seg.frames)
+            seg.frame_seqs[i, 0] = seq
+            seg.frames[i] = preview
+            seg.frame_seqs[i, 1] = seq
+
+        seg.header["write_seq"] = seq
+        self.seq = seq
+
+    @property
+    def preview_size(self):
+        header = self.segment.header
+        return int(header["frame_width"]), int(header["frame_height"])
+
+    def close(self):
+        self.segment.header["closed"] = 1
+        shm = self.segment.shm
+        self.segment.release()
+        shm.unlink()
+        _published.discard(self.name)
+
+
+def attach_shared_memory(name):
+    """Open an existing segment without letting this process's resource tracker delete it"""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)  # Python 3.13+
+    except TypeError:
+        shm = shared_memory.SharedMemory(name=name)
+        if name in _published:
+            return shm
+        try:
+            from multiprocessing import resource_tracker
+            resource_tracker.unregister(shm._name, "shared_memory")
+        except Exception:
+            pass
+        return shm
+
+
+class LandmarkSubscriber:
+    """Reads the newest published record (and preview) from a running service"""
+
+    def __init__(self, name=DEFAULT_NAME):
+        shm = attach_shared_memory(name)
+        header = np.ndarray((), dtype=HEADER_DTYPE, buffer=shm.buf)
+        if bytes(header["magic"]) != MAGIC or int(header["version"]) != VERSION:
+            shm.close()
+            raise ValueError(f"shared memory '{name}' is not a v{VERSION} landmark service")
+        self.segment = _Segment(shm, int(header["capacity"]), int(header["frame_slots"]),
+                                int(header["frame_height"]), int(header["frame_width"]))
+        del header
+        seg = self.segment
+        self._record = np.zeros((), dtype=SESSION_DTYPE)
+        self._frame = np.zeros(seg.frames.shape[1:], dtype=np.uint8) if len(seg.frames) else None
+        self.seq = int(seg.header["write_seq"])  # Start from "now"
+
+        # STATS
+        self.received = 0
+        self.missed = 0  # Published while we weren't looking (normal for slow consumers)
+        self.torn = 0    # Overwritten while being copied (retried)
+
+    @property
+    def closed(self):
+        return bool(self.segment.header["closed"])
+
+    def latest(self, timeout=1.0, poll=0.001):
+        """
+        Wait for a record newer than the last one returned.
+        Returns (record, preview) copies - preview is None when the service publishes none
+        or it was overwritten - or (None, None) on timeout / service shutdown.
+        """
+        seg = self.segment
+        deadline = time.perf_counter() + timeout
+        while True:
+            seq = int(seg.header["write_seq"])
+            if seq > self.seq:
+                copied = self._copy(seq)
+                if copied is not None:
+                    self.missed += seq - self.seq - 1
+                    self.seq = seq
+                    self.received += 1
+                    return copied
+                self.torn += 1
+                continue
+            if self.closed or time.perf_counter() >= deadline:
+                return None, None
+            time.sleep(poll)
+
+    def _copy(self, seq):
+        seg = self.segment
+        slot = seg.slots[seq % len(seg.slots)]
+        if slot["seq_end"] != seq:
+            return None
+        self._record[()] = slot["record"]
+        if slot["seq_start"] != seq:
+            return None
+
+        frame = None
+        if self._frame is not None:
+            i = seq % len(seg.frames)
+            if seg.frame_seqs[i, 1] == seq:
+                np.copyto(self._frame, seg.frames[i])
+                if seg.frame_seqs[i, 0] == seq:
+                    frame = self._frame
+        return self._record, frame
+
+    def close(self):
+        self.segment.release()
+
+
+class SubscribedSource:
+    """
+    Lets a consumer use the service in place of its camera and its Hands model:
+    read() looks like LatestFrameGrabber.read (returns the preview, or a black
+    canvas), and process() like Hands.process (returns that frame's landmarks).
+    `wrap` turns a (21, 3) array into the landmark type the consumer expects.
+    """
+
+    def __init__(self, name=DEFAULT_NAME, wrap=ReplayLandmarks, canvas_size=(1280, 720)):
+        self.subscriber = LandmarkSubscriber(name)
+        self.wrap = wrap
+        self.canvas = np.zeros((canvas_size[1], canvas_size[0], 3), dtype=np.uint8)
+        self.results = SimpleNamespace(multi_hand_landmarks=None, multi_handedness=None)
+        self.last_frame_time = 0.0
+
+    @property
+    def frames_captured(self):
+        return self.subscriber.received
+
+    @property
+    def frames_dropped(self):
+        return self.subscriber.missed
+
+    def start(self):
+        return self
+
+    def read(self, timeout=1.0):
+        record, preview = self.subscriber.latest(timeout)
+        if record is None:
+            return False, None
+        self.last_frame_time = float(record["timestamp"])
+        record_results(record, self.wrap, self.results)
+        if preview is None:
+            self.canvas.fill(0) # Consumers draw on it
+            return True, self.canvas
+        return True, preview
+
+    def process(self, image):
+        return self.results
+
+    def stop(self):
+        pass
+
+    def close(self):
+        self.subscriber.close()
+
+    release = close # cv2.VideoCapture spelling
+
+
+# ---------------------------------------------------------------------------
+# Daemon
+# ---------------------------------------------------------------------------
+
+def serve_camera(publisher, source=0, stop=None, rate=None, fourcc=None, max_hands=1):
+    """
+    Frames (see frame_sources.py) + MediaPipe -> publisher until the source ends or `stop` is set.
+    max_hands: how many hands MediaPipe tracks (2 for consumers in two-hand mode).
+    """
+    import cv2
+    import mediapipe as mp
+
+    from frame_capture import LatestFrameGrabber
+    from frame_preprocess import FramePreprocessor
+    from frame_sources import open_source
+    from performance_governor import QUALITY_LEVELS
+
+    quality = QUALITY_LEVELS[0]
+    cap = open_source(source, size=(quality.width, quality.height), rate=rate, fourcc=fourcc)
+    hands = mp.solutions.hands.Hands(static_image_mode=False, max_num_hands=max_hands,
+                                     model_complexity=quality.complexity,
+                                     min_detection_confidence=quality.detection,
+                                     min_tracking_confidence=quality.tracking)
+    grabber = LatestFrameGrabber(cap).start()
+    preprocess = FramePreprocessor("image")
+    preview_size = publisher.preview_size
+    preview = np.zeros((preview_size[1], preview_size[0], 3), dtype=np.uint8) if preview_size[0] else None
+    try:
+        while stop is None or not stop.is_set():
+            success, frame = grabber.read()
+            if not success:
+                break
+            frame = preprocess.orient(frame)
+            results = hands.process(preprocess.to_rgb(frame))
+            if preview is not None:
+                cv2.resize(frame, preview_size, dst=preview, interpolation=cv2.INTER_AREA)
+            publisher.publish(grabber.last_frame_time, results.multi_hand_landmarks,
+                              results.multi_handedness, preview)
+    finally:
+        grabber.stop()
+        cap.release()
+        hands.close()
+
+
+def serve_session(publisher, session, loop=False, stop=None):
+    """Publish a recorded session at its recorded pace (stamped with the current time)"""
+    while True:
+        start = time.perf_counter()
+        t0 = float(session["timestamp"][0]) if len(session) else 0.0
+        for rec in session:
+            if stop is not None and stop.is_set():
+                return
+            due = start + float(rec["timestamp"]) - t0
+            delay = due - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            n = int(rec["num_hands"])
+            hands = [np.asarray(rec["landmarks"][i]) for i in range(n)]
+            handedness = [SimpleNamespace(classification=[SimpleNamespace(label=_LABELS.get(int(c), "Unknown"))])
+                          for c in rec["handedness"][:n]]
+            publisher.publish(time.perf_counter(), hands or None, handedness)
+        if not loop:
+            return
+
+
+def main():
+    from frame_sources import add_source_arguments
+    from session_replay import load_session
+
+    parser = argparse.ArgumentParser(description="Publish hand landmarks to shared memory for several consumers")
+    parser.add_argument("--name", default=DEFAULT_NAME, help="shared memory name")
+    add_source_arguments(parser)
+    parser.add_argument("--replay", metavar="SESSION", help="publish a recorded session instead of the camera")
+    parser.add_argument("--loop", action="store_true", help="with --replay, repeat forever")
+    parser.add_argument("--hands", type=int, choices=range(1, MAX_HANDS + 1), default=1,
+                        help="hands to track (2 for consumers running --two-hands)")
+    parser.add_argument("--preview", metavar="WxH", default="640x360",
+                        help="size of the published preview frames, or 'none'")
+    args = parser.parse_args()
+
+    # Stop cleanly (and free the segment) on `kill` too, not only Ctrl+C
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+
+    preview_size = None if args.preview == "none" else tuple(int(v) for v in args.preview.split("x"))
+    publisher = LandmarkPublisher(args.name, preview_size=None if args.replay else preview_size)
+    print(f"Publishing landmarks to shared memory '{args.name}' (Ctrl+C to stop)")
+    try:
+        if args.replay:
+            serve_session(publisher, load_session(args.replay), loop=args.loop)
+        else:
+            serve_camera(publisher, args.source, rate=args.source_rate, fourcc=args.fourcc, max_hands=args.hands)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(f"Published {publisher.seq} frames")
+        publisher.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+"""
+Per-Stage Latency Profiler for the Hand Controller loop
+Each stage's time per frame goes into a preallocated ring buffer with a
+rolling log-scale histogram, so p50/p95/p99 cost O(bins) and nothing is
+allocated per frame. Only the vision loop thread writes, so no locks.
+Also keeps a per-frame log for CSV/JSON export and counts slow frames and
+loop errors (which used to be swallowed silently).
+"""
+
+import csv
+import json
+import math
+import time
+import traceback
+
+import cv2
+import numpy as np
+
+STAGES = ("capture", "preprocess", "inference", "gesture", "injection", "hud", "display")
+
+# Histogram: log-spaced bins from 10 us to ~1.3 s
+_HIST_MIN = 1e-5
+_HIST_BINS = 96
+_HIST_STEP = 1.13  # Each bin is 13% wider than the previous one
+_LOG_STEP = math.log(_HIST_STEP)
+
+
+class StageRing:
+    """Fixed-size ring of samples plus a rolling histogram of the same window"""
+
+    def __init__(self, capacity):
+        self.samples = np.zeros(capacity)
+        self.bins = np.zeros(capacity, dtype=np.int32)
+        self.hist = np.zeros(_HIST_BINS, dtype=np.int64)
+        self.index = 0
+        self.count = 0
+
+    @staticmethod
+    def _bin(seconds):
+        if seconds <= _HIST_MIN:
+            return 0
+        return min(int(math.log(seconds / _HIST_MIN) / _LOG_STEP) + 1, _HIST_BINS - 1)
+
+    def push(self, seconds):
+        i = self.index
+        if self.count == len(self.samples):
+            self.hist[self.bins[i]] -= 1  # Evict the oldest sample from the histogram
+        else:
+            self.count += 1
+        b = self._bin(seconds)
+        self.samples[i] = seconds
+        self.bins[i] = b
+        self.hist[b] += 1
+        self.index = (i + 1) % len(self.samples)
+
+    def percentile(self, q):
+        """Approximate q-th percentile (0-100) in seconds: upper edge of the matching bin"""
+        if not self.count:
+            return 0.0
+        b = int(np.searchsorted(np.cumsum(self.hist), q / 100.0 * self.count))
+        return _HIST_MIN * _HIST_STEP ** b
+
+
+class LatencyProfiler:
+    """Collects per-stage times for each frame of the run loop"""
+
+    def __init__(self, stages=STAGES, window=512, log_frames=108000, budget=1 / 30.0):
+        self.stages = tuple(stages)
+        self.index = {name: i for i, name in enumerate(self.stages)}
+        self.rings = [StageRing(window) for _ in self.stages]
+        self.total_ring = StageRing(window)
+        self.budget = budget
+
+        # Per-frame log: [timestamp, total, stage...] (ring, exported oldest first)
+        self.log = np.zeros((log_frames, len(self.stages) + 2))
+        self.log_index = 0
+        self.frames = 0
+        self.slow_frames = 0
+
+        self._row = np.zeros(len(self.stages))
+        self._frame_start = 0.0
+        self._t = 0.0
+        self.last_total = 0.0
+
+        # Errors from the loop: (type, message) -> count
+        self.errors = {}
+
+        # Overlay
+        self.show_overlay = False
+        self._overlay_lines = []
+
+    # --- Recording ---------------------------------------------------------
+    def begin_frame(self):
+        self._row[:] = 0.0
+        self._frame_start = self._t = time.perf_counter()
+
+    def lap(self, stage):
+        """Charge the time since the previous lap to `stage`"""
+        now = time.perf_counter()
+        self._row[self.index[stage]] += now - self._t
+        self._t = now
+
+    def add(self, stage, seconds):
+        """Charge (or with a negative value, move) time to `stage` directly"""
+        self._row[self.index[stage]] += seconds
+
+    def end_frame(self):
+        total = self.last_total = time.perf_counter() - self._frame_start
+        for ring, seconds in zip(self.rings, self._row):
+            ring.push(seconds)
+        self.total_ring.push(total)
+
+        row = self.log[self.log_index]
+        row[0] = self._frame_start
+        row[1] = total
+        row[2:] = self._row
+        self.log_index = (self.log_index + 1) % len(self.log)
+        self.frames += 1
+        if total > self.budget:
+            self.slow_frames += 1
+
+        if self.show_overlay and self.frames % 15 == 0:
+            self._overlay_lines = self._format_lines()
+
+    def work_time(self):
+        """Last frame's total minus the time spent waiting for the camera"""
+        if "capture" not in self.index:
+            return self.last_total
+        return self.last_total - self._row[self.index["capture"]]
+
+    def record_error(self, error):
+        """Count a loop exception; print its traceback the first time it's seen"""
+        key = (type(error).__name__, str(error))
+        if key not in self.errors:
+            print(f"[LOOP ERROR] {key[0]}: {key[1]}")
+            traceback.print_exc()
+            self.errors[key] = 0
+        self.errors[key] += 1
+
+    # --- Reporting ---------------------------------------------------------
+    def percentiles(self, qs=(50, 95, 99)):
+        """{stage: [p50, p95, p99] in ms}, including 'total'"""
+        table = {name: [ring.percentile(q) * 1000 for q in qs] for name, ring in zip(self.stages, self.rings)}
+        table["total"] = [self.total_ring.percentile(q) * 1000 for q in qs]
+        return table
+
+    def _format_lines(self):
+        lines = [f"{'stage':10}{'p50':>7}{'p95':>7}{'p99':>7}  ms"]
+        for name, (p50, p95, p99) in self.percentiles().items():
+            lines.append(f"{name:10}{p50:7.1f}{p95:7.1f}{p99:7.1f}")
+        lines.append(f"slow frames: {self.slow_frames}/{self.frames}  errors: {sum(self.errors.values())}")
+        return lines
+
+    def summary(self):
+        return self._format_lines()
+
+    def toggle_overlay(self):
+        self.show_overlay = not self.show_overlay
+        if self.show_overlay:
+            self._overlay_lines = self._format_lines()
+
+    def draw_overlay(self, frame):
+        if not self.show_overlay:
+            return
+        x = frame.shape[1] - 330
+        for i, line in enumerate(self._overlay_lines):
+            cv2.putText(frame, line, (x, 80 + i * 18), cv2.FONT_HERSHEY_PLAIN, 1.0, (0, 255, 255), 1)
+
+    def frame_log(self):
+        """Logged frames, oldest first"""
+        if self.frames < len(self.log):
+            return self.log[:self.frames]
+        return np.roll(self.log, -self.log_index, axis=0)
+
+    def export(self, path):
+        """Write the per-frame log as CSV or JSON (by file extension)"""
+        columns = ["timestamp", "total"] + list(self.stages)
+        rows = self.frame_log()
+        if str(path).endswith(".json"):
+            with open(path, "w") as f:
+                json.dump({
+                    "units": "seconds",
+                    "columns": columns,
+                    "frames": rows.tolist(),
+                    "percentiles_ms": self.percentiles(),
+                    "slow_frames": self.slow_frames,
+                    "errors": {f"{k[0]}: {k[1]}": n for k, n in self.errors.items()},
+                }, f)
+        else:
+            with open(path, "w", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(columns)
+                writer.writerows(rows.tolist())
@@ -0,0 +1,98 @@
+"""
+Adaptive Performance Governor
+Keeps the per-frame work (everything after the frame arrives) inside a time
+budget by stepping through a ladder of quality levels: model complexity,
+capture resolution and detection/tracking confidence. A level is dropped
+when the window's p90 work time is over budget and raised again when there
+is clear headroom. Hysteresis against flapping:
+    - separate thresholds for going down (over budget) and up (< headroom)
+    - a minimum dwell time at each level
+    - when a raised level has to be dropped again soon after, the dwell
+      before the next raise attempt doubles (up to max_dwell)
+"""
+
+import time
+from collections import namedtuple
+
+import numpy as np
+
+QualityLevel = namedtuple("QualityLevel", "complexity width height detection tracking hands", defaults=(1,))
+
+# Best first. Level 0 is the original fixed configuration.
+QUALITY_LEVELS = (
+    QualityLevel(1, 1280, 720, 0.8, 0.7),
+    QualityLevel(0, 1280, 720, 0.8, 0.7),
+    QualityLevel(0, 960, 540, 0.8, 0.7),
+    QualityLevel(0, 640, 360, 0.7, 0.5),  # Lower tracking confidence: re-detection (the slow part) runs less
+)
+
+# Two-hand mode: every hand costs a landmark-model run, so the same ladder tracks both hands,
+# with the dominant hand alone as the last resort
+TWO_HAND_LEVELS = tuple(level._replace(hands=2) for level in QUALITY_LEVELS) + (QUALITY_LEVELS[-1],)
+
+
+def describe(level):
+    return (f"complexity {level.complexity}, {level.width}x{level.height}, "
+            f"confidence {level.detection}/{level.tracking}, {level.hands} hand{'s' if level.hands > 1 else ''}")
+
+
+class PerformanceGovernor:
+    """Feed observe() each frame's work time; it returns a new level index when one should switch"""
+
+    def __init__(self, budget=1 / 30.0, levels=QUALITY_LEVELS, window=45, headroom=0.6, min_dwell=3.0,
+                 max_dwell=60.0, clock=time.perf_counter, verbose=True):
+        self.budget = budget
+        self.levels = levels
+        self.headroom = headroom    # Raise quality when p90 < headroom * budget
+        self.min_dwell = min_dwell  # Seconds at a level before the next switch
+        self.max_dwell = max_dwell
+        self.clock = clock
+        self.verbose = verbose
+
+        self.level = 0
+        self.samples = np.zeros(window)
+        self.count = 0
+        self.dwell = min_dwell      # Current wait before raising (grows on flapping)
+        self.switched_at = clock()
+        self.raised_at = None       # When the last raise happened
+        self.switches = []          # (time, from level, to level, p90 seconds)
+
+    @property
+    def current(self):
+        return self.levels[self.level]
+
+    def observe(self, work_seconds):
+        self.samples[self.count % len(self.samples)] = work_seconds
+        self.count += 1
+        if self.count < len(self.samples):
+            return None
+
+        now = self.clock()
+        since_switch = now - self.switched_at
+        p90 = float(np.percentile(self.samples, 90))
+        if p90 > self.budget and since_switch >= self.min_dwell and self.level < len(self.levels) - 1:
+            # A raise that didn't hold: back off before trying again
+            if self.raised_at is not None and now - self.raised_at < 2 * self.dwell:
+                self.dwell = min(self.dwell * 2, self.max_dwell)
+            self.raised_at = None
+            return self._switch(self.level + 1, p90, now)
+        if p90 < self.headroom * self.budget and since_switch >= self.dwell and self.level > 0:
+            self.raised_at = now
+            return self._switch(self.level - 1, p90, now)
+        return None
+
+    def _switch(self, level, p90, now):
+        self.switches.append((now, self.level, level, p90))
+        if self.verbose:
+            direction = "down" if level > self.level else "up"
+            print(f"[GOVERNOR] quality {direction}: level {self.level} -> {level} "
+                  f"(p90 work {p90 * 1000:.1f} ms, budget {self.budget * 1000:.1f} ms): "
+                  f"{describe(self.levels[level])}")
+        self.level = level
+        self.switched_at = now
+        self.count = 0  # Judge the new level on its own frames
+        return level
+
+    def summary(self):
+        return [f"level {self.level} ({describe(self.current)}), {len(self.switches)} switches, "
+                f"budget {self.budget * 1000:.1f} ms"]
@@ -0,0 +1,102 @@
+"""
+ROI-Cropped Hand Tracking
+Once a hand has been found, only a padded square around the previous frame's
+landmark box is colour-converted and sent to MediaPipe, downscaled to a fixed
+small size. Landmarks are mapped back to full-frame normalized coordinates, so
+callers see exactly the same results as with full-frame inference. When the
+hand is lost inside the crop we fall back to full-frame detection at once.
+MediaPipe carries its own tracking region from one image to the next, which
+means nothing on an image of another size and framing, so the graph is reset
+whenever we switch between crops and full frames. The resize and colour conversion write into preallocated buffers.
+"""
+
+import cv2
+
+from frame_preprocess import FrameBuffers
+
+
+class RoiHandTracker:
+    """Wraps a MediaPipe Hands instance; process() takes the BGR (or, with rgb_input, RGB) frame"""
+
+    def __init__(self, hands, roi_size=256, padding=0.5, rgb_input=False):
+        self.hands = hands
+        self.roi_size = roi_size
+        self.padding = padding  # Extra margin on each side, as a fraction of the hand box
+        self.rgb_input = rgb_input
+        self.buffers = FrameBuffers()
+
+        self.box = None  # (x0, y0, side) in pixels, or None for full-frame detection
+        self._fed = None # Mode of the last image the graph saw
+
+        # STATS
+        self.full_inferences = 0
+        self.roi_inferences = 0
+        self.roi_misses = 0  # Hand lost inside the crop -> full-frame retry
+
+    @property
+    def mode(self):
+        return "ROI" if self.box is not None else "FULL"
+
+    def process(self, frame):
+        h, w = frame.shape[:2]
+
+        # 1. TRACKING: crop around the last known hand
+        if self.box is not None:
+            x0, y0, side = self.box
+            crop = frame[y0:y0 + side, x0:x0 + side]
+            small = cv2.resize(crop, (self.roi_size, self.roi_size),
+                               dst=self.buffers.get("small", (self.roi_size, self.roi_size, 3)),
+                               interpolation=cv2.INTER_AREA)
+            results = self._infer(self._to_rgb(small, "small_rgb"), "ROI")
+            self.roi_inferences += 1
+            if results.multi_hand_landmarks:
+                self._map_to_frame(results, x0, y0, side, w, h)
+                self._update_box(results, w, h)
+                return results
+            self.box = None
+            self.roi_misses += 1
+
+        # 2. DETECTION: full frame
+        results = self._infer(self._to_rgb(frame, "rgb"), "FULL")
+        self.full_inferences += 1
+        if results.multi_hand_landmarks:
+            self._update_box(results, w, h)
+        return results
+
+    def _infer(self, image, mode):
+        if mode != self._fed:
+            if self._fed is not None:
+                self.hands.reset()  # Its tracking region belongs to the other kind of image
+            self._fed = mode
+        return self.hands.process(image)
+
+    def _to_rgb(self, image, name):
+        if self.rgb_input:
+            return image
+        return cv2.cvtColor(image, cv2.COLOR_BGR2RGB, dst=self.buffers.get(name, image.shape))
+
+    def _map_to_frame(self, results, x0, y0, side, w, h):
+        """Crop-normalized -> full-frame-normalized landmarks (in place)"""
+        for marks in results.multi_hand_landmarks:
+            for lm in marks.landmark:
+                lm.x = (x0 + lm.x * side) / w
+                lm.y = (y0 + lm.y * side) / h
+                lm.z = lm.z * side / w  # z shares x's scale
+
+    def _update_box(self, results, w, h):
+        xs = [lm.x for marks in results.multi_hand_landmarks for lm in marks.landmark]
+        ys = [lm.y for marks in results.multi_hand_landmarks for lm in marks.landmark]
+        bw = (max(xs) - min(xs)) * w
+        bh = (max(ys) - min(ys)) * h
+        side = int(max(bw, bh) * (1 + 2 * self.padding))
+        if side >= min(w, h):
+            # Hand fills most of the view: cropping wouldn't save anything
+            self.box = None
+            return
+        side = min(max(side, self.roi_size // 2), min(w, h))
+        cx = (max(xs) + min(xs)) / 2 * w
+        cy = (max(ys) + min(ys)) / 2 * h
+        # Shift (rather than clip) the square so the model never sees a stretched hand
+        x0 = min(max(int(cx - side / 2), 0), w - side)
+        y0 = min(max(int(cy - side / 2), 0), h - side)
+        self.box = (x0, y0, side)
@@ -0,0 +1,174 @@
+"""
+Inertial High-Resolution Scroll Engine
+Turns the two-finger hand position into scroll events:
+    - hand travel is converted to scroll units continuously; a small backlash
+      window removes landmark jitter instead of a per-frame threshold, so
+      slow scrolls still scroll
+    - fractional units accumulate until they add up to a whole event
+    - the output glides towards the hand's scroll position over one frame
+      interval (measured from timestamps), so advance() can be called at any
+      steady rate - per frame, or from a ticker thread at e.g. 120 Hz
+    - optional momentum keeps scrolling after the gesture ends, slowed down
+      by a friction curve; a fist stops it
+"""
+
+import math
+import threading
+import time
+
+
+def _exponential(v, v0, rate, dt):
+    """Speed falls by a factor e every 1/rate seconds"""
+    return v * math.exp(-rate * dt)
+
+
+def _linear(v, v0, rate, dt):
+    """Constant deceleration: stops 1/rate seconds after release"""
+    return math.copysign(max(abs(v) - abs(v0) * rate * dt, 0.0), v)
+
+
+FRICTION_CURVES = {
+    "exponential": _exponential,
+    "linear": _linear,
+}
+
+
+class ScrollEngine:
+    """Hand y (normalized) in, integer scroll amounts out (positive scrolls up, like pyautogui)"""
+
+    def __init__(self, gain=2000.0, deadband=0.004, momentum=None, friction_rate=4.0, min_velocity=20.0,
+                 frame_interval=1 / 30.0):
+        if momentum is not None and momentum not in FRICTION_CURVES:
+            raise ValueError(f"Unknown friction curve '{momentum}' (choose from {', '.join(FRICTION_CURVES)})")
+        self.gain = gain                  # Scroll units per normalized unit of hand travel
+        self.deadband = deadband          # Backlash half-width (normalized) that absorbs jitter
+        self.friction = FRICTION_CURVES[momentum] if momentum else None
+        self.friction_rate = friction_rate  # 1/s, see the curves above
+        self.min_velocity = min_velocity  # Units/s below which momentum stops
+        self.interval = frame_interval    # Running average of the time between hand samples
+
+        self._lock = threading.Lock()
+        self._wake = threading.Condition(self._lock)
+        self._anchor = None   # Backlash-filtered hand y while the gesture is active
+        self._feed_time = None
+        self.target = 0.0     # Scroll position the hand asks for (units)
+        self.position = 0.0   # Scroll position output so far, fractional
+        self.emitted = 0      # Whole units output so far
+        self.velocity = 0.0   # Hand scroll velocity (units/s), from timestamps
+        self._v0 = 0.0
+        self.coasting = False
+        self._t = None        # Time of the last advance()
+
+        # Ticker thread (optional)
+        self._running = False
+        self._thread = None
+
+    @property
+    def active(self):
+        return self._anchor is not None
+
+    @property
+    def idle(self):
+        return not self.active and not self.coasting and abs(self.target - self.position) < 1e-6
+
+    def feed(self, y, t):
+        """Hand y while the scroll gesture is held, at time t"""
+        with self._lock:
+            if self._anchor is None:
+                # Gesture (re)starts: catch any momentum and continue from where the output is
+                self._anchor = y
+                self._feed_time = t
+                self.coasting = False
+                self.target = self.position
+                self.velocity = 0.0
+                self._wake.notify_all()
+                return
+
+            anchor = min(max(self._anchor, y - self.deadband), y + self.deadband)
+            delta = -(anchor - self._anchor) * self.gain  # Hand down -> scroll down (negative)
+            self._anchor = anchor
+            self.target += delta
+
+            gap = t - self._feed_time
+            self._feed_time = t
+            if gap > 0:
+                if gap < 4 * self.interval:
+                    self.interval = 0.8 * self.interval + 0.2 * gap
+                self.velocity = 0.5 * self.velocity + 0.5 * delta / gap
+            self._wake.notify_all()
+
+    def release(self):
+        """Scroll gesture ended: coast with momentum if enabled and fast enough, else settle"""
+        with self._lock:
+            if self._anchor is None:
+                return
+            self._anchor = None
+            if self.friction and abs(self.velocity) >= self.min_velocity:
+                self.coasting = True
+                self._v0 = self.velocity
+            self._wake.notify_all()
+
+    def stop(self):
+        """Stop at once (drop momentum and anything not yet output)"""
+        with self._lock:
+            self._anchor = None
+            self.coasting = False
+            self.velocity = 0.0
+            self.target = self.position
+
+    def advance(self, now):
+        """Move the output up to `now`; returns the whole units to scroll (0 for none)"""
+        with self._lock:
+            if self._t is None:
+                self._t = now
+                return 0
+            dt = now - self._t
+            self._t = now
+            if dt <= 0:
+                return 0
+
+            if self.coasting:
+                v = self.friction(self.velocity, self._v0, self.friction_rate, dt)
+                self.position += (self.velocity + v) / 2 * dt
+                self.velocity = v
+                self.target = self.position
+                if abs(v) < self.min_velocity:
+                    self.coasting = False
+                    self.velocity = 0.0
+            else:
+                self.position += (self.target - self.position) * min(1.0, dt / self.interval)
+
+            amount = int(self.position - self.emitted)  # Truncates toward zero; the rest carries over
+            self.emitted += amount
+            return amount
+
+    # --- Ticker thread -----------------------------------------------------
+    def start(self, output, rate_hz=120.0, clock=time.time):
+        """Emit to `output` from a thread at a steady `rate_hz` (clock must match feed()'s timestamps)"""
+        if self._running:
+            return self
+        self._running = True
+        self._thread = threading.Thread(target=self._run, args=(output, rate_hz, clock),
+                                        name="ScrollTicker", daemon=True)
+        self._thread.start()
+        return self
+
+    def _run(self, output, rate_hz, clock):
+        period = 1.0 / rate_hz
+        while self._running:
+            with self._lock:
+                if self.idle:
+                    self._wake.wait_for(lambda: not self.idle or not self._running)
+                    self._t = None  # Don't count the idle gap as scrolling time
+            amount = self.advance(clock())
+            if amount:
+                output.scroll(amount)
+            time.sleep(period)
+
+    def close(self):
+        with self._lock:
+            self._running = False
+            self._wake.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
@@ -0,0 +1,166 @@
+"""
+Landmark Session Recording & Replay
+Records the MediaPipe landmark stream to a compact fixed-record binary file
+(readable with numpy.memmap) and replays it through the controller's gesture
+and cursor logic - no camera, no MediaPipe, simulated time.
+
+File layout:
+    16-byte header: magic b"HPMCLMK1", uint32 version, uint32 max hands
+    N records of SESSION_DTYPE (timestamp, hand count, handedness, landmarks)
+"""
+
+import argparse
+import collections
+import struct
+import time
+
+import numpy as np
+
+MAGIC = b"HPMCLMK1"
+VERSION = 1
+MAX_HANDS = 2
+HEADER = struct.Struct("<8sII")
+
+# Handedness codes
+HAND_UNKNOWN = 0
+HAND_LEFT = 1
+HAND_RIGHT = 2
+HANDEDNESS_CODES = {"Left": HAND_LEFT, "Right": HAND_RIGHT}
+HANDEDNESS_LABELS = {code: label for label, code in HANDEDNESS_CODES.items()}
+
+SESSION_DTYPE = np.dtype([
+    ("timestamp", "<f8"),
+    ("num_hands", "u1"),
+    ("handedness", "u1", (MAX_HANDS,)),
+    ("landmarks", "<f4", (MAX_HANDS, 21, 3)),
+])
+
+
+class SessionRecorder:
+    """Appends one record per processed frame to a session file"""
+
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, "wb")
+        self.file.write(HEADER.pack(MAGIC, VERSION, MAX_HANDS))
+        self._record = np.zeros(1, dtype=SESSION_DTYPE)
+        self.frames_written = 0
+
+    def write(self, timestamp, multi_hand_landmarks, multi_handedness=None):
+        """Write one frame. multi_hand_landmarks may be None (no hand in view)."""
+        rec = self._record[0]
+        rec["timestamp"] = timestamp
+        rec["handedness"] = HAND_UNKNOWN
+        rec["landmarks"] = 0.0
+
+        hands = list(multi_hand_landmarks or [])[:MAX_HANDS]
+        rec["num_hands"] = len(hands)
+        for i, marks in enumerate(hands):
+            rec["landmarks"][i] = [(lm.x, lm.y, lm.z) for lm in marks.landmark]
+            if multi_handedness and i < len(multi_handedness):
+                label = multi_handedness[i].classification[0].label
+                rec["handedness"][i] = HANDEDNESS_CODES.get(label, HAND_UNKNOWN)
+
+        self.file.write(self._record.tobytes())
+        self.frames_written += 1
+
+    def close(self):
+        if not self.file.closed:
+            self.file.close()
+
+
+def save_session(path, records):
+    """Write an array of SESSION_DTYPE records as a session file (the batch equivalent of SessionRecorder)"""
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, MAX_HANDS))
+        f.write(np.ascontiguousarray(records, dtype=SESSION_DTYPE).tobytes())
+
+
+def load_session(path):
+    """Memory-map a session file as a structured array of SESSION_DTYPE records"""
+    with open(path, "rb") as f:
+        magic, version, max_hands = HEADER.unpack(f.read(HEADER.size))
+    if magic != MAGIC or version != VERSION or max_hands != MAX_HANDS:
+        raise ValueError(f"{path}: not a v{VERSION} landmark session file")
+    return np.memmap(path, dtype=SESSION_DTYPE, mode="r", offset=HEADER.size)
+
+
+# ---------------------------------------------------------------------------
+# Replay
+# ---------------------------------------------------------------------------
+
+ReplayPoint = collections.namedtuple("ReplayPoint", "x y z")
+
+
+class ReplayLandmarks:
+    """Duck-types MediaPipe's NormalizedLandmarkList (.landmark[i].x/.y/.z)"""
+
+    __slots__ = ("landmark",)
+
+    def __init__(self, points):
+        self.landmark = [ReplayPoint(*p) for p in points.tolist()]
+
+
+class ReplayClock:
+    """Simulated clock; the replay driver sets .now to each record's timestamp"""
+
+    def __init__(self, now=0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def replay_session(controller, session, clock, on_frame=None):
+    """
+    Feed recorded frames through controller.apply_hands.
+    The controller must have been built with `clock` as its time source.
+    on_frame(record, gesture_state) is called after each frame, if given.
+    Returns a list with the GestureState of each frame (None when no hand).
+    """
+    states = []
+    for rec in session:
+        clock.now = float(rec["timestamp"])
+        num_hands = int(rec["num_hands"])
+        labels = [HANDEDNESS_LABELS.get(int(code)) for code in rec["handedness"][:num_hands]]
+        gesture_state = controller.apply_hands(list(rec["landmarks"][:num_hands]), labels)
+        if num_hands == 0:
+            states.append(None)
+            if on_frame:
+                on_frame(rec, None)
+            continue
+        states.append(gesture_state)
+        if on_frame:
+            on_frame(rec, gesture_state)
+    return states
+
+
+def main():
+    from hand_controller import HandController
+    from input_backends import RecordingBackend
+
+    parser = argparse.ArgumentParser(description="Replay a recorded landmark session")
+    parser.add_argument("session", help="session file written with --record")
+    args = parser.parse_args()
+
+    session = load_session(args.session)
+    clock = ReplayClock()
+    output = RecordingBackend(clock=clock)
+    controller = HandController(clock=clock, use_camera=False, output=output)
+
+    start = time.perf_counter()
+    states = replay_session(controller, session, clock)
+    elapsed = time.perf_counter() - start
+
+    duration = float(session["timestamp"][-1] - session["timestamp"][0]) if len(session) > 1 else 0.0
+    print(f"Replayed {len(states)} frames ({duration:.1f}s recorded) in {elapsed * 1000:.1f} ms")
+    counts = collections.Counter(s.name if s else "NO_HAND" for s in states)
+    for name, count in counts.most_common():
+        print(f"  {name:12} {count}")
+    print(f"Injected {len(output.events)} events:")
+    for line in output.stats.summary():
+        print(f"  {line}")
+
+
+if __name__ == "__main__":
+    main()
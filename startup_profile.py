@@ -0,0 +1,69 @@
+"""
+Startup Profiling for the Hand Controller
+Records how long each startup phase takes (imports, camera open, model
+build and warm-up, ...) and when the first frame is processed and the
+cursor first moves. Independent phases can be run in parallel threads;
+the report shows each phase's wall time and its offset from process start.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+
+class StartupProfile:
+    """Phase durations and first-event milestones, in seconds since `start`"""
+
+    def __init__(self, start=None, clock=time.perf_counter, verbose=False):
+        self.clock = clock
+        self.start = clock() if start is None else start
+        self.verbose = verbose  # Print milestones as they are reached
+
+        self._lock = threading.Lock()
+        self.phases = []      # (name, offset, duration, thread name)
+        self.milestones = {}  # name -> offset
+
+    def add_phase(self, name, begin, end):
+        with self._lock:
+            self.phases.append((name, begin - self.start, end - begin, threading.current_thread().name))
+
+    @contextmanager
+    def phase(self, name):
+        begin = self.clock()
+        try:
+            yield
+        finally:
+            self.add_phase(name, begin, self.clock())
+
+    def mark(self, name):
+        """Record the first time `name` happens; later calls are ignored"""
+        if name in self.milestones:
+            return
+        offset = self.clock() - self.start
+        self.milestones[name] = offset
+        if self.verbose:
+            print(f"[STARTUP] {name.replace('_', ' ')}: {offset * 1000:.0f} ms after start")
+
+    def report(self):
+        lines = [f"{'phase':16}{'start ms':>10}{'took ms':>10}  thread"]
+        for name, offset, duration, thread in sorted(self.phases, key=lambda p: p[1]):
+            lines.append(f"{name:16}{offset * 1000:10.0f}{duration * 1000:10.0f}  {thread}")
+        for name, offset in self.milestones.items():
+            lines.append(f"{name.replace('_', ' '):16}{offset * 1000:10.0f}")
+        return lines
+
+
+def parallel_init(profile, tasks):
+    """
+    Run independent startup tasks at the same time, each timed as a phase.
+    tasks: {phase name: callable}. Returns {phase name: result}; the first
+    exception raised by a task is re-raised here after all tasks finish.
+    """
+    def timed(name, func):
+        with profile.phase(name):
+            return func()
+
+    with ThreadPoolExecutor(max_workers=len(tasks), thread_name_prefix="Startup") as pool:
+        futures = {name: pool.submit(timed, name, func) for name, func in tasks.items()}
+    return {name: future.result() for name, future in futures.items()}
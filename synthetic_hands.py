@@ -0,0 +1,53 @@
+"""
+Synthetic Hand Landmarks
+Generates (21, 3) MediaPipe-style landmark arrays for the controller's
+gestures, so tests, replays and benchmarks can run without a camera.
+"""
+
+import numpy as np
+
+# Hand-local layout: wrist at the origin, fingers pointing up (-y), unit = palm length
+_MCP_X = (-0.15, -0.05, 0.05, 0.15)  # Index, middle, ring, pinky
+_EXTENDED = (-0.7, -0.85, -1.0)      # PIP, DIP, TIP heights
+_FOLDED = (-0.65, -0.55, -0.45)      # Tip curls back below the PIP
+_THUMB = ((-0.2, -0.1), (-0.3, -0.2), (-0.38, -0.3))
+_THUMB_TIP_OUT = (-0.48, -0.38)
+_THUMB_TIP_IN = (-0.25, -0.35)
+
+# Which of (index, middle, ring, pinky) are extended, plus thumb state
+POSES = {
+    "open": ((True, True, True, True), True),      # MOVING
+    "fist": ((False, False, False, False), False), # IDLE
+    "pinch": ((True, False, False, False), False), # LEFT_CLICK (thumb tip on index tip)
+    "two_fingers": ((True, True, False, False), False), # SCROLLING
+    "pinky": ((False, False, False, True), False),  # RIGHT_CLICK
+}
+
+
+def make_hand(pose="open", x=0.5, y=0.6, scale=0.25):
+    """Return a float32 (21, 3) landmark array with the wrist at (x, y)"""
+    fingers, thumb_out = POSES[pose]
+    pts = np.zeros((21, 3), dtype=np.float32)
+
+    for i, (tx, ty) in enumerate(_THUMB):
+        pts[1 + i, :2] = (tx, ty)
+    pts[4, :2] = _THUMB_TIP_OUT if thumb_out else _THUMB_TIP_IN
+
+    for f, (mcp_x, extended) in enumerate(zip(_MCP_X, fingers)):
+        base = 5 + 4 * f
+        pts[base, :2] = (mcp_x, -0.5)
+        for j, height in enumerate(_EXTENDED if extended else _FOLDED):
+            pts[base + 1 + j, :2] = (mcp_x, height)
+
+    if pose == "pinch":
+        pts[4, :2] = pts[8, :2] + (0.02, 0.02)
+
+    pts[:, :2] = pts[:, :2] * scale + (x, y)
+    return pts
+
+
+def make_stream(poses, fps=30.0, start=0.0):
+    """Build (timestamps, (N, 21, 3) landmarks) for a sequence of (pose, x, y) tuples"""
+    timestamps = start + np.arange(len(poses)) / fps
+    hands = np.stack([make_hand(pose, x, y) for pose, x, y in poses])
+    return timestamps, hands
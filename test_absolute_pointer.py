@@ -0,0 +1,67 @@
+"""
+Tests for calibrated absolute pointing
+"""
+
+import cv2
+import numpy as np
+
+from absolute_pointer import AbsoluteMapper, Calibration
+from hand_controller import HandController
+from input_backends import RecordingBackend
+from landmark_features import INDEX_MCP
+from session_replay import ReplayClock
+from synthetic_hands import make_hand
+
+# Two side-by-side monitors, the second one left of the primary
+DESKTOP = (-1920, 0, 3840, 1080)
+CORNERS = [(0.3, 0.3), (0.72, 0.28), (0.7, 0.7), (0.32, 0.68)]  # A slightly keystoned region
+
+
+def test_table_lookup_matches_the_homography():
+    calibration = Calibration(CORNERS, DESKTOP)
+    mapper = AbsoluteMapper(calibration)
+    points = np.random.default_rng(0).uniform(0.32, 0.68, (200, 2)).astype(np.float32)
+    exact = cv2.perspectiveTransform(points.reshape(-1, 1, 2), calibration.homography()).reshape(-1, 2)
+    mapped = np.array([mapper.map(x, y) for x, y in points.tolist()])
+    assert np.abs(mapped - exact).max() < 1.0
+
+    assert np.allclose(mapper.map(*CORNERS[0]), (-1920, 0), atol=1.0)
+    assert np.allclose(mapper.map(*CORNERS[2]), (1919, 1079), atol=1.0)
+    assert mapper.map(0.0, 1.0) == (-1920, 1079)  # Outside the region: clamped to the desktop edge
+
+
+def test_calibration_round_trip(tmp_path):
+    path = tmp_path / "calibration.json"
+    Calibration(CORNERS, DESKTOP).save(path)
+    loaded = Calibration.load(path)
+    assert np.allclose(loaded.camera, CORNERS) and loaded.desktop == DESKTOP
+
+
+def test_controller_calibrates_then_points_absolutely(tmp_path):
+    path = tmp_path / "calibration.json"
+    clock = ReplayClock(10.0)
+    output = RecordingBackend(clock=clock, desktop=DESKTOP)
+    controller = HandController(clock=clock, use_camera=False, output=output, headless=True, absolute=str(path))
+
+    offset = make_hand("open", 0.0, 0.0)[INDEX_MCP, :2]  # Tracked point relative to the wrist
+
+    def frames(pose, corner, n):
+        # Place the hand so its tracked point sits on the corner
+        for _ in range(n):
+            clock.now += 1 / 30
+            controller.apply_gesture(make_hand(pose, corner[0] - offset[0], corner[1] - offset[1]))
+
+    for corner in CORNERS:
+        frames("open", corner, 10)
+        frames("pinch", corner, 3)
+    assert controller.calibrator is None and path.exists()
+    assert output.ops("click", "mouse_down") == []  # Calibration pinches aren't clicks
+    assert np.allclose(Calibration.load(path).camera, CORNERS, atol=1e-3)
+
+    # Bottom-right corner of the region -> bottom-right of the right-hand monitor
+    frames("open", CORNERS[2], 60)
+    assert abs(controller.cursor_x - 1919) <= 2 and abs(controller.cursor_y - 1079) <= 2
+
+    # The next run reloads the calibration instead of asking again
+    again = HandController(use_camera=False, output=RecordingBackend(desktop=DESKTOP), absolute=str(path))
+    assert again.calibrator is None and again.mapper is not None
@@ -0,0 +1,80 @@
+"""
+Tests for the asynchronous injection queue
+"""
+
+import threading
+
+from async_injection import AsyncInjector
+from input_backends import RecordingBackend
+
+
+class GatedBackend(RecordingBackend):
+    """Recording backend whose first action blocks until the gate opens"""
+
+    def __init__(self):
+        super().__init__()
+        self.gate = threading.Event()
+        self.started = threading.Event()
+
+    def _record(self, op, *args):
+        self.started.set()
+        self.gate.wait(timeout=5)
+        super()._record(op, *args)
+
+
+def test_moves_coalesce_scrolls_sum_and_buttons_keep_order():
+    backend = GatedBackend()
+    output = AsyncInjector(backend)
+    output.move_to(1, 1)
+    backend.started.wait(timeout=5)  # Worker is now stuck performing the first move
+
+    output.move_to(2, 2)
+    output.move_to(3, 3)
+    output.mouse_down()
+    output.move_to(4, 4)
+    output.move_to(5, 5)
+    output.scroll(1)
+    output.scroll(2)
+    output.mouse_up()
+    output.click()
+    assert output.depth == 6
+
+    backend.gate.set()
+    assert output.flush()
+    assert [(op, args) for _, op, args in backend.events] == [
+        ("move_to", (1, 1)), ("move_to", (3, 3)), ("mouse_down", ()), ("move_to", (5, 5)),
+        ("scroll", (3,)), ("mouse_up", ()), ("click", ()),
+    ]
+    stats = output.queue_stats
+    assert (stats.coalesced_moves, stats.coalesced_scrolls) == (2, 1)
+    assert stats.dispatched == 7
+    output.close()
+
+
+def test_full_queue_blocks_instead_of_dropping_buttons():
+    backend = GatedBackend()
+    output = AsyncInjector(backend, maxsize=2)
+    producer = threading.Thread(target=lambda: [output.click() for _ in range(5)])
+    producer.start()
+    backend.started.wait(timeout=5)
+    producer.join(timeout=0.2)
+    assert producer.is_alive()  # Waiting for room, not dropping
+
+    backend.gate.set()
+    producer.join(timeout=5)
+    assert output.flush()
+    assert len(backend.ops("click")) == 5
+    assert output.queue_stats.full_waits >= 1
+    output.close()
+
+
+def test_close_drains_queue_and_releases_held_button():
+    backend = RecordingBackend()
+    output = AsyncInjector(backend)
+    output.mouse_down()
+    output.move_to(10, 10)
+    output.close()
+    assert [op for _, op, _ in backend.events] == ["mouse_down", "move_to", "mouse_up"]
+
+    output.click()  # Ignored after close
+    assert len(backend.events) == 3
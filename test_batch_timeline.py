@@ -0,0 +1,93 @@
+"""
+Tests for the offline video -> gesture timeline batch processor
+"""
+
+import csv
+
+import cv2
+import numpy as np
+import pytest
+
+from batch_timeline import _worker, gesture_timeline, plan_chunks, process_chunk, run_batch
+from frame_preprocess import FramePreprocessor
+from session_replay import SESSION_DTYPE, load_session
+from synthetic_hands import make_hand
+
+
+def test_chunks_cover_the_video_once_with_warm_up_overlap():
+    chunks = plan_chunks("v.mp4", frames=250, fps=25, chunk_seconds=4, overlap_seconds=1)
+    assert [(c.start, c.end, c.warm_start) for c in chunks] == [(0, 100, 0), (100, 200, 75), (200, 250, 175)]
+    assert [c.index for c in chunks] == [0, 1, 2]
+
+
+def test_gesture_timeline_reports_clicks_from_landmarks():
+    poses = ["open"] * 20 + ["pinch"] * 3 + ["open"] * 2
+    session = np.zeros(len(poses), dtype=SESSION_DTYPE)
+    for i, pose in enumerate(poses):
+        session[i]["timestamp"] = i / 30
+        session[i]["num_hands"] = 1
+        session[i]["landmarks"][0] = make_hand(pose)
+    states, events = gesture_timeline(session)
+    assert len(states) == len(poses)
+    assert [op for _, op, _ in events] == ["click"]
+
+
+def test_batch_merges_chunks_in_order(tmp_path):
+    path = str(tmp_path / "clip.avi")
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"MJPG"), 10, (96, 54))
+    if not writer.isOpened():
+        pytest.skip("no MJPG video writer in this OpenCV build")
+    for i in range(25):
+        writer.write(np.full((54, 96, 3), i * 10, dtype=np.uint8))
+    writer.release()
+
+    out = tmp_path / "out"
+    results = run_batch([path], str(out), workers=2, chunk_seconds=1.0, overlap_seconds=0.3, verbose=False)
+    session, states, events = results[path]
+    assert len(session) == 25
+    assert np.allclose(session["timestamp"], np.arange(25) / 10)  # Every frame once, in order
+    assert not session["num_hands"].any() and events == []
+
+    assert len(load_session(out / "clip.lmk")) == 25
+    with open(out / "clip.timeline.csv") as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == 25 and rows[-1]["gesture"] == "NO_HAND"
+
+
+def test_each_chunk_starts_with_fresh_tracking(tmp_path, monkeypatch):
+    class FakeHands:
+        def __init__(self):
+            self.frames = 0  # Since the last reset
+
+        def reset(self):
+            self.frames = 0
+
+        def process(self, rgb):
+            assert self.frames < 15  # Never more than one chunk's frames, warm-up included
+            self.frames += 1
+            return type("Results", (), {"multi_hand_landmarks": None, "multi_handedness": None})()
+
+    path = str(tmp_path / "clip.avi")
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"MJPG"), 10, (96, 54))
+    if not writer.isOpened():
+        pytest.skip("no MJPG video writer in this OpenCV build")
+    for i in range(30):
+        writer.write(np.zeros((54, 96, 3), dtype=np.uint8))
+    writer.release()
+
+    monkeypatch.setitem(_worker, "hands", FakeHands())
+    monkeypatch.setitem(_worker, "preprocess", FramePreprocessor("image"))
+    for chunk in plan_chunks(path, 30, 10, chunk_seconds=1.0, overlap_seconds=0.3):
+        _, records, _ = process_chunk(chunk)
+        assert len(records) == chunk.end - chunk.start
+
+
+def test_clicks_right_at_the_start_of_a_video_are_kept():
+    poses = ["open"] * 5 + ["pinch"] * 3 + ["open"] * 2 + ["pinky"] * 2  # All within the first 0.5 s
+    session = np.zeros(len(poses), dtype=SESSION_DTYPE)
+    for i, pose in enumerate(poses):
+        session[i]["timestamp"] = i / 30  # Video time starts at 0
+        session[i]["num_hands"] = 1
+        session[i]["landmarks"][0] = make_hand(pose)
+    states, events = gesture_timeline(session)
+    assert [op for _, op, _ in events] == ["click", "right_click"]
@@ -0,0 +1,20 @@
+"""
+Tests for the hot-path benchmark harness
+"""
+
+from benchmark_hot_path import STAGES, compare, run_benchmarks, synthetic_stream
+
+
+def test_benchmarks_cover_every_stage():
+    timestamps, hands = synthetic_stream(frames=40)
+    results = run_benchmarks(timestamps, hands, rounds=1)
+    assert set(results) == set(STAGES)
+    assert all(value > 0 for value in results.values())
+
+
+def test_compare_flags_regressions_over_threshold():
+    baseline = {"detect_gesture": 10.0, "perform_scroll": 10.0}
+    results = {"detect_gesture": 14.0, "perform_scroll": 11.0, "draw_sci_fi_hud": 100.0}
+    lines, regressed = compare(results, baseline, threshold=25.0)
+    assert regressed == ["detect_gesture"]
+    assert any("new" in line for line in lines if line.startswith("draw_sci_fi_hud"))
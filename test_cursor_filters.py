@@ -0,0 +1,53 @@
+"""
+Tests for the cursor filters and their lag/jitter metrics
+"""
+
+import numpy as np
+
+from cursor_filters import FILTERS, KalmanFilter, evaluate_filter, make_filter
+from session_replay import ReplayLandmarks, SessionRecorder, load_session
+from synthetic_hands import make_hand
+
+
+def record_wobbly_circle(path, seconds=10, fps=30):
+    """Slow circular hand motion with landmark jitter"""
+    rng = np.random.default_rng(1)
+    recorder = SessionRecorder(path)
+    for i in range(int(seconds * fps)):
+        t = i / fps
+        points = make_hand("open", 0.5 + 0.04 * np.sin(np.pi * t), 0.6 + 0.03 * np.cos(0.6 * np.pi * t))
+        points[:, :2] += rng.normal(0, 0.0015, (1, 2))
+        recorder.write(10 + t, [ReplayLandmarks(points)])
+    recorder.close()
+    return load_session(path)
+
+
+def test_filters_trade_lag_against_jitter(tmp_path):
+    session = record_wobbly_circle(tmp_path / "circle.lmk")
+    metrics = {name: evaluate_filter(session, make_filter(name)) for name in FILTERS}
+
+    # The legacy EMA trails the hand by a couple of frames; the new filters react faster
+    assert metrics["legacy"]["lag_ms"] > 50
+    assert metrics["one-euro"]["lag_ms"] < metrics["legacy"]["lag_ms"]
+    assert metrics["kalman"]["lag_ms"] < metrics["legacy"]["lag_ms"]
+    for m in metrics.values():
+        assert 0 < m["jitter_px"] < 5
+
+
+def test_prediction_reduces_lag(tmp_path):
+    session = record_wobbly_circle(tmp_path / "circle.lmk")
+    plain = evaluate_filter(session, KalmanFilter())
+    predicted = evaluate_filter(session, KalmanFilter(lead=0.03))
+    assert predicted["lag_ms"] < plain["lag_ms"]
+
+
+def test_filters_use_timestamps_not_frame_counts():
+    # Same constant-velocity motion sampled at 30 and 60 fps settles to the same position
+    for name in ("one-euro", "kalman"):
+        ends = []
+        for fps in (30, 60):
+            f = make_filter(name)
+            for i in range(fps * 2):
+                x, _ = f.update(0.1 * i / fps, 0.5, i / fps)
+            ends.append(x)
+        assert abs(ends[0] - ends[1]) < 0.005
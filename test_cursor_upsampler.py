@@ -0,0 +1,144 @@
+"""
+Tests for display-rate cursor upsampling
+"""
+
+import threading
+import time
+
+from cursor_upsampler import CursorUpsampler
+from hand_controller import HandController
+from input_backends import RecordingBackend
+from session_replay import ReplayClock
+from synthetic_hands import make_hand
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def glide(upsampler, clock, until, rate_hz=144.0):
+    while clock.now < until:
+        clock.now += 1 / rate_hz
+        upsampler.tick()
+
+
+def test_glides_to_target_without_overshoot():
+    clock = FakeClock()
+    output = RecordingBackend()
+    upsampler = CursorUpsampler(output, clock=clock)
+    upsampler.reset(100, 100)
+    upsampler.set_target(200, 100)
+    glide(upsampler, clock, 0.1)
+
+    xs = [args[0] for _, _, args in output.ops("move_to")]
+    assert len(xs) >= 4  # Several intermediate steps per 30 fps frame
+    assert xs == sorted(xs) and xs[-1] == 200  # Monotonic, ends exactly on target
+    assert not upsampler.tick()  # Idle once the target is reached
+
+
+def test_never_passes_the_latest_target_when_the_hand_stops():
+    clock = FakeClock()
+    output = RecordingBackend()
+    upsampler = CursorUpsampler(output, clock=clock)
+    upsampler.reset(0, 0)
+    for i in range(1, 11):
+        upsampler.set_target(i * 10, 0)
+        before = len(output.ops("move_to"))
+        glide(upsampler, clock, i / 30)
+        xs = [args[0] for _, _, args in output.ops("move_to")[before:]]
+        assert all(x <= i * 10 for x in xs)  # Capped at the latest target...
+        assert output.position[0] >= i * 10 - 3  # ...and (about) on it by the next frame
+
+    glide(upsampler, clock, 0.6)  # The hand stops: no more targets
+    xs = [args[0] for _, _, args in output.ops("move_to")]
+    assert max(xs) == xs[-1] == 100 and xs == sorted(xs)
+    assert not upsampler.tick()
+
+
+def test_targets_are_clamped_to_the_desktop():
+    clock = FakeClock()
+    output = RecordingBackend(screen_size=(800, 600))
+    upsampler = CursorUpsampler(output, clock=clock)
+    upsampler.reset(700, 300)
+    upsampler.set_target(900, -50)
+    glide(upsampler, clock, 0.1)
+    assert output.position == (799, 0)
+
+
+def test_halt_waits_for_a_move_in_flight():
+    class BlockingBackend(RecordingBackend):
+        def _do_move_to(self, x, y):
+            entered.set()
+            release.wait(1.0)
+            super()._do_move_to(x, y)
+
+    entered, release = threading.Event(), threading.Event()
+    clock = FakeClock()
+    output = BlockingBackend()
+    upsampler = CursorUpsampler(output, clock=clock)
+    upsampler.reset(0, 0)
+    upsampler.set_target(300, 0)
+    ticker = threading.Thread(target=upsampler.tick, args=(0.01,))
+    ticker.start()
+    assert entered.wait(1.0)
+    halter = threading.Thread(target=upsampler.halt)
+    halter.start()
+    halter.join(0.05)
+    assert halter.is_alive()  # halt() can't return while the move is still on its way out
+    release.set()
+    halter.join(1.0)
+    ticker.join(1.0)
+    output.click()
+    assert [e[1] for e in output.events] == ["move_to", "click"]
+    assert not upsampler.tick(0.02)
+
+
+def test_frame_interval_follows_target_rate():
+    clock = FakeClock()
+    upsampler = CursorUpsampler(RecordingBackend(), clock=clock)
+    upsampler.reset(0, 0)
+    for i in range(30):
+        upsampler.set_target(i * 10, 0)
+        clock.now += 1 / 60
+        upsampler.tick()
+    assert abs(upsampler.interval - 1 / 60) < 0.003
+
+
+def test_halt_stops_midway():
+    clock = FakeClock()
+    output = RecordingBackend()
+    upsampler = CursorUpsampler(output, clock=clock)
+    upsampler.reset(0, 0)
+    upsampler.set_target(300, 0)
+    glide(upsampler, clock, 0.01)
+    stopped = upsampler.halt()
+    assert 0 < stopped[0] < 300
+
+    moves = len(output.ops("move_to"))
+    glide(upsampler, clock, 0.2)
+    assert len(output.ops("move_to")) == moves
+
+
+def test_controller_halts_glide_on_fist():
+    output = RecordingBackend()
+    clock = ReplayClock(50.0)
+    controller = HandController(clock=clock, use_camera=False, output=output, upsample_hz=144)
+    try:
+        for i in range(6):
+            clock.now += 1 / 30
+            controller.apply_gesture(make_hand("open", x=0.3 + 0.05 * i))
+        time.sleep(0.01)
+        controller.apply_gesture(make_hand("fist", x=0.6))
+        assert controller.upsampler.halt() == (controller.cursor_x, controller.cursor_y)
+        assert controller.output.flush()
+        moves = len(output.ops("move_to"))
+        time.sleep(0.05)
+        assert controller.output.flush()
+        assert len(output.ops("move_to")) == moves
+    finally:
+        controller.upsampler.close()
+        controller.output.close()
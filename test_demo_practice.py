@@ -0,0 +1,57 @@
+"""
+Tests for practice mode on the controller engine
+"""
+
+import cv2
+import numpy as np
+
+from demo_practice import PANEL, PracticeController, PracticeOverlay, RollingFps
+from hand_controller import GestureState
+from session_replay import ReplayClock
+from synthetic_hands import make_hand
+
+
+def test_fps_is_a_rolling_average():
+    times = iter([i / 30 for i in range(20)] + [20 / 30 + 0.2])  # One 200 ms hiccup at the end
+    fps = RollingFps(window=30, clock=lambda: next(times))
+    for _ in range(21):
+        fps.tick()
+    assert 20 < fps.value < 30  # 1 / (last interval) would read 4
+
+
+def test_panel_blends_only_its_own_region():
+    overlay = PracticeOverlay([(0, 1)])
+    background = np.random.default_rng(0).integers(0, 255, (480, 640, 3), dtype=np.uint8)
+    frame = background.copy()
+    overlay.draw_panel(frame, "MOVING", (0, 255, 255), [True, True, False, False, False], 29.7, None)
+
+    # The original: copy the whole frame, fill the box, blend the whole frame
+    expected = background.copy()
+    dark = expected.copy()
+    x0, y0, x1, y1 = PANEL
+    cv2.rectangle(dark, (x0, y0), (x1, y1), (0, 0, 0), -1)
+    cv2.addWeighted(dark, 0.7, expected, 0.3, 0, expected)
+    untouched = np.ones(frame.shape[:2], bool)
+    untouched[:y1 + 1, :x1 + 1] = False  # Panel
+    untouched[:200, 640 - 260:] = False  # Gesture guide
+    untouched[480 - 40:, :200] = False   # Quit hint
+    assert np.array_equal(frame[untouched], background[untouched])
+    # Away from the text the panel is darkened exactly like the full-frame blend
+    assert np.abs(frame[240:249, 300:390].astype(int) - expected[240:249, 300:390]).max() <= 1
+
+
+def test_practice_uses_the_real_gestures_without_touching_the_mouse():
+    clock = ReplayClock(10.0)
+    demo = PracticeController(clock=clock, use_camera=False, headless=True)
+    states = []
+    for pose in ["open"] * 5 + ["pinch"] * 3 + ["open"] * 2:
+        clock.now += 1 / 30
+        states.append(demo.apply_hands([make_hand(pose)]))
+    assert GestureState.LEFT_CLICK in states
+    assert demo.output.name == "null" and demo.output.ops("click")  # Recorded, not injected
+    assert demo.last_action() == "CLICK"
+
+    frame = np.zeros((720, 1280, 3), np.uint8)
+    demo.draw_info_overlay(frame, states[-1])
+    demo.apply_hands([])
+    assert demo.hand_seen is False and demo.fingers == [False] * 5
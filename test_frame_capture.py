@@ -0,0 +1,93 @@
+"""
+Tests for the threaded latest-frame capture stage
+"""
+
+import threading
+import time
+
+import numpy as np
+
+from frame_capture import LatestFrameGrabber
+
+
+class FakeCapture:
+    """Stands in for cv2.VideoCapture: yields numbered frames, then fails"""
+
+    def __init__(self, count, gate=None):
+        self.count = count
+        self.gate = gate
+        self.next_frame = 0
+
+    def read(self, image=None):
+        if self.gate is not None:
+            self.gate.acquire()
+        if self.next_frame >= self.count:
+            return False, None
+        self.next_frame += 1
+        return True, self.next_frame
+
+
+def test_read_returns_newest_frame_and_counts_drops():
+    gate = threading.Semaphore(0)
+    grabber = LatestFrameGrabber(FakeCapture(10, gate)).start()
+
+    # Let three frames arrive before anyone reads
+    for _ in range(3):
+        gate.release()
+    while grabber.frames_captured < 3:
+        pass
+
+    success, frame = grabber.read()
+    assert success and frame == 3
+    assert grabber.frames_dropped == 2
+
+    gate.release()
+    success, frame = grabber.read()
+    assert success and frame == 4
+    assert grabber.frames_dropped == 2
+
+    # Drain the fake camera so the capture thread exits on its own
+    for _ in range(10):
+        gate.release()
+    grabber.stop()
+
+
+def test_read_fails_after_camera_stops():
+    grabber = LatestFrameGrabber(FakeCapture(0)).start()
+    success, frame = grabber.read(timeout=1.0)
+    assert not success and frame is None
+    grabber.stop()
+
+
+class BufferedCapture:
+    """Stands in for cv2.VideoCapture.read(image): decodes into the given buffer"""
+
+    def __init__(self, count):
+        self.count = count
+        self.buffers = []
+
+    def read(self, image=None):
+        if len(self.buffers) >= self.count:
+            return False, None
+        if image is None:
+            image = np.zeros(4)
+        image[:] = len(self.buffers) + 1
+        self.buffers.append(image)
+        return True, image
+
+
+def test_capture_reuses_buffers_and_spares_the_front_frame():
+    cap = BufferedCapture(50)
+    grabber = LatestFrameGrabber(cap).start()
+    seen = []
+    while True:
+        success, frame = grabber.read()
+        if not success:
+            break
+        seen.append((id(frame), frame[0]))
+        value = frame[0]
+        time.sleep(0.001)
+        assert frame[0] == value  # The capture thread never writes the frame we hold
+    grabber.stop()
+    assert len({id(b) for b in cap.buffers}) <= 3
+    assert [v for _, v in seen] == sorted(v for _, v in seen)
@@ -0,0 +1,82 @@
+"""
+Tests for the multi-process capture/inference pipeline
+"""
+
+from types import SimpleNamespace
+
+import cv2
+import numpy as np
+import pytest
+
+import hand_controller
+from frame_pipeline import STAGES, FramePipeline
+from input_backends import RecordingBackend
+from synthetic_hands import make_hand
+
+
+@pytest.fixture
+def video(tmp_path):
+    """Left half bright, right half dark"""
+    path = str(tmp_path / "halves.avi")
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"MJPG"), 30, (160, 90))
+    if not writer.isOpened():
+        pytest.skip("no MJPG video writer in this OpenCV build")
+    frame = np.zeros((90, 160, 3), dtype=np.uint8)
+    frame[:, :80] = 255
+    for _ in range(30):
+        writer.write(frame)
+    writer.release()
+    return path
+
+
+def test_frames_flow_through_the_stages_mirrored_until_end_of_stream(video):
+    pipeline = FramePipeline(video, size=(160, 90), slots=2).start()
+    try:
+        frames = 0
+        while True:
+            ok, frame = pipeline.read(timeout=60)
+            if not ok:
+                break
+            frames += 1
+            assert frame.shape == (90, 160, 3)
+            assert frame[:, 80:].mean() > 200 and frame[:, :80].mean() < 50  # Mirrored by the capture stage
+            assert pipeline.process(frame).multi_hand_landmarks is None
+            assert pipeline.last_frame_time > 0
+        assert frames >= 1
+        assert pipeline.frames_captured == frames
+        assert pipeline.frames_dropped == 0
+    finally:
+        pipeline.close()
+
+    lines = pipeline.summary()
+    assert [line.split()[0] for line in lines] == list(STAGES)
+    assert int(lines[0].split()[1]) >= frames  # Capture saw every frame inference did
+
+
+def test_controller_reads_pipeline_landmarks_for_every_tracked_hand(monkeypatch):
+    class FakePipeline:
+        def __init__(self, source, quality, **options):
+            self.quality = quality
+            self.last_frame_time = 0.0
+            self.frame = np.zeros((90, 160, 3), dtype=np.uint8)
+            self.results = SimpleNamespace(multi_hand_landmarks=None, multi_handedness=None)
+
+        def start(self):
+            return self
+
+        def read(self):
+            return True, self.frame
+
+        def process(self, image):
+            return self.results
+
+    monkeypatch.setattr(hand_controller, "FramePipeline", FakePipeline)
+    controller = hand_controller.HandController(output=RecordingBackend(), headless=True, pipeline=True,
+                                                two_hands="Right")
+    assert controller.source.quality.hands == 2  # The inference process tracks the modifier hand too
+
+    controller.grabber = controller.source
+    controller.preprocess.to_rgb = None  # Inference happened in the pipeline: no frame conversion here
+    controller.source.results.multi_hand_landmarks = [make_hand("open")]
+    assert controller.step()
+    assert controller.hands_in_view and not controller.profiler.errors
@@ -0,0 +1,74 @@
+"""
+Tests for the preallocated frame path and landmark-space mirroring
+"""
+
+from types import SimpleNamespace
+
+import cv2
+import numpy as np
+import pytest
+
+from benchmark_frame_path import legacy_path, measure, preallocated_path, synthetic_frames
+from frame_preprocess import FramePreprocessor
+from synthetic_hands import make_hand
+
+
+class Results:
+    """Mutable stand-in for MediaPipe results"""
+
+    def __init__(self, hands, labels):
+        self.multi_hand_landmarks = [
+            SimpleNamespace(landmark=[SimpleNamespace(x=x, y=y, z=z) for x, y, z in h.tolist()]) for h in hands
+        ]
+        self.multi_handedness = [SimpleNamespace(classification=[SimpleNamespace(label=l)]) for l in labels]
+
+
+def frame():
+    return np.random.default_rng(1).integers(0, 256, (72, 128, 3), dtype=np.uint8)
+
+
+def test_image_mode_matches_flip_and_reuses_buffers():
+    pre = FramePreprocessor("image")
+    src = frame()
+    oriented = pre.orient(src)
+    rgb = pre.to_rgb(oriented)
+    assert np.array_equal(rgb, cv2.cvtColor(cv2.flip(src, 1), cv2.COLOR_BGR2RGB))
+    assert pre.display(oriented) is oriented
+
+    assert pre.to_rgb(pre.orient(frame())) is rgb
+    assert pre.buffers.allocations == 2
+
+
+def test_landmark_mode_skips_flip_and_mirrors_landmarks():
+    pre = FramePreprocessor("landmarks")
+    src = frame()
+    assert pre.orient(src) is src
+    assert np.array_equal(pre.display(src), cv2.flip(src, 1))
+
+    hand = make_hand("open", x=0.3)
+    results = Results([hand], ["Left"])
+    pre.mirror_results(results)
+    mirrored = np.array([(p.x, p.y, p.z) for p in results.multi_hand_landmarks[0].landmark])
+    assert np.allclose(mirrored[:, 0], 1.0 - hand[:, 0])
+    assert np.allclose(mirrored[:, 1:], hand[:, 1:])
+    assert results.multi_handedness[0].classification[0].label == "Right"
+
+
+def test_rgb_input_skips_conversion():
+    pre = FramePreprocessor("landmarks", rgb_input=True)
+    src = frame()
+    assert pre.to_rgb(pre.orient(src)) is src
+    assert np.array_equal(pre.display(src), cv2.cvtColor(cv2.flip(src, 1), cv2.COLOR_RGB2BGR))
+
+
+def test_unknown_mirror_mode():
+    with pytest.raises(ValueError):
+        FramePreprocessor("both")
+
+
+def test_preallocated_path_allocates_nothing_per_frame():
+    frames = synthetic_frames(20, 128, 72)
+    legacy_growth, _ = measure(legacy_path, frames, preview=True)
+    growth, _ = measure(preallocated_path(FramePreprocessor("image")), frames, preview=True)
+    assert legacy_growth >= 2 * 128 * 72 * 3
+    assert growth < 1024
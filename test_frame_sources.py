@@ -0,0 +1,111 @@
+"""
+Tests for the pluggable frame sources
+"""
+
+import time
+
+import cv2
+import numpy as np
+import pytest
+
+from frame_capture import LatestFrameGrabber
+from frame_sources import (ImageDirectorySource, SyntheticSource, VideoFileSource, measure_capture,
+                           open_source)
+
+
+def solid(value, size=(64, 36)):
+    return np.full((size[1], size[0], 3), value, dtype=np.uint8)
+
+
+def test_open_source_picks_the_implementation(tmp_path):
+    cv2.imwrite(str(tmp_path / "a.png"), solid(10))
+    assert isinstance(open_source("synthetic"), SyntheticSource)
+    assert open_source("synthetic:320x180").size == (320, 180)
+    assert isinstance(open_source(str(tmp_path)), ImageDirectorySource)
+    source = SyntheticSource()
+    assert open_source(source) is source
+    with pytest.raises(FileNotFoundError):
+        open_source(str(tmp_path / "missing.mp4"))
+
+
+def test_image_directory_reads_in_name_order_into_the_callers_buffer(tmp_path):
+    for name, value in (("b.png", 20), ("a.png", 10), ("c.jpg", 30), ("notes.txt", 0)):
+        if name.endswith(".txt"):
+            (tmp_path / name).write_text("not an image")
+        else:
+            cv2.imwrite(str(tmp_path / name), solid(value))
+    source = ImageDirectorySource(str(tmp_path))
+    buffer = np.zeros((36, 64, 3), dtype=np.uint8)
+    values = []
+    while True:
+        success, frame = source.read(buffer)
+        if not success:
+            break
+        assert frame is buffer
+        values.append(int(frame.mean()))
+    assert values == [10, 20, 30]
+
+    looping = ImageDirectorySource(str(tmp_path), loop=True)
+    assert [int(looping.read()[1].mean()) for _ in range(4)] == [10, 20, 30, 10]
+
+
+def test_video_file_plays_to_the_end_or_loops(tmp_path):
+    path = str(tmp_path / "clip.avi")
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"MJPG"), 30, (64, 36))
+    if not writer.isOpened():
+        pytest.skip("no MJPG video writer in this OpenCV build")
+    for i in range(5):
+        writer.write(solid(i * 50))
+    writer.release()
+
+    source = open_source(path)
+    assert isinstance(source, VideoFileSource)
+    assert sum(1 for _ in iter(lambda: source.read()[0], False)) == 5
+    looping = VideoFileSource(path, loop=True)
+    assert all(looping.read()[0] for _ in range(12))
+
+
+def test_pacing_holds_the_requested_rate():
+    fast = SyntheticSource((64, 36), frames=10)
+    start = time.perf_counter()
+    reads, _ = measure_capture(fast, frames=20)
+    assert len(reads) == 10  # Stops after `frames`
+    assert time.perf_counter() - start < 0.05
+
+    paced = SyntheticSource((64, 36), rate=200)
+    reads, intervals = measure_capture(paced, frames=11)
+    assert intervals.mean() == pytest.approx(1 / 200, rel=0.3)
+
+
+def test_synthetic_frames_move_and_follow_resolution_changes():
+    source = SyntheticSource((160, 90))
+    _, first = source.read()
+    first = first.copy()
+    for _ in range(10):
+        _, frame = source.read()
+    assert frame.shape == (90, 160, 3)
+    assert not np.array_equal(first, frame)  # The hand moves
+
+    assert source.set(cv2.CAP_PROP_FRAME_WIDTH, 320) and source.set(cv2.CAP_PROP_FRAME_HEIGHT, 180)
+    assert source.read()[1].shape == (180, 320, 3)
+
+
+def test_grabber_runs_on_any_source():
+    grabber = LatestFrameGrabber(SyntheticSource((64, 36), rate=500, frames=20)).start()
+    got = 0
+    while grabber.read(timeout=1.0)[0]:
+        got += 1
+    grabber.stop()
+    assert 1 <= got <= 20
+    assert grabber.frames_captured == 20
+
+
+def test_controller_runs_headless_on_a_synthetic_source(capsys):
+    from hand_controller import HandController
+
+    controller = HandController(output="null", headless=True,
+                                frame_source=SyntheticSource((320, 180), rate=30, frames=15))
+    controller.run()  # Ends when the source does
+    assert controller.grabber.frames_captured == 14  # The first one went to the start-up warm-up grab()
+    assert controller.scheduler.inferences >= 5  # MediaPipe ran on the generated frames
+    assert "errors: 0" in capsys.readouterr().out
@@ -0,0 +1,64 @@
+"""
+Tests for the nearest-neighbour gesture classifier
+"""
+
+import numpy as np
+
+from gesture_classifier import SYNTHETIC_LABELS, GestureIndex, benchmark, normalize_hands, synthetic_samples
+from hand_controller import GestureState, HandController
+from input_backends import RecordingBackend
+from landmark_features import RIGHT_CLICK, finger_states
+from synthetic_hands import make_hand
+
+
+def test_features_ignore_position_and_hand_size():
+    near = make_hand("pinky", x=0.3, y=0.7, scale=0.35)
+    far = make_hand("pinky", x=0.6, y=0.5, scale=0.15)
+    assert np.allclose(normalize_hands(near), normalize_hands(far), atol=1e-5)
+    assert normalize_hands(np.stack([near, far])).shape == (2, 60)
+
+
+def test_index_classifies_held_out_poses_and_round_trips(tmp_path):
+    index = GestureIndex.build(*synthetic_samples(100, seed=0))
+    path = tmp_path / "gestures.npz"
+    index.save(path)
+    loaded = GestureIndex.load(path)
+
+    hands, labels = synthetic_samples(40, seed=1)
+    codes, confidence = loaded.classify_batch(hands)
+    assert np.mean(codes == labels) > 0.98
+    assert ((confidence > 0) & (confidence <= 1)).all()
+
+    code, conf = loaded.classify(make_hand("two_fingers"))
+    assert code == SYNTHETIC_LABELS["two_fingers"] and conf > 0.9
+
+
+def test_benchmark_compares_with_the_rules():
+    index = GestureIndex.build(*synthetic_samples(60, seed=0))
+    results = benchmark(index, *synthetic_samples(20, seed=2), repeat=1)
+    assert set(results) == {"rules", "classifier"}
+    assert results["classifier"][0] > 0.95
+    assert results["classifier"][1] < 1e-3  # Well under a millisecond per frame
+
+
+def rebound_index(**kwargs):
+    """Two fingers bound to right click instead of scrolling - only the training labels change"""
+    hands, labels = synthetic_samples(60, seed=0)
+    two = np.array([finger_states(h)[1:].tolist() == [True, True, False, False] for h in hands])
+    labels = np.where(two, RIGHT_CLICK, labels)
+    return GestureIndex.build(hands, labels, **kwargs)
+
+
+def test_controller_uses_the_learned_bindings():
+    controller = HandController(use_camera=False, output=RecordingBackend(), gesture_model=rebound_index())
+    hand = make_hand("two_fingers")
+    fingers = controller.get_finger_states(hand)
+    assert controller.detect_gesture(fingers, hand) == GestureState.RIGHT_CLICK
+    assert controller.gesture_confidence > 0.9
+
+
+def test_controller_falls_back_to_rules_when_unsure():
+    controller = HandController(use_camera=False, output=RecordingBackend(),
+                                gesture_model=rebound_index(min_confidence=1.1))
+    hand = make_hand("two_fingers")
+    assert controller.detect_gesture(controller.get_finger_states(hand), hand) == GestureState.SCROLLING
@@ -0,0 +1,107 @@
+"""
+Tests for per-hand state and two-hand mode
+"""
+
+import pytest
+
+from hand_controller import GestureState, HandController
+from hand_state import HandState, HandTracker
+from input_backends import RecordingBackend
+from performance_governor import TWO_HAND_LEVELS
+from session_replay import ReplayClock
+from synthetic_hands import make_hand
+
+
+def test_hand_state_has_a_fixed_layout():
+    state = HandState("Right")
+    with pytest.raises(AttributeError):
+        state.typo = 1
+
+
+def test_identity_survives_a_swapped_handedness_label():
+    tracker = HandTracker()
+    left, right = make_hand("open", x=0.25), make_hand("open", x=0.7)
+    first = tracker.assign([left, right], ["Left", "Right"], now=0.0)
+    assert [s.label for s, _ in first] == ["Left", "Right"]
+
+    # MediaPipe swaps the labels for one frame; the hands barely moved
+    swapped = tracker.assign([make_hand("open", x=0.26), make_hand("open", x=0.69)], ["Right", "Left"], now=0.03)
+    assert [s.label for s, _ in swapped] == ["Left", "Right"]
+    assert tracker.relabeled == 2
+
+
+def test_new_hands_go_by_label_then_by_side():
+    tracker = HandTracker()
+    (state, _), = tracker.assign([make_hand("open", x=0.3)], ["Right"], now=0.0)
+    assert state.label == "Right"
+    tracker = HandTracker()
+    pairs = tracker.assign([make_hand("open", x=0.7), make_hand("open", x=0.2)], ["Left", "Left"], now=0.0)
+    assert [s.label for s, _ in pairs] == ["Right", "Left"]
+
+
+def replay(two_hands, frames):
+    clock = ReplayClock(10.0)
+    output = RecordingBackend(clock=clock)
+    controller = HandController(clock=clock, use_camera=False, output=output, headless=True, two_hands=two_hands)
+    states = []
+    for right, left in frames:
+        clock.now += 1 / 30
+        hands, labels = [], []
+        if left is not None and two_hands:
+            hands.append(left)
+            labels.append("Left")
+        if right is not None:
+            hands.append(right)
+            labels.append("Right")
+        states.append(controller.apply_hands(hands, labels))
+    return controller, output, states
+
+
+def test_modifier_hand_holds_keys_and_never_moves_the_cursor():
+    frames = [(make_hand("open", x=0.5 + 0.02 * i), make_hand("open", x=0.2)) for i in range(10)]
+    frames += [(make_hand("open", x=0.7), make_hand("pinch", x=0.2 + 0.03 * i)) for i in range(5)]
+    frames += [(make_hand("open", x=0.7 - 0.02 * i), None) for i in range(5)]  # Left hand leaves
+    controller, output, states = replay("Right", frames)
+    assert controller.quality.hands == 2 and TWO_HAND_LEVELS[-1].hands == 1
+
+    assert [e[1:] for e in output.ops("key_down", "key_up")] == [("key_down", ("shift",)), ("key_up", ("shift",))]
+    assert output.ops("key_down")[0][0] < output.ops("key_up")[0][0]
+    assert output.ops("click", "mouse_down") == []
+    assert set(states) == {GestureState.MOVING}
+
+    # The cursor follows the right hand exactly as it would with one hand in view
+    _, alone, _ = replay(None, frames)
+    assert [e[1:] for e in output.ops("move_to")] == [e[1:] for e in alone.ops("move_to")]
+
+
+@pytest.mark.parametrize("pose, key", [("pinch", "shift"), ("two_fingers", None)])
+def test_dropping_to_one_hand_releases_the_modifier_hand(pose, key):
+    frames = [(make_hand("open", x=0.6), make_hand("open", x=0.2)) for _ in range(5)]
+    frames += [(make_hand("open", x=0.6), make_hand(pose, x=0.2, y=0.6 - 0.02 * i)) for i in range(5)]
+    controller, output, _ = replay("Right", frames)
+    left = controller.tracker.states["Left"]
+    assert left.held_key == key and left.scrolling == (key is None)
+
+    controller.quality = TWO_HAND_LEVELS[-1]  # The governor's last resort tracks one hand
+    for cursor_pose in ["two_fingers"] * 10 + ["open"] * 5:
+        controller.clock.now += 1 / 30
+        controller.apply_hands([make_hand(cursor_pose, x=0.6)], ["Right"])
+
+    assert left.held_key is None and not left.scrolling and not controller.modifier_scrolling
+    assert len(output.ops("key_down")) == len(output.ops("key_up"))
+    assert not controller.scroll_engine.active  # The cursor hand's own scroll ended with its gesture
+
+
+def test_one_hand_drives_the_scroll_when_both_hold_two_fingers():
+    # Still hands at different heights: each frame's feed must not jump between them
+    frames = [(make_hand("two_fingers", x=0.6, y=0.4), None) for _ in range(5)]
+    frames += [(make_hand("two_fingers", x=0.6, y=0.4), make_hand("two_fingers", x=0.2, y=0.6)) for _ in range(20)]
+    frames += [(make_hand("two_fingers", x=0.6, y=0.4), make_hand("open", x=0.2)) for _ in range(5)]
+    controller, output, _ = replay("Right", frames)
+    assert sum(abs(amount) for _, _, (amount,) in output.ops("scroll")) < 10
+
+    # The modifier hand moving up scrolls up; the still cursor hand adds nothing
+    frames = [(make_hand("two_fingers", x=0.6, y=0.4), make_hand("two_fingers", x=0.2, y=0.6 - 0.01 * i))
+              for i in range(10)]
+    _, output, _ = replay("Right", frames)
+    assert 0 < sum(amount for _, _, (amount,) in output.ops("scroll")) < 200
@@ -0,0 +1,81 @@
+"""
+Tests for the batched HUD renderer
+"""
+
+import cv2
+import mediapipe as mp
+import numpy as np
+
+import hand_controller
+from frame_sources import SyntheticSource
+from hud_renderer import CYAN, HudRenderer
+from session_replay import ReplayLandmarks
+from synthetic_hands import make_hand
+
+
+def draw_overlay_unbatched(frame, state_name, gaming_mode):
+    """The original per-frame draw_info_overlay"""
+    h, w, c = frame.shape
+    if gaming_mode:
+        color = (0, 0, 255)
+        thick = 3
+        len_line = 50
+        cv2.line(frame, (0, 0), (len_line, 0), color, thick)
+        cv2.line(frame, (0, 0), (0, len_line), color, thick)
+        cv2.line(frame, (w, 0), (w - len_line, 0), color, thick)
+        cv2.line(frame, (w, 0), (w, len_line), color, thick)
+        cv2.line(frame, (0, h), (len_line, h), color, thick)
+        cv2.line(frame, (0, h), (0, h - len_line), color, thick)
+        cv2.line(frame, (w, h), (w - len_line, h), color, thick)
+        cv2.line(frame, (w, h), (w, h - len_line), color, thick)
+        cv2.putText(frame, "COMBAT MODE ACTIVE", (w // 2 - 150, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.7, color, 2)
+    cv2.putText(frame, state_name, (20, 50), cv2.FONT_HERSHEY_SIMPLEX, 1.0, (0, 255, 0), 2)
+    cv2.putText(frame, "'G': Game Mode | FIST: Pause | PINCH: Click", (20, h - 20),
+                cv2.FONT_HERSHEY_PLAIN, 1.2, (200, 200, 200), 1)
+
+
+def test_cached_overlay_matches_original_drawing():
+    renderer = HudRenderer(mp.solutions.hands.HAND_CONNECTIONS)
+    background = np.random.default_rng(0).integers(0, 255, (720, 1280, 3), dtype=np.uint8)
+    for gaming_mode in (False, True):
+        expected = background.copy()
+        draw_overlay_unbatched(expected, "MOVING", gaming_mode)
+        actual = background.copy()
+        renderer.draw_overlay(actual, "MOVING", gaming_mode)
+        # Exact for opaque text; anti-aliased edges (newer OpenCV) within rounding
+        assert np.abs(actual.astype(int) - expected).max() <= 2
+
+
+def test_skeleton_drawn_at_landmark_pixels():
+    renderer = HudRenderer(mp.solutions.hands.HAND_CONNECTIONS)
+    frame = np.zeros((720, 1280, 3), dtype=np.uint8)
+    points = make_hand("open", 0.5, 0.6)
+    renderer.draw_hand(frame, points, (50, 255, 50), flash_age=0.05, drag_progress=0.5)
+
+    px = renderer.pixel_points(points, 1280, 720)
+    # Joint rims are cyan around a black centre
+    x, y = px[12]
+    assert tuple(frame[y, x]) == (0, 0, 0)
+    assert tuple(frame[y, x + 3]) == CYAN
+
+
+def test_controller_draws_this_frames_drag_progress(monkeypatch, capsys):
+    poses = iter(["open"] * 5 + ["pinch"] * 4)
+
+    class ScriptedHands:
+        def process(self, rgb):
+            hand = ReplayLandmarks(make_hand(next(poses, "pinch"), 0.5, 0.6))
+            return type("Results", (), {"multi_hand_landmarks": [hand], "multi_handedness": None})()
+
+    controller = hand_controller.HandController(output="null", frame_source=SyntheticSource((320, 180), rate=30, frames=20))
+    controller.hands = ScriptedHands()
+    arcs = []
+    monkeypatch.setattr(controller.hud, "draw_hand", lambda frame, points, color, flash, drag: arcs.append(drag))
+    monkeypatch.setattr(hand_controller.cv2, "imshow", lambda *args: None)
+    monkeypatch.setattr(hand_controller.cv2, "waitKey", lambda delay: -1)
+    controller.run()  # Ends when the source does
+
+    assert "errors: 0" in capsys.readouterr().out
+    drags = [arc for arc in arcs if arc is not None]
+    assert arcs[0] is None and len(drags) >= 3
+    assert 0 < drags[0] and drags == sorted(drags) and drags[-1] <= 1.0  # Held pinch: the arc fills up
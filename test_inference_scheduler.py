@@ -0,0 +1,73 @@
+"""
+Tests for motion-gated inference scheduling
+"""
+
+import numpy as np
+
+from inference_scheduler import InferenceScheduler, LoadCounters
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def still_frame():
+    return np.full((72, 128, 3), 90, dtype=np.uint8)
+
+
+def moved_frame():
+    frame = still_frame()
+    frame[20:50, 40:80] = 200  # Something entered the view
+    return frame
+
+
+def run(scheduler, clock, frames, hand_found=False):
+    decisions = []
+    for frame in frames:
+        clock.now += 1 / 30
+        infer = scheduler.should_infer(frame)
+        scheduler.record(infer, hand_found and infer)
+        decisions.append(infer)
+    return decisions
+
+
+def test_idle_scene_drops_to_low_duty_cycle():
+    clock = FakeClock()
+    scheduler = InferenceScheduler(idle_interval=0.5, clock=clock)
+    decisions = run(scheduler, clock, [still_frame()] * 90)  # 3 s of nothing
+    assert 5 <= sum(decisions) <= 8  # ~2 per second instead of 30
+    assert scheduler.skipped == 90 - sum(decisions)
+
+
+def test_motion_resumes_inference_on_the_same_frame():
+    clock = FakeClock()
+    scheduler = InferenceScheduler(idle_interval=10.0, clock=clock)
+    run(scheduler, clock, [still_frame()] * 10)
+    assert run(scheduler, clock, [moved_frame()]) == [True]
+
+
+def test_tracked_hand_keeps_full_rate_even_when_still():
+    clock = FakeClock()
+    scheduler = InferenceScheduler(idle_interval=10.0, clock=clock)
+    assert all(run(scheduler, clock, [still_frame()] * 30, hand_found=True))
+
+
+def test_disabled_scheduler_infers_every_frame():
+    clock = FakeClock()
+    assert all(run(InferenceScheduler(enabled=False, clock=clock), clock, [still_frame()] * 30))
+
+
+def test_load_counters_per_second():
+    wall, cpu = FakeClock(), FakeClock()
+    counters = LoadCounters(clock=wall, cpu_clock=cpu)
+    for i in range(31):  # The 31st frame closes the 1 s window
+        wall.now += 1 / 30
+        cpu.now += 0.01
+        counters.note_frame(i % 3 == 0)
+    assert abs(counters.inferences_per_second - 10) < 1
+    assert abs(counters.frames_per_second - 30) < 1
+    assert abs(counters.cpu_per_second - 0.3) < 0.02
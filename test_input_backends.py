@@ -0,0 +1,118 @@
+"""
+Tests for the mouse output backends and the controller's cursor model
+"""
+
+import ctypes
+import os
+import sys
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from hand_controller import HandController
+from input_backends import PyAutoGUIBackend, RecordingBackend, make_backend
+from session_replay import ReplayClock, ReplayLandmarks
+from synthetic_hands import make_hand
+
+
+class CountingBackend(RecordingBackend):
+    """Recording backend that counts cursor position queries"""
+
+    def __init__(self):
+        super().__init__()
+        self.position_queries = 0
+
+    def cursor_position(self):
+        self.position_queries += 1
+        return super().cursor_position()
+
+
+def test_cursor_model_queries_os_only_on_hand_acquire():
+    output = CountingBackend()
+    controller = HandController(use_camera=False, output=output, clock=ReplayClock())
+    queries_at_start = output.position_queries
+
+    for i in range(20):
+        controller.move_cursor_relative(ReplayLandmarks(make_hand("open", 0.3 + i * 0.01, 0.5)))
+
+    assert output.position_queries == queries_at_start + 1
+    moves = output.ops("move_to")
+    assert moves and moves[-1][2] == (controller.cursor_x, controller.cursor_y)
+    assert output.stats.ops["move_to"][0] == len(moves)
+
+
+def test_pinch_release_records_click():
+    clock = ReplayClock(50.0)
+    output = RecordingBackend(clock=clock)
+    controller = HandController(use_camera=False, output=output, clock=clock)
+
+    controller.handle_click_status(True)
+    clock.now += 0.1
+    controller.handle_click_status(False)
+
+    assert [e[1] for e in output.events] == ["click"]
+
+
+def test_stats_keep_other_threads_out_of_thread_time():
+    output = RecordingBackend()
+    output.move_to(1, 1)
+    own = output.stats.thread_time()
+    worker = threading.Thread(target=lambda: [output.move_to(i, i) for i in range(100)])
+    worker.start()
+    worker.join()
+    assert output.stats.thread_time() == own
+    assert output.stats.ops["move_to"][0] == 101 and output.stats.total_time > own
+
+
+def test_pyautogui_backend_leaves_dpi_and_moves_alone_unless_absolute(monkeypatch):
+    calls = []
+    pyautogui = SimpleNamespace(moveTo=lambda x, y, _pause: calls.append(("moveTo", x, y)))
+    user32 = SimpleNamespace(SetCursorPos=lambda x, y: calls.append(("SetCursorPos", x, y)),
+                             SetProcessDPIAware=lambda: calls.append(("dpi",)))
+    shcore = SimpleNamespace(SetProcessDpiAwareness=lambda level: calls.append(("dpi", level)))
+    monkeypatch.setitem(sys.modules, "pyautogui", pyautogui)
+    monkeypatch.setattr(sys, "platform", "win32")
+    monkeypatch.setattr(ctypes, "windll", SimpleNamespace(user32=user32, shcore=shcore), raising=False)
+
+    PyAutoGUIBackend().move_to(10, 20)
+    assert calls == [("moveTo", 10, 20)]  # The default relative mode: no DPI change, plain pyautogui
+
+    calls.clear()
+    make_backend("pyautogui", whole_desktop=True).move_to(-300, 20)
+    assert calls == [("dpi", 2), ("SetCursorPos", -300, 20)]
+
+
+def test_xtest_moves_are_absolute(monkeypatch):
+    from Xlib import X, display
+    from Xlib.ext import xtest
+
+    root = SimpleNamespace(query_pointer=lambda: SimpleNamespace(root_x=100, root_y=100))
+    fake_display = SimpleNamespace(has_extension=lambda name: True, screen=lambda: SimpleNamespace(root=root),
+                                   flush=lambda: None)
+    sent = []
+    monkeypatch.setattr(display, "Display", lambda name: fake_display)
+    monkeypatch.setattr(xtest, "fake_input",
+                        lambda d, event, detail, root, x, y: sent.append((event, detail, root, x, y)))
+
+    backend = make_backend("xtest")
+    backend.move_to(130, 90)
+    backend.move_to(130, 90)  # Unchanged: nothing sent
+    backend.move_to(131, 92)
+    # Root coordinates, not deltas: pointer acceleration can't make the cursor drift from the model
+    assert sent == [(X.MotionNotify, 0, root, 130, 90), (X.MotionNotify, 0, root, 131, 92)]
+
+
+def test_unknown_backend_name():
+    with pytest.raises(ValueError):
+        make_backend("bogus")
+
+
+@pytest.mark.skipif(not os.environ.get("DISPLAY"), reason="needs an X server (e.g. Xvfb)")
+def test_xtest_backend_moves_pointer():
+    backend = make_backend("xtest")
+    x, y = backend.cursor_position()
+    target = (x + 5 if x < 100 else x - 5, y)
+    backend.move_to(*target)
+    assert backend.cursor_position() == target
+    backend.close()
@@ -0,0 +1,42 @@
+"""
+Tests for vectorized landmark feature extraction
+"""
+
+import numpy as np
+
+from hand_controller import HandController
+from input_backends import RecordingBackend
+from landmark_features import classify_gestures, extract_features, landmarks_to_array
+from session_replay import ReplayClock, ReplayLandmarks
+from synthetic_hands import make_hand, make_stream
+
+
+def test_array_matches_landmark_objects():
+    points = make_hand("pinch", 0.4, 0.7)
+    assert np.array_equal(landmarks_to_array(ReplayLandmarks(points)), points)
+
+
+def test_single_and_batch_features_agree():
+    _, hands = make_stream([(pose, 0.5, 0.6) for pose in ["open", "fist", "pinch"]])
+    batch = extract_features(hands)
+    assert batch.fingers.shape == (3, 5)
+    assert batch.tracking_point.shape == (3, 2)
+    for i in range(3):
+        single = extract_features(hands[i])
+        assert np.array_equal(single.fingers, batch.fingers[i])
+        assert np.isclose(single.pinch_dist, batch.pinch_dist[i])
+        assert np.isclose(single.palm_scale, batch.palm_scale[i])
+
+
+def test_batch_classification_matches_controller():
+    poses = ["open"] * 5 + ["fist"] * 3 + ["pinky"] * 20 + ["two_fingers"] * 5 + ["pinch"] * 5 + ["open"] * 3
+    timestamps, hands = make_stream([(pose, 0.5, 0.6) for pose in poses], start=10.0)
+
+    clock = ReplayClock()
+    controller = HandController(use_camera=False, output=RecordingBackend(), clock=clock)
+    expected = []
+    for t, points in zip(timestamps, hands):
+        clock.now = t
+        expected.append(controller.detect_gesture(controller.get_finger_states(points), points).value)
+
+    assert classify_gestures(extract_features(hands), timestamps).tolist() == expected
@@ -0,0 +1,147 @@
+"""
+Tests for the shared-memory landmark service
+"""
+
+import os
+import subprocess
+import sys
+import time
+import uuid
+from types import SimpleNamespace
+
+import mediapipe as mp
+import numpy as np
+import pytest
+
+from frame_sources import SyntheticSource
+from hand_controller import HandController
+from input_backends import RecordingBackend
+from landmark_service import LandmarkPublisher, LandmarkSubscriber, SubscribedSource, serve_camera
+from session_replay import HAND_RIGHT, ReplayLandmarks, SessionRecorder
+from synthetic_hands import make_hand
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def make_handedness(label):
+    return SimpleNamespace(classification=[SimpleNamespace(label=label)])
+
+
+@pytest.fixture
+def name():
+    return f"hpmc_test_{uuid.uuid4().hex[:8]}"
+
+
+def test_subscriber_reads_published_records_with_sequence_numbers(name):
+    publisher = LandmarkPublisher(name, capacity=8, preview_size=None)
+    subscriber = LandmarkSubscriber(name)
+    try:
+        assert subscriber.latest(timeout=0.01) == (None, None)
+
+        hand = make_hand("open")
+        publisher.publish(12.5, [ReplayLandmarks(hand)], [make_handedness("Right")])
+        record, preview = subscriber.latest(timeout=0.1)
+        assert preview is None
+        assert record["timestamp"] == 12.5
+        assert record["num_hands"] == 1
+        assert record["handedness"][0] == HAND_RIGHT
+        assert np.allclose(record["landmarks"][0], hand)
+        assert subscriber.seq == 1
+
+        # A slow consumer skips to the newest record and counts what it missed
+        for i in range(5):
+            publisher.publish(13.0 + i, None)
+        record, _ = subscriber.latest(timeout=0.1)
+        assert record["timestamp"] == 17.0 and record["num_hands"] == 0
+        assert subscriber.seq == 6
+        assert subscriber.missed == 4
+        assert subscriber.received == 2
+    finally:
+        subscriber.close()
+        publisher.close()
+
+
+def test_previews_are_copied_and_shutdown_is_seen(name):
+    publisher = LandmarkPublisher(name, preview_size=(32, 18), frame_slots=2)
+    subscriber = LandmarkSubscriber(name)
+    frame = np.random.default_rng(0).integers(0, 256, (18, 32, 3), dtype=np.uint8)
+    publisher.publish(1.0, None, preview=frame)
+    _, preview = subscriber.latest(timeout=0.1)
+    assert np.array_equal(preview, frame)
+
+    # The copy is the subscriber's own: later publishes don't change it under the reader
+    publisher.publish(2.0, None, preview=np.zeros_like(frame))
+    assert np.array_equal(preview, frame)
+    record, preview = subscriber.latest(timeout=0.1)
+    assert record["timestamp"] == 2.0 and not preview.any()
+
+    publisher.close()
+    start = time.perf_counter()
+    assert subscriber.latest(timeout=1.0) == (None, None)
+    assert time.perf_counter() - start < 0.5  # Returns at once when the service shuts down
+    subscriber.close()
+
+
+def test_subscribed_controller_runs_gestures_from_the_service(name):
+    publisher = LandmarkPublisher(name, preview_size=None)
+    output = RecordingBackend()
+    controller = HandController(use_camera=False, output=output, headless=True, subscribe=name)
+    try:
+        assert controller.preprocess.mirror == "none"  # The service mirrors
+        controller.grabber = controller.source
+        controller.preprocess.to_rgb = None  # The service already ran inference: no frame conversion here
+        for i in range(10):
+            publisher.publish(5.0 + i / 30, [make_hand("open", x=0.4 + i * 0.02)], [make_handedness("Right")])
+            assert controller.step()
+        assert controller.frame_time == pytest.approx(5.3)
+        assert any(op == "move_to" for _, op, _ in output.events)  # Open palm moved the cursor
+        assert controller.source.frames_captured == 10
+    finally:
+        controller.source.close()
+        publisher.close()
+
+
+def test_service_tracks_as_many_hands_as_asked(name, monkeypatch):
+    built = []
+
+    class FakeHands:
+        def __init__(self, **options):
+            built.append(options["max_num_hands"])
+
+        def process(self, rgb):
+            return SimpleNamespace(multi_hand_landmarks=None, multi_handedness=None)
+
+        def close(self):
+            pass
+
+    monkeypatch.setattr(mp.solutions.hands, "Hands", FakeHands)
+    publisher = LandmarkPublisher(name, preview_size=None)
+    try:
+        serve_camera(publisher, SyntheticSource((64, 36), frames=3), max_hands=2)
+    finally:
+        publisher.close()
+    assert built == [2]
+
+
+def test_daemon_replays_a_session(name, tmp_path):
+    path = tmp_path / "open.lmk"
+    recorder = SessionRecorder(path)
+    for i in range(400):
+        recorder.write(i / 100, [ReplayLandmarks(make_hand("open"))], [make_handedness("Right")])
+    recorder.close()
+
+    daemon = subprocess.Popen([sys.executable, os.path.join(HERE, "landmark_service.py"),
+                               "--name", name, "--replay", str(path)],
+                              cwd=HERE, stdout=subprocess.PIPE, text=True)
+    try:
+        assert "Publishing" in daemon.stdout.readline()
+        source = SubscribedSource(name)
+        ok, frame = source.read(timeout=2.0)
+        assert ok and frame.shape == (720, 1280, 3) and not frame.any()  # No preview: blank canvas
+        results = source.process(frame)
+        assert len(results.multi_hand_landmarks[0].landmark) == 21
+        assert results.multi_handedness[0].classification[0].label == "Right"
+        source.close()
+    finally:
+        daemon.terminate()
+        daemon.wait(timeout=5)
@@ -0,0 +1,65 @@
+"""
+Tests for the per-stage latency profiler
+"""
+
+import csv
+import json
+
+import pytest
+
+from latency_profiler import LatencyProfiler, StageRing
+
+
+def test_ring_percentiles_follow_the_rolling_window():
+    ring = StageRing(100)
+    for _ in range(100):
+        ring.push(0.001)
+    assert ring.percentile(50) == pytest.approx(0.001, rel=0.15)
+
+    # A full window of slow samples evicts the fast ones from the histogram
+    for _ in range(100):
+        ring.push(0.020)
+    assert ring.hist.sum() == 100
+    assert ring.percentile(50) == pytest.approx(0.020, rel=0.15)
+
+
+def test_ring_tail_percentile():
+    ring = StageRing(1000)
+    for i in range(1000):
+        ring.push(0.050 if i % 50 == 0 else 0.002)  # 2% slow samples
+    assert ring.percentile(95) == pytest.approx(0.002, rel=0.15)
+    assert ring.percentile(99) == pytest.approx(0.050, rel=0.15)
+
+
+def test_frames_export_and_slow_frame_count(tmp_path):
+    prof = LatencyProfiler(budget=0.0)
+    for _ in range(3):
+        prof.begin_frame()
+        prof.lap("capture")
+        prof.add("injection", 0.002)
+        prof.add("gesture", -0.002)
+        prof.end_frame()
+    assert prof.frames == 3 and prof.slow_frames == 3
+
+    prof.export(tmp_path / "timings.csv")
+    with open(tmp_path / "timings.csv") as f:
+        rows = list(csv.reader(f))
+    assert rows[0][:3] == ["timestamp", "total", "capture"]
+    assert len(rows) == 4
+    assert float(rows[1][rows[0].index("injection")]) == pytest.approx(0.002)
+
+    prof.export(tmp_path / "timings.json")
+    with open(tmp_path / "timings.json") as f:
+        data = json.load(f)
+    assert len(data["frames"]) == 3 and "inference" in data["percentiles_ms"]
+
+
+def test_errors_are_counted_not_swallowed(capsys):
+    prof = LatencyProfiler()
+    for _ in range(3):
+        try:
+            raise ValueError("bad landmark")
+        except ValueError as e:
+            prof.record_error(e)
+    assert prof.errors == {("ValueError", "bad landmark"): 3}
+    assert capsys.readouterr().out.count("[LOOP ERROR]") == 1
@@ -0,0 +1,61 @@
+"""
+Tests for the adaptive performance governor
+"""
+
+from performance_governor import QUALITY_LEVELS, PerformanceGovernor
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def simulate(governor, clock, cost_of_level, seconds, fps=30.0):
+    """Run frames whose work time depends on the current level"""
+    for _ in range(int(seconds * fps)):
+        clock.now += 1 / fps
+        governor.observe(cost_of_level(governor.level))
+
+
+def test_steps_down_while_over_budget_and_logs_switches():
+    clock = FakeClock()
+    governor = PerformanceGovernor(budget=0.033, clock=clock, verbose=False)
+    simulate(governor, clock, lambda level: 0.050 if level < 2 else 0.025, seconds=20)
+    assert governor.level == 2
+    assert [(f, t) for _, f, t, _ in governor.switches] == [(0, 1), (1, 2)]
+    # Each switch waits for the dwell time
+    assert governor.switches[1][0] - governor.switches[0][0] >= governor.min_dwell
+
+
+def test_steps_back_up_with_headroom():
+    clock = FakeClock()
+    governor = PerformanceGovernor(budget=0.033, clock=clock, verbose=False)
+    simulate(governor, clock, lambda level: 0.050, seconds=5)
+    assert governor.level > 0
+    simulate(governor, clock, lambda level: 0.008, seconds=20)
+    assert governor.level == 0
+
+
+def test_in_between_load_does_not_switch():
+    clock = FakeClock()
+    governor = PerformanceGovernor(budget=0.033, clock=clock, verbose=False)
+    simulate(governor, clock, lambda level: 0.025, seconds=30)  # Under budget, but not 60% of it
+    assert governor.switches == []
+
+
+def test_flapping_backs_off():
+    # Level 0 is over budget, level 1 looks like plenty of headroom: the naive loop would flap forever
+    clock = FakeClock()
+    governor = PerformanceGovernor(budget=0.033, clock=clock, verbose=False)
+    simulate(governor, clock, lambda level: 0.045 if level == 0 else 0.010, seconds=120)
+    raises = [s for s in governor.switches if s[2] < s[1]]
+    assert len(raises) <= 5
+    assert governor.dwell > governor.min_dwell
+
+
+def test_level_zero_is_the_original_configuration():
+    best = QUALITY_LEVELS[0]
+    assert (best.complexity, best.width, best.height, best.detection, best.tracking) == (1, 1280, 720, 0.8, 0.7)
@@ -0,0 +1,72 @@
+"""
+Tests for ROI-cropped hand tracking
+"""
+
+from types import SimpleNamespace
+
+import numpy as np
+
+from roi_tracker import RoiHandTracker
+from synthetic_hands import make_hand
+
+
+class ScriptedHands:
+    """Stands in for mp.solutions.hands.Hands: returns the next scripted hand (or none)"""
+
+    def __init__(self, script):
+        self.script = list(script)
+        self.input_shapes = []
+
+    def reset(self):
+        self.input_shapes.append("reset")
+
+    def process(self, rgb):
+        self.input_shapes.append(rgb.shape)
+        points = self.script.pop(0)
+        if points is None:
+            return SimpleNamespace(multi_hand_landmarks=None)
+        marks = SimpleNamespace(landmark=[SimpleNamespace(x=float(x), y=float(y), z=float(z)) for x, y, z in points])
+        return SimpleNamespace(multi_hand_landmarks=[marks])
+
+
+def as_array(results):
+    return np.array([(lm.x, lm.y, lm.z) for lm in results.multi_hand_landmarks[0].landmark])
+
+
+def test_tracks_in_crop_and_maps_back_to_frame():
+    frame = np.zeros((720, 1280, 3), dtype=np.uint8)
+    full = make_hand("open", 0.5, 0.6, scale=0.2)
+    hands = ScriptedHands([full, None, None])
+    tracker = RoiHandTracker(hands, roi_size=128)
+
+    tracker.process(frame)
+    assert tracker.mode == "ROI"
+    x0, y0, side = tracker.box
+
+    # The crop-relative landmarks the model would report for the same hand
+    hands.script.insert(0, np.column_stack([
+        (full[:, 0] * 1280 - x0) / side,
+        (full[:, 1] * 720 - y0) / side,
+        full[:, 2] * 1280 / side,
+    ]))
+    results = tracker.process(frame)
+    assert hands.input_shapes[1:3] == ["reset", (128, 128, 3)]
+    assert np.allclose(as_array(results), full, atol=1e-5)
+
+    # Lost in the crop -> same-frame full-frame retry
+    results = tracker.process(frame)
+    assert results.multi_hand_landmarks is None
+    assert hands.input_shapes[-1] == (720, 1280, 3)
+    assert tracker.mode == "FULL" and tracker.roi_misses == 1
+
+
+def test_graph_is_reset_when_switching_between_crop_and_full_frame():
+    frame = np.zeros((720, 1280, 3), dtype=np.uint8)
+    hand = make_hand("open", 0.5, 0.6, scale=0.2)
+    hands = ScriptedHands([hand, hand, hand, None, hand])
+    tracker = RoiHandTracker(hands, roi_size=128)
+    for _ in range(4):
+        tracker.process(frame)
+    full, crop = (720, 1280, 3), (128, 128, 3)
+    # Full-frame detection, two crops (no reset between crops), lost in the crop -> full frame
+    assert hands.input_shapes == [full, "reset", crop, crop, crop, "reset", full]
@@ -0,0 +1,104 @@
+"""
+Tests for the inertial scroll engine, including scroll traces through replay
+"""
+
+import numpy as np
+import pytest
+
+from hand_controller import HandController
+from input_backends import RecordingBackend
+from scroll_engine import ScrollEngine
+from session_replay import SESSION_DTYPE, ReplayClock, replay_session
+from synthetic_hands import make_hand
+
+
+def drive(engine, ys, fps=30.0, rate_hz=30.0, tail=0.0):
+    """Feed hand ys at fps, advance at rate_hz; returns [(t, amount)] of non-zero outputs"""
+    trace = []
+    t_end = len(ys) / fps + tail
+    ticks = np.arange(0.0, t_end, 1.0 / rate_hz)
+    frame = 0
+    for t in ticks:
+        while frame < len(ys) and frame / fps <= t:
+            engine.feed(ys[frame], frame / fps)
+            frame += 1
+        if frame == len(ys):
+            engine.release()
+        amount = engine.advance(t)
+        if amount:
+            trace.append((t, amount))
+    return trace
+
+
+def test_slow_scroll_accumulates_sub_unit_motion():
+    # 0.001 per frame: the old per-frame threshold dropped every single frame
+    ys = 0.5 + 0.001 * np.arange(60)
+    trace = drive(ScrollEngine(), ys, tail=0.5)
+    total = sum(a for _, a in trace)
+    assert total == pytest.approx(-(0.059 - 0.004) * 2000, abs=2)
+    assert all(a < 0 for _, a in trace)  # Hand down scrolls down, no jitter reversals
+
+
+def test_output_is_spread_over_a_steady_rate():
+    ys = 0.5 - 0.01 * np.arange(30)
+    trace = drive(ScrollEngine(), ys, rate_hz=120.0)
+    amounts = [a for _, a in trace]
+    assert len(amounts) > 60  # Several events per camera frame
+    assert max(amounts) <= 10  # Each 20-unit frame step is split up
+
+
+def test_jitter_inside_deadband_does_not_scroll():
+    ys = 0.5 + 0.003 * np.sign(np.sin(np.arange(60)))
+    assert drive(ScrollEngine(), ys, tail=0.5) == []
+
+
+@pytest.mark.parametrize("curve", ["exponential", "linear"])
+def test_momentum_decays_after_release(curve):
+    ys = 0.5 - 0.01 * np.arange(15)
+    engine = ScrollEngine(momentum=curve, friction_rate=4.0)
+    trace = drive(engine, ys, rate_hz=60.0, tail=2.0)
+    after = [a for t, a in trace if t > 15 / 30 + 0.05]
+    assert len(after) > 5
+    assert after[0] > after[-1] > 0  # Keeps going the same way, slowing down
+    assert not engine.coasting  # ... and eventually stops
+
+    plain = drive(ScrollEngine(), ys, rate_hz=60.0, tail=2.0)
+    assert sum(a for _, a in trace) > sum(a for _, a in plain)
+
+
+def test_stop_catches_momentum():
+    engine = ScrollEngine(momentum="exponential")
+    drive(engine, 0.5 - 0.01 * np.arange(15), rate_hz=60.0)
+    assert engine.coasting
+    engine.stop()
+    assert engine.advance(1.0) == 0 and engine.advance(1.1) == 0
+
+
+def make_session(poses_and_y, fps=30.0):
+    session = np.zeros(len(poses_and_y), dtype=SESSION_DTYPE)
+    for i, (pose, y) in enumerate(poses_and_y):
+        session[i]["timestamp"] = 100.0 + i / fps
+        if pose is not None:
+            session[i]["num_hands"] = 1
+            session[i]["landmarks"][0] = make_hand(pose, y=y)
+    return session
+
+
+def scroll_trace(session, **kwargs):
+    clock = ReplayClock()
+    output = RecordingBackend(clock=clock)
+    controller = HandController(use_camera=False, output=output, clock=clock, **kwargs)
+    replay_session(controller, session, clock)
+    return [(t, args[0]) for t, _, args in output.ops("scroll")]
+
+
+def test_replay_scroll_trace_with_momentum():
+    frames = [("open", 0.6)] * 20 + [("two_fingers", 0.6 - 0.004 * i) for i in range(20)] + [(None, 0)] * 40
+    session = make_session(frames)
+    plain = scroll_trace(session)
+    coasting = scroll_trace(session, scroll_momentum="exponential")
+
+    assert plain and all(amount > 0 for _, amount in plain)  # Hand moving up scrolls up
+    hand_gone = session["timestamp"][40]
+    assert not [t for t, _ in plain if t > hand_gone + 0.1]
+    assert [t for t, _ in coasting if t > hand_gone + 0.1]
@@ -0,0 +1,55 @@
+"""
+Tests for landmark session recording and replay
+"""
+
+from types import SimpleNamespace
+
+import numpy as np
+
+from hand_controller import GestureState, HandController
+from input_backends import RecordingBackend
+from session_replay import (HAND_RIGHT, ReplayClock, ReplayLandmarks, SessionRecorder,
+                            load_session, replay_session)
+from synthetic_hands import make_hand
+
+
+def make_handedness(label):
+    return SimpleNamespace(classification=[SimpleNamespace(label=label)])
+
+
+def test_recorded_session_round_trips_through_memmap(tmp_path):
+    path = tmp_path / "session.lmk"
+    points = np.random.default_rng(0).random((21, 3)).astype(np.float32)
+
+    recorder = SessionRecorder(path)
+    recorder.write(1.0, [ReplayLandmarks(points)], [make_handedness("Right")])
+    recorder.write(1.033, None)
+    recorder.close()
+
+    session = load_session(path)
+    assert len(session) == 2
+    assert session["num_hands"].tolist() == [1, 0]
+    assert session["handedness"][0][0] == HAND_RIGHT
+    assert np.allclose(session["landmarks"][0][0], points)
+    assert session["timestamp"][1] == 1.033
+
+
+def test_replay_drives_gestures_with_simulated_clock(tmp_path):
+    path = tmp_path / "pinch.lmk"
+    recorder = SessionRecorder(path)
+    t = 100.0
+    for pose in ["open"] * 20 + ["pinch"] * 3 + ["open"] * 2:
+        recorder.write(t, [ReplayLandmarks(make_hand(pose))])
+        t += 1 / 30
+    recorder.write(t, None)
+    recorder.close()
+
+    clock = ReplayClock()
+    output = RecordingBackend(clock=clock)
+    controller = HandController(use_camera=False, output=output, clock=clock)
+    states = replay_session(controller, load_session(path), clock)
+
+    assert states[20] == GestureState.LEFT_CLICK
+    assert states[-1] is None
+    # A 3-frame pinch (0.1s) is shorter than the drag delay: exactly one click
+    assert [e[1] for e in output.ops("click", "mouse_down")] == ["click"]
@@ -0,0 +1,54 @@
+"""
+Tests for startup profiling and parallel initialisation
+"""
+
+import threading
+
+import pytest
+
+from startup_profile import StartupProfile, parallel_init
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 10.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_phases_and_milestones_are_offsets_from_start():
+    clock = FakeClock()
+    profile = StartupProfile(start=9.0, clock=clock)
+    with profile.phase("camera"):
+        clock.now = 10.5
+    profile.mark("first_frame")
+    clock.now = 12.0
+    profile.mark("first_frame")  # Only the first occurrence counts
+
+    assert profile.phases == [("camera", 1.0, 0.5, "MainThread")]
+    assert profile.milestones == {"first_frame": 1.5}
+    assert any(line.startswith("first frame") for line in profile.report())
+
+
+def test_parallel_init_runs_tasks_concurrently():
+    barrier = threading.Barrier(2, timeout=5)
+
+    def task(value):
+        barrier.wait()  # Deadlocks (times out) unless both tasks run at once
+        return value
+
+    profile = StartupProfile()
+    built = parallel_init(profile, {"camera": lambda: task(1), "model": lambda: task(2)})
+    assert built == {"camera": 1, "model": 2}
+    assert sorted(p[0] for p in profile.phases) == ["camera", "model"]
+
+
+def test_parallel_init_reraises_task_errors():
+    def broken():
+        raise RuntimeError("no camera")
+
+    profile = StartupProfile()
+    with pytest.raises(RuntimeError, match="no camera"):
+        parallel_init(profile, {"camera": broken, "model": lambda: 2})
+    assert len(profile.phases) == 2
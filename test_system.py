@@ -2,14 +2,15 @@
 Test script to verify camera and MediaPipe installation
 """
 
-import cv2
 import mediapipe as mp
 import sys
 
+from frame_sources import CameraSource
+
 def test_camera():
     """Test if camera is accessible"""
     print("Testing camera access...")
-    cap = cv2.VideoCapture(0)
+    cap = CameraSource(0)
     
     if not cap.isOpened():
         print("[X] ERROR: Cannot access camera")
@@ -21,7 +22,7 @@ def test_camera():
         cap.release()
         return False
     
-    print(f"[OK] Camera OK - Resolution: {frame.shape[1]}x{frame.shape[0]}")
+    print(f"[OK] Camera OK - {cap.describe()}")
     cap.release()
     return True
 
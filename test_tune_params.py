@@ -0,0 +1,52 @@
+"""
+Tests for the tuning profile and the parameter-sweep tuner
+"""
+
+import pytest
+
+from hand_controller import HandController
+from input_backends import RecordingBackend
+from tune_params import _match, evaluate, grid_candidates, run_search, synthetic_labelled_session
+from tuning_profile import DEFAULTS, load_profile, save_profile
+
+
+def test_profile_round_trip_and_unknown_names(tmp_path):
+    path = tmp_path / "profile.json"
+    save_profile(path, load_profile({"sensitivity": 2}), score=1.5)
+    params = load_profile(path)
+    assert params["sensitivity"] == 2.0 and params["drag_delay"] == DEFAULTS["drag_delay"]
+    with pytest.raises(ValueError, match="sensitivty"):
+        load_profile({"sensitivty": 2})
+
+
+def test_controller_reads_its_parameters_from_the_profile():
+    controller = HandController(use_camera=False, output=RecordingBackend(), tuning={"sensitivity": 2.0})
+    assert controller.sensitivity == 2.0
+    assert controller.tuning["pinch_threshold"] == DEFAULTS["pinch_threshold"]
+
+
+def test_events_are_matched_to_labels_by_type_and_time():
+    expected = [{"type": "click", "time": 1.0}, {"type": "drag", "start": 2.0, "end": 3.0},
+                {"type": "right_click", "time": 5.0}]
+    injected = [(1.1, "click"), (2.2, "mouse_down"), (4.0, "click")]
+    assert _match(expected, injected) == (1, 1)  # Stray click at 4 s, right click never happened
+
+
+def test_scores_penalize_a_bad_drag_delay(capsys):
+    sessions = [synthetic_labelled_session(0)]
+    good, metrics = evaluate(load_profile(), sessions)
+    assert metrics["false_clicks"] == metrics["missed_clicks"] == 0
+    assert capsys.readouterr().out == ""  # Replays run quiet: no line per click
+    # Drags shorter than the delay turn into clicks: one missed drag and one stray click each
+    bad, metrics = evaluate(load_profile({"drag_delay": 1.5}), sessions)
+    assert metrics["missed_clicks"] == metrics["false_clicks"] == 3
+    assert bad > good
+
+
+def test_sweep_ranks_configurations_best_first():
+    sessions = [synthetic_labelled_session(1)]
+    candidates = [{}] + grid_candidates({"drag_delay": [0.2, 1.5], "sensitivity": [1.3]})
+    results = run_search(sessions, candidates, workers=2)
+    assert len(results) == 3
+    assert [r[0] for r in results] == sorted(r[0] for r in results)
+    assert results[-1][2]["drag_delay"] == 1.5
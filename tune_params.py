@@ -0,0 +1,305 @@
+"""
+Parameter-Sweep Tuner
+Finds values for the controller's feel parameters (tuning_profile.py) by
+replaying labelled landmark sessions through the real gesture and cursor
+logic - simulated clock, null output backend, no camera - for many
+configurations in parallel, and scoring each one on:
+
+    false clicks   clicks / right clicks / drags injected that weren't intended
+    missed clicks  intended ones that never happened
+    cursor lag     delay (ms) that best aligns cursor motion with hand motion
+    jitter         cursor travel while the hand is held still, as a percentage
+                   of its travel while the hand moves (so lower gain doesn't win)
+
+Labels live next to each session: NAME.lmk + NAME.labels.json
+    {"events": [{"type": "click", "time": 3.2},
+                {"type": "right_click", "time": 5.0},
+                {"type": "drag", "start": 7.1, "end": 8.4}]}
+
+Search strategies:
+    --grid NAME=V1,V2,...    every combination of the listed values
+    --random N               N uniform samples from SEARCH_SPACE
+    --adaptive N --rounds R  cross-entropy search: sample N, refit the sampling
+                             distribution to the best fifth, repeat R times
+
+    python tune_params.py sessions/*.lmk --random 200 --out tuning_profile.json
+    python tune_params.py --synthetic 4 --adaptive 64 --rounds 4     # no recordings needed
+"""
+
+import argparse
+import itertools
+import json
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from landmark_features import INDEX_MCP
+from session_replay import SESSION_DTYPE
+from tuning_profile import DEFAULTS, load_profile, save_profile
+
+# (low, high) for random / adaptive search
+SEARCH_SPACE = {
+    "sensitivity": (0.8, 2.5),
+    "smooth_max": (0.6, 0.97),
+    "smooth_range": (0.3, 0.9),
+    "smooth_exponent": (0.3, 1.5),
+    "accel_gain": (0.0, 0.15),
+    "pinch_threshold": (0.03, 0.08),
+    "drag_delay": (0.1, 0.5),
+    "fist_guard": (0.2, 0.8),
+    "right_click_cooldown": (0.4, 1.5),
+}
+
+# score = sum(weight * metric); lower is better
+SCORE_WEIGHTS = {"false_clicks": 10.0, "missed_clicks": 10.0, "lag_ms": 0.05, "jitter_pct": 0.2}
+
+MATCH_TOLERANCE = 0.35  # Seconds an injected event may be off from its label
+STILL_SPEED = 0.002     # Normalized hand travel per frame below which the hand counts as still
+
+
+# --- Labelled sessions ------------------------------------------------------
+
+def load_labelled(path):
+    from session_replay import load_session
+
+    labels_path = os.path.splitext(path)[0] + ".labels.json"
+    with open(labels_path) as f:
+        labels = json.load(f)
+    return np.array(load_session(path)), labels["events"]
+
+
+def synthetic_labelled_session(seed=0, fps=30.0):
+    """A scripted session of moves, holds, clicks, drags and right clicks with landmark noise, and its labels"""
+    from synthetic_hands import make_hand
+
+    rng = np.random.default_rng(seed)
+    frames, events = [], []
+    x, y = 0.5, 0.6
+
+    def hold(pose, seconds, dx=0.0, dy=0.0):
+        nonlocal x, y
+        n = max(1, int(round(seconds * fps)))
+        for i in range(n):
+            ease = 2 * np.sin(np.pi * (i + 0.5) / n) ** 2  # Speeds up and slows down; averages 1
+            x = min(max(x + ease * dx / fps, 0.2), 0.8)
+            y = min(max(y + ease * dy / fps, 0.4), 0.8)
+            hand = make_hand(pose, x, y)
+            hand[:, :2] += rng.normal(0, 0.0015, (21, 2))
+            frames.append(hand)
+
+    def now():
+        return len(frames) / fps
+
+    hold("fist", 0.5)
+    hold("open", 1.0)  # Past the fist guard
+    for _ in range(3):
+        hold("open", rng.uniform(0.6, 1.2), rng.uniform(-0.3, 0.3), rng.uniform(-0.2, 0.2))
+        hold("open", 0.8)  # Still: jitter
+        hold("pinch", 0.1)
+        events.append({"type": "click", "time": now()})
+        hold("open", 0.6)
+        start = now()
+        hold("pinch", 0.9, rng.uniform(-0.2, 0.2), 0.0)
+        events.append({"type": "drag", "start": start, "end": now()})
+        hold("open", 0.8)
+        events.append({"type": "right_click", "time": now()})
+        hold("pinky", 0.25)
+        hold("fist", 0.4)
+        hold("open", 1.0)
+
+    session = np.zeros(len(frames), dtype=SESSION_DTYPE)
+    session["timestamp"] = np.arange(len(frames)) / fps
+    session["num_hands"] = 1
+    session["landmarks"][:, 0] = np.stack(frames)
+    return session, events
+
+
+# --- Scoring ----------------------------------------------------------------
+
+def _match(expected, injected):
+    """Greedy one-to-one matching by type and time; returns (false, missed)"""
+    used = set()
+    missed = 0
+    for event in expected:
+        if event["type"] == "drag":
+            lo, hi, op = event["start"] - MATCH_TOLERANCE, event["end"], "mouse_down"
+        else:
+            lo, hi, op = event["time"] - MATCH_TOLERANCE, event["time"] + MATCH_TOLERANCE, event["type"]
+        hit = next((i for i, (t, kind) in enumerate(injected) if i not in used and kind == op and lo <= t <= hi),
+                   None)
+        if hit is None:
+            missed += 1
+        else:
+            used.add(hit)
+    return len(injected) - len(used), missed
+
+
+def _lag(hand, cursor, interval, max_frames=15):
+    """Shift (seconds) that best correlates cursor velocity with hand velocity"""
+    hv, cv = np.diff(hand, axis=0), np.diff(cursor, axis=0)
+    hv, cv = hv - hv.mean(axis=0), cv - cv.mean(axis=0)
+    best, best_corr = 0, -np.inf
+    for shift in range(min(max_frames, len(hv) - 2) + 1):
+        a, b = hv[:len(hv) - shift], cv[shift:]
+        norm = np.linalg.norm(a) * np.linalg.norm(b)
+        corr = float(np.sum(a * b) / norm) if norm else -np.inf
+        if corr > best_corr:
+            best, best_corr = shift, corr
+    return best * interval
+
+
+def evaluate_session(params, session, expected):
+    """Replay one session with `params`; returns its metrics"""
+    from hand_controller import HandController
+    from input_backends import RecordingBackend
+    from session_replay import ReplayClock, replay_session
+
+    clock = ReplayClock()
+    output = RecordingBackend(clock=clock)
+    controller = HandController(clock=clock, use_camera=False, output=output, headless=True, tuning=params,
+                                quiet=True)
+    cursor = []
+    replay_session(controller, session, clock, on_frame=lambda rec, state: cursor.append(
+        (controller.cursor_x, controller.cursor_y)))
+    controller.release_hand()
+
+    injected = [(t, op) for t, op, _ in output.events if op in ("click", "right_click", "mouse_down")]
+    false, missed = _match(expected, injected)
+
+    present = session["num_hands"] > 0
+    hand = session["landmarks"][:, 0, INDEX_MCP, :2].astype(np.float64)
+    cursor = np.array(cursor, dtype=np.float64)
+    interval = float(np.median(np.diff(session["timestamp"]))) if len(session) > 1 else 1 / 30
+
+    # Still hand: smoothed travel per frame below STILL_SPEED
+    travel = np.linalg.norm(np.diff(hand, axis=0), axis=1)
+    smooth = np.convolve(travel, np.ones(5) / 5, mode="same")
+    still = (smooth < STILL_SPEED) & present[1:] & present[:-1]
+    moving = (smooth > 5 * STILL_SPEED) & present[1:] & present[:-1]
+    moves = np.linalg.norm(np.diff(cursor, axis=0), axis=1)
+    jitter = 100 * moves[still].mean() / max(moves[moving].mean(), 1.0) if still.any() and moving.any() else 0.0
+
+    return {"false_clicks": false, "missed_clicks": missed,
+            "lag_ms": _lag(hand[present], cursor[present], interval) * 1000, "jitter_pct": float(jitter)}
+
+
+def score(metrics):
+    return sum(SCORE_WEIGHTS[name] * value for name, value in metrics.items())
+
+
+def evaluate(params, sessions):
+    """Metrics summed (clicks) / averaged (lag, jitter) over all sessions, and the score"""
+    per_session = [evaluate_session(params, session, expected) for session, expected in sessions]
+    metrics = {
+        "false_clicks": sum(m["false_clicks"] for m in per_session),
+        "missed_clicks": sum(m["missed_clicks"] for m in per_session),
+        "lag_ms": float(np.mean([m["lag_ms"] for m in per_session])),
+        "jitter_pct": float(np.mean([m["jitter_pct"] for m in per_session])),
+    }
+    return score(metrics), metrics
+
+
+# --- Worker pool --------------------------------------------------------------
+
+_sessions = []
+
+
+def _init_worker(sessions):
+    _sessions[:] = sessions
+
+
+def _evaluate(params):
+    return (params,) + evaluate(params, _sessions)
+
+
+def run_search(sessions, candidates, workers=None):
+    """Evaluate every candidate (dicts of overrides) in a process pool; returns [(score, metrics, params)] best first"""
+    ctx = multiprocessing.get_context("spawn")
+    configs = [load_profile(c) for c in candidates]
+    with ProcessPoolExecutor(max_workers=workers, mp_context=ctx, initializer=_init_worker,
+                             initargs=(sessions,)) as pool:
+        results = list(pool.map(_evaluate, configs, chunksize=max(1, len(configs) // (4 * (workers or os.cpu_count() or 1)))))
+    return sorted(((s, m, p) for p, s, m in results), key=lambda r: r[0])
+
+
+# --- Search strategies ----------------------------------------------------------
+
+def grid_candidates(grid):
+    """{'name': [values]} -> every combination"""
+    names = list(grid)
+    return [dict(zip(names, values)) for values in itertools.product(*(grid[n] for n in names))]
+
+
+def random_candidates(n, names, rng, space=SEARCH_SPACE):
+    return [{name: float(rng.uniform(*space[name])) for name in names} for _ in range(n)]
+
+
+def adaptive_search(sessions, names, n, rounds, rng, workers=None, elite=0.2):
+    """Cross-entropy search: refit a per-parameter normal distribution to the best fifth each round"""
+    lo = np.array([SEARCH_SPACE[name][0] for name in names])
+    hi = np.array([SEARCH_SPACE[name][1] for name in names])
+    mean = np.array([DEFAULTS[name] for name in names], dtype=float)
+    std = (hi - lo) / 4
+    results = []
+    for _ in range(rounds):
+        samples = np.clip(rng.normal(mean, std, (n, len(names))), lo, hi)
+        results += run_search(sessions, [dict(zip(names, map(float, s))) for s in samples], workers)
+        results.sort(key=lambda r: r[0])
+        best = np.array([[r[2][name] for name in names] for r in results[:max(2, int(n * elite))]])
+        mean, std = best.mean(axis=0), np.maximum(best.std(axis=0), (hi - lo) / 100)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tune the controller's parameters on labelled sessions")
+    parser.add_argument("sessions", nargs="*", help="session files (each with a NAME.labels.json next to it)")
+    parser.add_argument("--synthetic", metavar="N", type=int, default=0,
+                        help="add N scripted synthetic sessions (used alone when no sessions are given)")
+    parser.add_argument("--grid", action="append", default=[], metavar="NAME=V1,V2",
+                        help="grid values for one parameter (repeat for more)")
+    parser.add_argument("--random", metavar="N", type=int, default=0, help="N random configurations")
+    parser.add_argument("--adaptive", metavar="N", type=int, default=0, help="N configurations per adaptive round")
+    parser.add_argument("--rounds", type=int, default=4, help="adaptive rounds (default 4)")
+    parser.add_argument("--params", default=",".join(SEARCH_SPACE),
+                        help="parameters for random/adaptive search (default: all in SEARCH_SPACE)")
+    parser.add_argument("--workers", type=int, help="worker processes (default: one per CPU)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default="tuning_profile.json", help="where to write the best profile")
+    args = parser.parse_args()
+
+    sessions = [load_labelled(path) for path in args.sessions]
+    sessions += [synthetic_labelled_session(seed) for seed in range(args.synthetic or (0 if sessions else 3))]
+    rng = np.random.default_rng(args.seed)
+    names = [n for n in args.params.split(",") if n]
+
+    start = time.perf_counter()
+    candidates = [{}]  # Current defaults as the baseline
+    if args.grid:
+        candidates += grid_candidates({spec.split("=")[0]: [float(v) for v in spec.split("=")[1].split(",")]
+                                       for spec in args.grid})
+    if args.random:
+        candidates += random_candidates(args.random, names, rng)
+    results = run_search(sessions, candidates, args.workers)
+    if args.adaptive:
+        results = sorted(results + adaptive_search(sessions, names, args.adaptive, args.rounds, rng, args.workers),
+                         key=lambda r: r[0])
+    elapsed = time.perf_counter() - start
+
+    baseline = next(r for r in results if r[2] == load_profile())
+    print(f"{len(results)} configurations x {len(sessions)} sessions in {elapsed:.1f} s")
+    print(f"{'score':>8} {'false':>6} {'missed':>6} {'lag ms':>7} {'jitter%':>7}")
+    for s, m, p in results[:5] + [baseline]:
+        tag = "  (defaults)" if p is baseline[2] else ""
+        print(f"{s:8.2f} {m['false_clicks']:6d} {m['missed_clicks']:6d} {m['lag_ms']:7.1f} {m['jitter_pct']:7.2f}{tag}")
+
+    best_score, best_metrics, best = results[0]
+    save_profile(args.out, best, score=best_score, metrics=best_metrics, baseline_score=baseline[0])
+    changed = {k: round(v, 4) for k, v in best.items() if v != DEFAULTS[k]}
+    print(f"Best profile written to {args.out}: {changed or 'defaults'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Tunable Gesture & Cursor Parameters
+The numbers that decide how the controller feels, in one place, with a JSON
+profile file to override them. tune_params.py searches for good values on
+recorded sessions and writes the best ones to a profile; the controller
+loads it at start (hand_controller.py --tuning PATH, or tuning_profile.json
+in the working directory when present).
+"""
+
+import json
+import os
+
+from landmark_features import FIST_GUARD, PINCH_THRESHOLD
+
+DEFAULT_PROFILE_PATH = "tuning_profile.json"
+
+DEFAULTS = {
+    # Cursor gain
+    "sensitivity": 1.3,
+    # Legacy speed-dependent smoothing: smoothing = max(smooth_min, smooth_max - smooth_range * t**smooth_exponent)
+    # with t = min(speed, smooth_speed_cap) / smooth_speed_cap (speed in px/frame)
+    "smooth_speed_cap": 60.0,
+    "smooth_max": 0.95,
+    "smooth_range": 0.85,
+    "smooth_exponent": 0.6,
+    "smooth_min": 0.1,
+    # Pointer acceleration: accel = 1 + speed * accel_gain above accel_threshold px/frame
+    "accel_threshold": 3.0,
+    "accel_gain": 0.08,
+    # Gestures
+    "pinch_threshold": PINCH_THRESHOLD,  # Thumb-index distance (normalized) that counts as a pinch
+    "drag_delay": 0.2,                   # Seconds of pinch before it becomes a drag instead of a click
+    "fist_guard": FIST_GUARD,            # Seconds after a fist during which only MOVING is reported
+    "right_click_cooldown": 1.0,         # Minimum seconds between right clicks
+}
+
+
+def load_profile(source=None):
+    """
+    DEFAULTS updated from `source`: a dict, a JSON profile path, or None (defaults only).
+    Unknown names are an error so that a typo doesn't silently keep the default.
+    """
+    params = dict(DEFAULTS)
+    if source is None:
+        return params
+    if isinstance(source, dict):
+        overrides = source
+    else:
+        with open(source) as f:
+            overrides = json.load(f).get("params", {})
+    unknown = set(overrides) - set(DEFAULTS)
+    if unknown:
+        raise ValueError(f"Unknown tuning parameter(s): {', '.join(sorted(unknown))}")
+    params.update({name: float(value) for name, value in overrides.items()})
+    return params
+
+
+def save_profile(path, params, **info):
+    """Write every parameter, plus any extra info (score, metrics, ...)"""
+    with open(path, "w") as f:
+        json.dump({"params": {name: params[name] for name in DEFAULTS}, **info}, f, indent=2)
+
+
+def default_profile_path():
+    """tuning_profile.json in the working directory, if there is one"""
+    return DEFAULT_PROFILE_PATH if os.path.exists(DEFAULT_PROFILE_PATH) else None